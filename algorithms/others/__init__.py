@@ -1,2 +1,5 @@
+from .partial_sort import *
 from .quick_select import *
-from .shuffle import *
\ No newline at end of file
+from .sampling import *
+from .shuffle import *
+from .streaming_select import *
\ No newline at end of file
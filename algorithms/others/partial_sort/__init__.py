@@ -0,0 +1 @@
+from .partial_sort import nth_element, partial_sort
\ No newline at end of file
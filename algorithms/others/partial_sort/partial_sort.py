@@ -0,0 +1,169 @@
+from algorithms.others.quick_select.quick_select import introselect
+from algorithms.sorting.heap_sort.heap_sort import Heapsort
+from algorithms.sorting.insertion_sort.insertion_sort import _binary_insertion_sort
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import CUTOFF, _heapsort, choose_pivot, introsort, \
+    partition
+
+
+# Use heap selection when k is at most ~1/128 of the length of the list
+HEAP_SELECT_RATIO = 128
+
+
+def heap_select(a: list, k: int) -> None:
+    """
+    Move the k smallest items of the list to a[0..k-1] as a max-heap, in one pass:
+    each remaining item smaller than the root replaces it and sinks.
+
+    Performance:
+        Time complexity: O(N log k), ~N comparisons when k is small
+        Space complexity: O(1)
+
+    Args:
+        a (list): The list of elements.
+        k (int): The number of items to select, 1 <= k <= len(a).
+
+    Note:
+        This function modifies the original list.
+    """
+    for j in range((k - 2) // 2, -1, -1):
+        Heapsort._sink(a, j, k)
+
+    for i in range(k, len(a)):
+        if a[i] < a[0]:
+            a[0], a[i] = a[i], a[0]
+            Heapsort._sink(a, 0, k)
+
+def _sort_heap(a: list, k: int) -> None:
+    """
+    Sort the max-heap a[0..k-1] in ascending order.
+
+    Args:
+        a (list): The list whose first k items are a max-heap.
+        k (int): The size of the heap.
+
+    Note:
+        This function modifies the original list.
+    """
+    for end in range(k - 1, 0, -1):
+        a[0], a[end] = a[end], a[0]
+        Heapsort._sink_to_bottom(a, 0, end)
+
+def sort_prefix(a: list, lo: int, hi: int, k: int, depth_limit: int) -> None:
+    """
+    Sort the subarray a[lo..hi] only as far as the positions below k are concerned.
+    After each partition, a left part that lies entirely below k is sorted with
+    Introsort, and a right part that starts at k or later is left unsorted.
+
+    Args:
+        a (list): The list of elements.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        k (int): The number of leading positions of the list to sort.
+        depth_limit (int): The number of partitioning levels left before switching to Heapsort.
+
+    Note:
+        This function modifies the original list.
+    """
+    while hi > lo + CUTOFF - 1:
+        # Too many unbalanced partitions, select the prefix in linear time and sort it
+        if depth_limit == 0:
+            last = min(hi, k - 1)
+            introselect(a, lo, hi, last)
+            _heapsort(a, lo, last)
+            return
+        depth_limit -= 1
+
+        m = choose_pivot(lo, hi, a)
+        a[lo], a[m] = a[m], a[lo]
+        j = partition(a, lo, hi)
+
+        if j < k - 1:
+            # The left part is entirely in the prefix, the right one overlaps it
+            introsort(a, lo, j - 1, depth_limit)
+            lo = j + 1
+        else:
+            # The right part is entirely beyond the prefix
+            hi = j - 1
+
+    _binary_insertion_sort(a, lo, hi)
+
+def partial_sort(a: list, k: int) -> None:
+    """
+    Rearrange the list so that a[0..k-1] holds its k smallest items in ascending order.
+    The order of the other items is unspecified.
+
+    Small k use heap selection followed by a heapsort of the k items. Larger k use
+    Quicksort partitioning that only recurses into the parts overlapping [0, k).
+
+    Performance:
+        Time complexity: O(N log k) for small k, O(N + k log k) on average otherwise.
+        Worst case: O(N log N + k log k), after 2 log N partitioning levels the prefix is
+        selected with Introselect and heapsorted.
+
+    Args:
+        a (list): The list of elements.
+        k (int): The number of smallest items to sort.
+
+    Raises:
+        ValueError: If the argument is not a list.
+        ValueError: If k is not between 0 and the length of the list.
+
+    Note:
+        Partial Sort is not a stable sorting algorithm.
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    n = len(a)
+
+    if not isinstance(k, int) or k < 0 or k > n:
+        raise ValueError("ValueError: k must be between 0 and the length of the list.")
+
+    if k == 0:
+        return
+
+    if k * HEAP_SELECT_RATIO <= n:
+        heap_select(a, k)
+        _sort_heap(a, k)
+        return
+
+    sort_prefix(a, 0, n - 1, k, 2 * n.bit_length())
+
+def nth_element(a: list, k: int) -> None:
+    """
+    Rearrange the list so that a[k] is the item that would be there if the list was sorted,
+    with no larger item before it and no smaller item after it.
+
+    Small k use heap selection of the k + 1 smallest items. Otherwise, Introselect
+    partitions the list, recursing only into the part that contains k.
+
+    Performance:
+        Time complexity: O(N log k) for small k, O(N) otherwise.
+
+    Args:
+        a (list): The list of elements.
+        k (int): The zero-based index of the item to place.
+
+    Raises:
+        ValueError: If the argument is not a list.
+        ValueError: If k is not a valid index.
+
+    Note:
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    n = len(a)
+
+    if not isinstance(k, int) or k < 0 or k >= n:
+        raise ValueError("ValueError: Invalid index.")
+
+    if (k + 1) * HEAP_SELECT_RATIO <= n:
+        # The root of the heap of the k + 1 smallest items belongs at k
+        heap_select(a, k + 1)
+        a[0], a[k] = a[k], a[0]
+        return
+
+    introselect(a, 0, n - 1, k)
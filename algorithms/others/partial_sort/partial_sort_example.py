@@ -0,0 +1,26 @@
+import random
+from algorithms import nth_element, partial_sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(partial_sort)
+    help(nth_element)
+
+    a = [10, 9, 6, 20, 7, 8, 13, 0, 15, 11, 19, 12, 1, 18, 4, 17, 2, 14, 16, 3, 5]
+    print("Example 1.")
+    print("Array:", a)
+    partial_sort(a, 5)
+    print("5 smallest sorted:", a)
+
+    random.shuffle(a)
+    print("\nExample 2.")
+    print("Array:", a)
+    nth_element(a, 10)
+    print("Median at index 10:", a)
+
+
+if __name__ == "__main__":
+    demo()
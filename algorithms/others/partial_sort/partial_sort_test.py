@@ -0,0 +1,88 @@
+import unittest
+import random
+from algorithms import nth_element, partial_sort
+from algorithms.others.partial_sort.partial_sort import sort_prefix
+
+
+class TestPartialSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        partial_sort(data, 0)
+        self.assertEqual(data, [])
+
+    def test_small_k(self):
+        data = [random.randint(-1000, 1000) for _ in range(5000)]
+        expected = sorted(data)
+        partial_sort(data, 10)
+        self.assertEqual(data[:10], expected[:10])
+        self.assertEqual(sorted(data), expected)
+
+    def test_large_k(self):
+        data = [random.random() for _ in range(5000)]
+        expected = sorted(data)
+        partial_sort(data, 2500)
+        self.assertEqual(data[:2500], expected[:2500])
+        self.assertEqual(sorted(data), expected)
+
+    def test_whole_list(self):
+        data = [5, 2, 8, 1, 9]
+        partial_sort(data, 5)
+        self.assertEqual(data, [1, 2, 5, 8, 9])
+
+    def test_patterns(self):
+        n = 3000
+        patterns = [list(range(n)), list(range(n, 0, -1)), [7] * n, [i % 10 for i in range(n)]]
+        for data in patterns:
+            for k in (1, 20, n // 2, n):
+                copy = data[:]
+                partial_sort(copy, k)
+                self.assertEqual(copy[:k], sorted(data)[:k])
+
+    def test_depth_limit_fallback(self):
+        data = [random.randint(0, 100) for _ in range(1000)]
+        expected = sorted(data)
+        sort_prefix(data, 0, len(data) - 1, 300, 0)
+        self.assertEqual(data[:300], expected[:300])
+        self.assertEqual(sorted(data), expected)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            partial_sort("not a list", 1)
+        with self.assertRaises(ValueError):
+            partial_sort([1, 2], 3)
+
+
+class TestNthElement(unittest.TestCase):
+    def assertNthElement(self, data, k, expected):
+        self.assertEqual(data[k], expected[k])
+        self.assertTrue(all(x <= data[k] for x in data[:k]))
+        self.assertTrue(all(x >= data[k] for x in data[k + 1:]))
+
+    def test_small_k(self):
+        data = [random.randint(-1000, 1000) for _ in range(5000)]
+        expected = sorted(data)
+        nth_element(data, 7)
+        self.assertNthElement(data, 7, expected)
+
+    def test_median(self):
+        data = [random.random() for _ in range(5001)]
+        expected = sorted(data)
+        nth_element(data, 2500)
+        self.assertNthElement(data, 2500, expected)
+
+    def test_ends(self):
+        data = [5, 2, 8, 1, 9]
+        nth_element(data, 0)
+        self.assertEqual(data[0], 1)
+        nth_element(data, 4)
+        self.assertEqual(data[4], 9)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            nth_element("not a list", 0)
+        with self.assertRaises(ValueError):
+            nth_element([1, 2], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1 @@
-from .quick_select import quick_select
\ No newline at end of file
+from .quick_select import quick_select, quick_select_many
\ No newline at end of file
@@ -1,4 +1,18 @@
+import math
 import random
+from typing import List
+from algorithms.sorting.insertion_sort.insertion_sort import _binary_insertion_sort
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import median_of_3
+
+
+# Use insertion sort for subarrays with up to ~10 items
+CUTOFF = 10
+
+# Pick the pivot from a Floyd-Rivest sample for subarrays with more than ~600 items
+FLOYD_RIVEST_CUTOFF = 600
+
+# Partitions that keep more than 3/4 of the items allowed before switching to median-of-medians
+MAX_BAD_PARTITIONS = 2
 
 
 def partition(a: list, lo: int, hi: int) -> int:
@@ -43,17 +57,147 @@ def partition(a: list, lo: int, hi: int) -> int:
 
     return j
 
-def quick_select(a: list, k: int) -> int:
+def median_of_medians(a: list, lo: int, hi: int) -> int:
+    """
+    Return the index of the median of the medians of groups of 5 elements of a[lo..hi].
+    At least ~3/10 of the subarray is smaller than or equal to it and at least
+    ~3/10 is greater than or equal to it, whatever the input.
+
+    Args:
+        a (list): The list of elements.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Returns:
+        int: The index of the median of medians.
+
+    Note:
+        This function reorders the subarray a[lo..hi].
+    """
+    m = lo
+
+    # Sort every group of 5 and move its median to the front of the subarray
+    for g in range(lo, hi + 1, 5):
+        end = min(g + 4, hi)
+        _binary_insertion_sort(a, g, end)
+        mid = g + (end - g) // 2
+        a[m], a[mid] = a[mid], a[m]
+        m += 1
+
+    # Select the median of the medians a[lo..m-1]
+    mid = lo + (m - 1 - lo) // 2
+    linear_select(a, lo, m - 1, mid)
+    return mid
+
+def linear_select(a: list, lo: int, hi: int, k: int) -> None:
+    """
+    Rearrange a[lo..hi] so that a[k] is the element that would be there if it was sorted,
+    partitioning around the median of medians (Blum, Floyd, Pratt, Rivest and Tarjan).
+
+    Performance:
+        Worst case: O(N)
+
+    Args:
+        a (list): The list of elements.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        k (int): The zero-based index of the element to select, lo <= k <= hi.
+
+    Note:
+        This function modifies the original list.
+    """
+    while hi > lo + CUTOFF - 1:
+        p = median_of_medians(a, lo, hi)
+        a[lo], a[p] = a[p], a[lo]
+        j = partition(a, lo, hi)
+
+        if j < k:
+            lo = j + 1
+        elif j > k:
+            hi = j - 1
+        else:
+            return
+
+    _binary_insertion_sort(a, lo, hi)
+
+def introselect(a: list, lo: int, hi: int, k: int) -> None:
+    """
+    Rearrange a[lo..hi] so that a[k] is the element that would be there if it was sorted.
+
+    Large subarrays are partitioned around a pivot selected recursively from a sample
+    of ~N^(2/3) elements whose expected rank is close to k (Floyd-Rivest), so the
+    subarray shrinks to a small window around k after a few partitions. Smaller ones
+    use the median of 3. When partitions stop making progress (more than 3/4 of the
+    items kept MAX_BAD_PARTITIONS times), the selection falls back to median-of-medians.
+
+    Performance:
+        Average case: ~N + min(k, N - k) comparisons for large N.
+        Worst case: O(N)
+
+    Args:
+        a (list): The list of elements.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        k (int): The zero-based index of the element to select, lo <= k <= hi.
+
+    Note:
+        This function modifies the original list.
+    """
+    bad_partitions = 0
+
+    while hi > lo + CUTOFF - 1:
+        n = hi - lo + 1
+
+        if n > FLOYD_RIVEST_CUTOFF:
+            # Select a[k] from a sample around k, it is the pivot
+            i = k - lo + 1
+            z = math.log(n)
+            s = 0.5 * math.exp(2 * z / 3)
+            sd = 0.5 * math.sqrt(z * s * (n - s) / n) * (1 if 2 * i >= n else -1)
+            sample_lo = max(lo, int(k - i * s / n + sd))
+            sample_hi = min(hi, int(k + (n - i) * s / n + sd))
+            introselect(a, sample_lo, sample_hi, k)
+            p = k
+        else:
+            p = median_of_3(lo, lo + (hi - lo) // 2, hi, a)
+
+        a[lo], a[p] = a[p], a[lo]
+        j = partition(a, lo, hi)
+
+        if j < k:
+            lo = j + 1
+        elif j > k:
+            hi = j - 1
+        else:
+            return
+
+        # Too many unbalanced partitions, guarantee linear time with median-of-medians
+        if 4 * (hi - lo + 1) > 3 * n:
+            bad_partitions += 1
+            if bad_partitions > MAX_BAD_PARTITIONS:
+                linear_select(a, lo, hi, k)
+                return
+
+    _binary_insertion_sort(a, lo, hi)
+
+def quick_select(a: list, k: int, introselect_mode: bool = False) -> int:
     """
     Select the k-th smallest element in the list using the Quickselect algorithm.
 
     Performance:
         Average case: O(N)
         Worst case: O(N^2) (rare, due to random shuffling)
+        Worst case in introselect mode: O(N)
+
+    Introselect mode:
+        The list is not shuffled. Pivots are selected from samples around k
+        (Floyd-Rivest), and median-of-medians takes over when the partitions
+        stop shrinking the subarray, see introselect.
 
     Args:
         a (list): The list of elements.
         k (int): The k-th smallest element to find.
+        introselect_mode (bool): If True, use Introselect instead of shuffling.
 
     Raises:
         ValueError: If the argument is not a list.
@@ -76,6 +220,10 @@ def quick_select(a: list, k: int) -> int:
     # To transform in zero-based index
     k -= 1
 
+    if introselect_mode:
+        introselect(a, 0, len(a) - 1, k)
+        return a[k]
+
     # Shuffle the array to ensure average-case performance
     random.shuffle(a)
     lo = 0
@@ -90,4 +238,68 @@ def quick_select(a: list, k: int) -> int:
         else:
             return a[k]
     return a[k]
-    
\ No newline at end of file
+
+def multi_select(a: list, lo: int, hi: int, ranks: List[int], r_lo: int, r_hi: int) -> None:
+    """
+    Rearrange a[lo..hi] so that a[k] is the element that would be there if it was sorted,
+    for every k in ranks[r_lo..r_hi]. The middle rank is selected first, which partitions
+    the subarray around it, then each side is searched only for the ranks that fall in it.
+
+    Args:
+        a (list): The list of elements.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        ranks (List[int]): The sorted zero-based indexes to select, each one in [lo, hi].
+        r_lo (int): The lower index of the ranks.
+        r_hi (int): The higher index of the ranks.
+
+    Note:
+        This function modifies the original list.
+    """
+    if r_lo > r_hi:
+        return
+
+    m = r_lo + (r_hi - r_lo) // 2
+    k = ranks[m]
+    introselect(a, lo, hi, k)
+
+    multi_select(a, lo, k - 1, ranks, r_lo, m - 1)
+    multi_select(a, k + 1, hi, ranks, m + 1, r_hi)
+
+def quick_select_many(a: list, ks: List[int]) -> list:
+    """
+    Select the k-th smallest elements of the list for several values of k at once.
+
+    Performance:
+        Worst case: O(N log M) for M distinct values of k, O(N) for a fixed number of them.
+
+    Args:
+        a (list): The list of elements.
+        ks (List[int]): The k-th smallest elements to find, in any order.
+
+    Raises:
+        ValueError: If the argument is not a list.
+        ValueError: If the argument is an empty list.
+        ValueError: If one of the indexes is not valid.
+
+    Returns:
+        list: The k-th smallest element for each k, in the order of ks.
+
+    Note:
+        This function reorders the original list, it is not shuffled.
+    """
+
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    if len(a) == 0:
+        raise ValueError("ValueError: The list is empty.")
+
+    if any(k < 1 or k > len(a) for k in ks):
+        raise ValueError("ValueError: Invalid index.")
+
+    # Distinct zero-based indexes in ascending order
+    ranks = sorted(set(k - 1 for k in ks))
+    multi_select(a, 0, len(a) - 1, ranks, 0, len(ranks) - 1)
+
+    return [a[k - 1] for k in ks]
@@ -0,0 +1,25 @@
+import random
+import timeit
+from algorithms import quick_select, quick_select_many
+
+
+def benchmark() -> None:
+    """
+    Compare one quick_select call per percentile with a single quick_select_many call
+    """
+    repeat = 3
+    percentiles = (0.5, 0.9, 0.99, 0.999)
+
+    print(f"{'n':>9} {'quick_select (s)':>17} {'introselect (s)':>16} {'many (s)':>9}")
+    for n in (10_000, 100_000, 1_000_000):
+        data = [random.random() for _ in range(n)]
+        ks = [max(1, int(p * n)) for p in percentiles]
+
+        single = min(timeit.repeat(lambda: [quick_select(data[:], k) for k in ks], number=1, repeat=repeat))
+        intro = min(timeit.repeat(lambda: [quick_select(data[:], k, introselect_mode=True) for k in ks],
+                                  number=1, repeat=repeat))
+        many = min(timeit.repeat(lambda: quick_select_many(data[:], ks), number=1, repeat=repeat))
+        print(f"{n:>9} {single:>17.4f} {intro:>16.4f} {many:>9.4f}")
+
+if __name__ == "__main__":
+    benchmark()
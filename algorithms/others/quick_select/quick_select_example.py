@@ -1,5 +1,5 @@
 import random
-from algorithms import quick_select
+from algorithms import quick_select, quick_select_many
 
 
 def demo():
@@ -28,5 +28,19 @@ def demo():
     value = quick_select(a, k)
     print(f"{k}th smallest item =", value)
 
+    random.shuffle(a)
+    k = 10
+    print("\nExample 4. Introselect")
+    print("Array:", a)
+    value = quick_select(a, k, introselect_mode=True)
+    print(f"{k}th smallest item =", value)
+
+    random.shuffle(a)
+    ks = [11, 19, 21]
+    print("\nExample 5. Several order statistics at once")
+    print("Array:", a)
+    values = quick_select_many(a, ks)
+    print(f"{ks}th smallest items =", values)
+
 if __name__ == "__main__":
     demo()
\ No newline at end of file
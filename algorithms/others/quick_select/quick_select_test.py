@@ -1,5 +1,7 @@
 import unittest
-from algorithms import quick_select
+import random
+from algorithms import quick_select, quick_select_many
+from algorithms.others.quick_select.quick_select import linear_select, median_of_medians
 
 
 class TestQuickSelectFunction(unittest.TestCase):
@@ -40,5 +42,78 @@ class TestQuickSelectFunction(unittest.TestCase):
         self.assertEqual(result, -5)
 
 
+
+class TestIntroselect(unittest.TestCase):
+    def test_random(self):
+        numbers = [random.randint(-1000, 1000) for _ in range(5000)]
+        expected = sorted(numbers)
+        for k in (1, 100, 2500, 4999, 5000):
+            result = quick_select(numbers[:], k, introselect_mode=True)
+            self.assertEqual(result, expected[k - 1])
+
+    def test_patterns(self):
+        n = 3000
+        patterns = [
+            list(range(n)),
+            list(range(n, 0, -1)),
+            list(range(n // 2)) + list(range(n // 2, 0, -1)),
+            [i % 10 for i in range(n)],
+            [7] * n,
+        ]
+        for numbers in patterns:
+            expected = sorted(numbers)
+            for k in (1, n // 2, n):
+                result = quick_select(numbers[:], k, introselect_mode=True)
+                self.assertEqual(result, expected[k - 1])
+
+    def test_not_shuffled(self):
+        numbers = list(range(1000))
+        quick_select(numbers, 500, introselect_mode=True)
+        self.assertEqual(numbers, list(range(1000)))
+
+    def test_linear_select(self):
+        numbers = [random.randint(0, 100) for _ in range(1000)]
+        expected = sorted(numbers)
+        linear_select(numbers, 0, len(numbers) - 1, 321)
+        self.assertEqual(numbers[321], expected[321])
+        self.assertTrue(all(x <= numbers[321] for x in numbers[:321]))
+        self.assertTrue(all(x >= numbers[321] for x in numbers[322:]))
+
+    def test_median_of_medians(self):
+        numbers = random.sample(range(1000), 1000)
+        pivot = numbers[median_of_medians(numbers, 0, len(numbers) - 1)]
+        self.assertTrue(290 <= pivot <= 710)
+
+
+
+class TestQuickSelectMany(unittest.TestCase):
+    def test_percentiles(self):
+        numbers = [random.random() for _ in range(10000)]
+        expected = sorted(numbers)
+        ks = [5000, 9000, 9900, 9990]
+        self.assertEqual(quick_select_many(numbers, ks), [expected[k - 1] for k in ks])
+
+    def test_order_and_duplicates(self):
+        numbers = [random.randint(0, 50) for _ in range(500)]
+        expected = sorted(numbers)
+        ks = [500, 1, 250, 1, 250, 499]
+        self.assertEqual(quick_select_many(numbers, ks), [expected[k - 1] for k in ks])
+
+    def test_all_ranks(self):
+        numbers = [5, 2, 8, 3, 1, 6, 4]
+        self.assertEqual(quick_select_many(numbers, range(1, 8)), [1, 2, 3, 4, 5, 6, 8])
+
+    def test_empty_ks(self):
+        self.assertEqual(quick_select_many([3, 1, 2], []), [])
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            quick_select_many("not a list", [1])
+        with self.assertRaises(ValueError):
+            quick_select_many([], [1])
+        with self.assertRaises(ValueError):
+            quick_select_many([1, 2, 3], [1, 4])
+
+
 if __name__ == '__main__':
     unittest.main()
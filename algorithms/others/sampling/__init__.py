@@ -0,0 +1 @@
+from .sampling import reservoir_sample, weighted_sample
\ No newline at end of file
@@ -0,0 +1,153 @@
+import heapq
+import math
+import random
+from itertools import count, islice
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+
+def _make_rng(rng: Optional[Union[int, random.Random]]) -> Any:
+    """
+    Return the generator used by the samplers.
+
+    Args:
+        rng (Optional[Union[int, random.Random]]): None, an integer seed or a random.Random.
+
+    Returns:
+        Any: The random module, or a random.Random.
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+def _uniform(rng: Any) -> float:
+    """
+    Return a random float in the open interval (0, 1), so that its logarithm is finite and negative.
+
+    Args:
+        rng (Any): The random generator.
+
+    Returns:
+        float: The random number.
+    """
+    u = rng.random()
+    while u == 0.0:
+        u = rng.random()
+    return u
+
+def reservoir_sample(iterable: Iterable[Any], k: int, rng: Optional[Union[int, random.Random]] = None) -> List[Any]:
+    """
+    Select k items uniformly at random from an iterable of unknown length in one pass (Algorithm L, Li).
+
+    Instead of drawing a random number for every item, the number of items to skip
+    before the next replacement is drawn from its geometric distribution, so the
+    items in between are only read.
+
+    Performance:
+        Time complexity: O(N) to read the items, O(k(1 + log(N/k))) random numbers
+        Space complexity: O(k)
+
+    Args:
+        iterable (Iterable[Any]): The items to sample from, read once.
+        k (int): The number of items to select.
+        rng (Optional[Union[int, random.Random]]): An integer seed or a random.Random.
+
+    Raises:
+        ValueError: If k is not a non-negative integer.
+
+    Returns:
+        List[Any]: The selected items, all of them if there are k or fewer.
+    """
+    if not isinstance(k, int) or k < 0:
+        raise ValueError("ValueError: k must be a non-negative integer.")
+
+    if k == 0:
+        return []
+
+    rng = _make_rng(rng)
+    it = iter(iterable)
+    reservoir = list(islice(it, k))
+
+    if len(reservoir) < k:
+        return reservoir
+
+    # w is distributed as the largest of k uniform random numbers
+    w = math.exp(math.log(_uniform(rng)) / k)
+    end = object()
+
+    while True:
+        # Skip the items that would not have entered the reservoir
+        skip = math.floor(math.log(_uniform(rng)) / math.log1p(-w))
+        item = next(islice(it, skip, None), end)
+        if item is end:
+            return reservoir
+
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(_uniform(rng)) / k)
+
+def weighted_sample(iterable: Iterable[Any], k: int, weight: Callable[[Any], float],
+                    rng: Optional[Union[int, random.Random]] = None) -> List[Any]:
+    """
+    Select k items without replacement from an iterable of unknown length in one pass,
+    each one with probability proportional to its weight (A-ExpJ, Efraimidis and Spirakis).
+
+    Every item gets the key u^(1/w) and the k items with the largest keys are kept in a
+    min-heap. Instead of drawing a key for every item, the total weight to skip before
+    an item enters the heap is drawn from its exponential distribution.
+
+    Performance:
+        Time complexity: O(N) to read the items, O(k log(N/k)) heap updates and random numbers
+        Space complexity: O(k)
+
+    Args:
+        iterable (Iterable[Any]): The items to sample from, read once.
+        k (int): The number of items to select.
+        weight (Callable[[Any], float]): Function that returns the weight of each item.
+        rng (Optional[Union[int, random.Random]]): An integer seed or a random.Random.
+
+    Raises:
+        ValueError: If k is not a non-negative integer.
+        ValueError: If a weight is negative.
+
+    Returns:
+        List[Any]: The selected items, in the order in which successive weighted draws
+        would pick them. Items with zero weight are never selected.
+    """
+    if not isinstance(k, int) or k < 0:
+        raise ValueError("ValueError: k must be a non-negative integer.")
+
+    if k == 0:
+        return []
+
+    rng = _make_rng(rng)
+    tiebreak = count()  # Items are never compared
+
+    # Keys are kept as log(u) / w, which orders like u^(1/w) without underflow
+    heap = []
+    jump = 0.0
+
+    for item in iterable:
+        w = weight(item)
+        if w < 0:
+            raise ValueError("ValueError: Weights must be non-negative.")
+        if w == 0:
+            continue
+
+        if len(heap) < k:
+            heapq.heappush(heap, (math.log(_uniform(rng)) / w, next(tiebreak), item))
+            if len(heap) == k:
+                jump = math.log(_uniform(rng)) / heap[0][0]
+            continue
+
+        jump -= w
+        if jump > 0:
+            continue
+
+        # The item enters the heap, its key is drawn above the threshold
+        threshold = math.exp(heap[0][0] * w)
+        u = threshold + (1.0 - threshold) * _uniform(rng)
+        heapq.heapreplace(heap, (math.log(u) / w, next(tiebreak), item))
+        jump = math.log(_uniform(rng)) / heap[0][0]
+
+    return [item for _, _, item in sorted(heap, reverse=True)]
@@ -0,0 +1,23 @@
+from algorithms import reservoir_sample, weighted_sample
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(reservoir_sample)
+    help(weighted_sample)
+
+    print("Example 1.")
+    lines = (f"request {i}" for i in range(1000000))
+    print("5 random lines out of 1000000:", reservoir_sample(lines, 5))
+
+    print("\nExample 2.")
+    servers = [("a", 1), ("b", 1), ("c", 5), ("d", 10), ("e", 3)]
+    print("Servers and weights:", servers)
+    sample = weighted_sample(servers, 2, weight=lambda server: server[1])
+    print("2 servers, weighted:", [name for name, _ in sample])
+
+
+if __name__ == "__main__":
+    demo()
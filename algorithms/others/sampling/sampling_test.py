@@ -0,0 +1,92 @@
+import unittest
+import random
+from collections import Counter
+from algorithms import reservoir_sample, weighted_sample
+
+
+class CountingRandom(random.Random):
+    """
+    Counts the random numbers drawn.
+    """
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.calls = 0
+
+    def random(self):
+        self.calls += 1
+        return super().random()
+
+
+class TestReservoirSample(unittest.TestCase):
+    def test_sample(self):
+        sample = reservoir_sample(range(1000), 10)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(len(set(sample)), 10)
+        self.assertTrue(all(0 <= x < 1000 for x in sample))
+
+    def test_short_stream(self):
+        self.assertEqual(reservoir_sample(iter([1, 2, 3]), 5), [1, 2, 3])
+        self.assertEqual(reservoir_sample(range(10), 0), [])
+
+    def test_uniform(self):
+        counts = Counter()
+        for seed in range(5000):
+            counts.update(reservoir_sample(range(10), 2, rng=seed))
+        self.assertTrue(all(850 < counts[x] < 1150 for x in range(10)))
+
+    def test_seed(self):
+        self.assertEqual(reservoir_sample(range(1000), 5, rng=3), reservoir_sample(range(1000), 5, rng=3))
+
+    def test_few_random_numbers(self):
+        rng = CountingRandom(1)
+        reservoir_sample(iter(range(100000)), 10, rng=rng)
+        self.assertLess(rng.calls, 2000)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            reservoir_sample(range(10), -1)
+
+
+class TestWeightedSample(unittest.TestCase):
+    def test_sample(self):
+        sample = weighted_sample(range(1, 1001), 10, weight=lambda x: x)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(len(set(sample)), 10)
+
+    def test_short_stream(self):
+        self.assertEqual(sorted(weighted_sample([1, 2, 3], 5, weight=lambda x: 1)), [1, 2, 3])
+        self.assertEqual(weighted_sample(range(10), 0, weight=lambda x: 1), [])
+
+    def test_zero_weights(self):
+        sample = weighted_sample(range(100), 5, weight=lambda x: x % 2)
+        self.assertTrue(all(x % 2 == 1 for x in sample))
+
+    def test_proportional(self):
+        # The first draw picks each item with probability weight / total weight
+        counts = Counter()
+        for seed in range(6000):
+            counts.update(weighted_sample([1, 2, 3], 1, weight=lambda x: x, rng=seed))
+        self.assertTrue(all(abs(counts[x] / 6000 - x / 6) < 0.03 for x in (1, 2, 3)))
+
+    def test_inclusion(self):
+        # Item 10 is picked first with probability 10/16, or second with probability 6/16 * 10/15
+        counts = Counter()
+        data = [1, 1, 1, 1, 1, 1, 10]
+        for seed in range(4000):
+            counts.update(weighted_sample(data, 2, weight=lambda x: x, rng=seed))
+        self.assertAlmostEqual(counts[10] / 4000, 0.875, delta=0.03)
+
+    def test_few_random_numbers(self):
+        rng = CountingRandom(1)
+        weighted_sample(range(100000), 10, weight=lambda x: 1.0, rng=rng)
+        self.assertLess(rng.calls, 2000)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            weighted_sample(range(10), -1, weight=lambda x: 1)
+        with self.assertRaises(ValueError):
+            weighted_sample(range(10), 2, weight=lambda x: -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
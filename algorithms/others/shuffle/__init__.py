@@ -1 +1 @@
-from .shuffle import shuffle
\ No newline at end of file
+from .shuffle import shuffle, spawn_rngs
\ No newline at end of file
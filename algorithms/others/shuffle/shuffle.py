@@ -1,31 +1,125 @@
 import random
+from typing import Any, List, Optional
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it is only needed for the vectorized path
+    np = None
 
-def shuffle(a: list) -> None:
+
+def spawn_rngs(seed: int, n: int) -> List[Any]:
+    """
+    Create n independent random generators from a single seed, one per worker,
+    so that every worker shuffles its slice reproducibly.
+
+    Args:
+        seed (int): The root seed.
+        n (int): The number of generators.
+
+    Returns:
+        List[Any]: NumPy Generators spawned from a SeedSequence, or
+        random.Random instances seeded from the root seed without NumPy.
+    """
+    if np is not None:
+        return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(n)]
+
+    root = random.Random(seed)
+    return [random.Random(root.getrandbits(64)) for _ in range(n)]
+
+def _make_rng(rng: Optional[Any]) -> Any:
+    """
+    Return the generator used by shuffle.
+
+    Args:
+        rng (Optional[Any]): None, an integer seed, a random.Random or a NumPy Generator.
+
+    Returns:
+        Any: A NumPy Generator when NumPy is installed, else a random.Random or the random module.
+    """
+    if np is not None:
+        if isinstance(rng, np.random.Generator):
+            return rng
+        if rng is None:
+            # Seed from the random module, so that random.seed() keeps shuffle reproducible
+            return np.random.default_rng(random.getrandbits(64))
+        if isinstance(rng, random.Random):
+            return np.random.default_rng(rng.getrandbits(64))
+        return np.random.default_rng(rng)
+
+    if rng is None:
+        return random
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+def shuffle(a: list, k: Optional[int] = None, rng: Optional[Any] = None) -> None:
     """
     Shuffle the array using the Knuth (or Fisher-Yates) shuffle algorithm.
 
     Performance:
-        Time complexity: O(N)
-        Space complexity: O(1)
+        Time complexity: O(N), O(k) for a partial shuffle
+        Space complexity: O(1), O(N) for a list shuffled with NumPy
+
+    NumPy:
+        When NumPy is installed, the whole permutation is drawn at once with
+        Generator.permutation (Generator.shuffle in place for arrays), and the
+        list is rebuilt in a single pass. numpy.ndarray is shuffled along its
+        first axis.
+
+    Partial shuffle:
+        When k is given, only the first k steps of the Fisher-Yates shuffle run:
+        a[:k] is a uniform random sample of k items, in random order, and the
+        rest of the list holds the other items.
 
     Args:
-        a (list): The list of elements to be shuffled.
+        a (list): The list (or NumPy array) of elements to be shuffled.
+        k (Optional[int]): The number of leading positions to randomize, all of them by default.
+        rng (Optional[Any]): An integer seed, a random.Random or a NumPy Generator (see spawn_rngs).
 
     Raises:
-        ValueError: If the argument is not a list.
+        ValueError: If the argument is not a list or a NumPy array.
+        ValueError: If k is not between 0 and the length of the list.
 
     Note:
         This function modifies the original list.
     """
-    if not isinstance(a, list):
+    is_array = np is not None and isinstance(a, np.ndarray)
+
+    if not isinstance(a, list) and not is_array:
         raise ValueError("ValueError: Input must be a list.")
 
     n = len(a)
 
+    if k is not None and (not isinstance(k, int) or k < 0 or k > n):
+        raise ValueError("ValueError: k must be between 0 and the length of the list.")
+
+    gen = _make_rng(rng)
+
+    if k is not None and k < n:
+        # The i-th step swaps position i with a random position in [i, n)
+        if np is not None:
+            targets = gen.integers(np.arange(k), n).tolist()
+        else:
+            targets = [gen.randint(i, n - 1) for i in range(k)]
+
+        for i, j in enumerate(targets):
+            if is_array:
+                a[[i, j]] = a[[j, i]]
+            else:
+                a[i], a[j] = a[j], a[i]
+        return
+
+    if np is not None:
+        if is_array:
+            gen.shuffle(a)
+        else:
+            items = a[:]
+            a[:] = [items[i] for i in gen.permutation(n).tolist()]
+        return
+
     for i in range(n):
         # Generate a random index from 0 to i
-        random_index = random.randint(0, i)
+        random_index = gen.randint(0, i)
 
         # Swap the current element with the element at the random index
         a[i], a[random_index] = a[random_index], a[i]
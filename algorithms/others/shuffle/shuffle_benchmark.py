@@ -0,0 +1,29 @@
+import random
+import timeit
+from algorithms import shuffle
+
+
+def knuth_shuffle(a: list) -> None:
+    """
+    The Knuth shuffle with one random.randint call per item, for reference.
+    """
+    for i in range(len(a)):
+        j = random.randint(0, i)
+        a[i], a[j] = a[j], a[i]
+
+def benchmark() -> None:
+    """
+    Compare the Knuth shuffle loop with shuffle, in full and for the first 100 positions
+    """
+    repeat = 3
+
+    print(f"{'n':>9} {'loop (s)':>9} {'shuffle (s)':>12} {'k=100 (s)':>10}")
+    for n in (10_000, 100_000, 1_000_000):
+        data = list(range(n))
+        loop = min(timeit.repeat(lambda: knuth_shuffle(data[:]), number=1, repeat=repeat))
+        full = min(timeit.repeat(lambda: shuffle(data[:]), number=1, repeat=repeat))
+        partial = min(timeit.repeat(lambda: shuffle(data[:], 100), number=1, repeat=repeat))
+        print(f"{n:>9} {loop:>9.4f} {full:>12.4f} {partial:>10.4f}")
+
+if __name__ == "__main__":
+    benchmark()
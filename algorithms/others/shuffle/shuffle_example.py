@@ -21,6 +21,20 @@ def demo() -> None:
     shuffle(a)
     print("Knuth shuffle:   ", a) 
 
+    print("\nExample 3.")
+    a = [i for i in range(30)]
+    print("Original array:  ", a)
+
+    shuffle(a, 5)
+    print("First 5 shuffled:", a)
+
+    print("\nExample 4.")
+    a = [i for i in range(10)]
+    print("Original array:  ", a)
+
+    shuffle(a, rng=42)
+    print("Seed 42:         ", a)
+
 
 if __name__ == "__main__":
     demo()
\ No newline at end of file
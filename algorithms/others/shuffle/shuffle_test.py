@@ -1,6 +1,11 @@
 import unittest
 import random
-from algorithms import shuffle
+from algorithms import shuffle, spawn_rngs
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestShuffleFunction(unittest.TestCase):
@@ -40,5 +45,70 @@ class TestShuffleFunction(unittest.TestCase):
         self.assertNotEqual(large_list, original_large_list)
 
 
+    def test_shuffle_seed(self):
+        # Test that the same seed gives the same permutation
+        first, second = list(range(100)), list(range(100))
+        shuffle(first, rng=42)
+        shuffle(second, rng=42)
+        self.assertEqual(first, second)
+        self.assertEqual(sorted(first), list(range(100)))
+
+    def test_shuffle_random_seed(self):
+        # Test that random.seed() makes the default generator reproducible
+        first, second = list(range(100)), list(range(100))
+        random.seed(7)
+        shuffle(first)
+        random.seed(7)
+        shuffle(second)
+        self.assertEqual(first, second)
+
+    def test_spawn_rngs(self):
+        # Test that spawned generators are reproducible and differ from each other
+        slices = [list(range(50)) for _ in range(3)]
+        for data, rng in zip(slices, spawn_rngs(123, 3)):
+            shuffle(data, rng=rng)
+
+        again = [list(range(50)) for _ in range(3)]
+        for data, rng in zip(again, spawn_rngs(123, 3)):
+            shuffle(data, rng=rng)
+
+        self.assertEqual(slices, again)
+        self.assertEqual(len(set(tuple(x) for x in slices)), 3)
+
+    def test_partial_shuffle(self):
+        # Test that the first k positions hold a random sample and no item is lost
+        numbers = list(range(1000))
+        shuffle(numbers, 10)
+        self.assertNotEqual(numbers[:10], list(range(10)))
+        self.assertEqual(sorted(numbers), list(range(1000)))
+
+    def test_partial_shuffle_uniform(self):
+        # Test that every item is equally likely to be picked first
+        counts = [0] * 4
+        for seed in range(4000):
+            numbers = [0, 1, 2, 3]
+            shuffle(numbers, 1, rng=seed)
+            counts[numbers[0]] += 1
+        self.assertTrue(all(800 < count < 1200 for count in counts))
+
+    def test_partial_shuffle_invalid_k(self):
+        with self.assertRaises(ValueError):
+            shuffle([1, 2, 3], 4)
+        with self.assertRaises(ValueError):
+            shuffle([1, 2, 3], -1)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_shuffle_ndarray(self):
+        # Test that arrays are shuffled in place along the first axis
+        data = np.arange(1000)
+        shuffle(data, rng=1)
+        self.assertFalse(np.array_equal(data, np.arange(1000)))
+        self.assertTrue(np.array_equal(np.sort(data), np.arange(1000)))
+
+        rows = np.arange(20).reshape(10, 2)
+        shuffle(rows, 3, rng=1)
+        self.assertEqual(sorted(map(tuple, rows.tolist())), [(2 * i, 2 * i + 1) for i in range(10)])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1 @@
+from .streaming_select import KLLSketch, TopK
\ No newline at end of file
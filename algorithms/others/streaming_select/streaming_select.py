@@ -0,0 +1,400 @@
+import math
+import random
+from typing import Any, Iterable, List, Optional
+from data_structures.collections.binary_heap.binary_heap import BinaryHeap
+
+
+# Normalized rank error of a KLL sketch with k = 200, about 1.33%
+DEFAULT_ERROR = 0.0133
+
+# Ratio between the capacities of two consecutive compactors
+CAPACITY_RATIO = 2 / 3
+
+
+class TopK:
+    """
+    Exact k largest (or smallest) items of a stream, kept in a binary heap of at most k items.
+
+    The root of the heap is the worst item kept, every new item is compared with it
+    and replaces it only if it is better, so the memory is O(k) whatever the length
+    of the stream.
+
+    Performance:
+        push(): O(log k)
+        Space complexity: O(k)
+
+    Methods:
+        push(item): Adds an item of the stream.
+        extend(items): Adds all the items of an iterable.
+        merge(other): Adds the items kept by another TopK with the same k and order.
+        result(): Returns the items kept, best first.
+
+    Special Methods:
+        __len__(): Returns the number of items kept.
+        __repr__(): Returns a string representation of the items kept.
+
+    Note:
+        A TopK can be pickled, so the partial results of several processes can be merged.
+    """
+
+    def __init__(self: 'TopK', k: int, largest: bool = True) -> None:
+        """
+        Initializes an empty TopK.
+
+        Args:
+            k (int): The number of items to keep.
+            largest (bool): If True, keep the k largest items, else the k smallest ones.
+
+        Raises:
+            ValueError: If k is not a positive integer.
+        """
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("ValueError: k must be a positive integer.")
+
+        self.k: int = k
+        self.largest: bool = largest
+        # The root is the worst item kept: the smallest one when keeping the largest
+        self._heap: BinaryHeap = BinaryHeap(order="min" if largest else "max")
+
+    def push(self: 'TopK', item: Any) -> None:
+        """
+        Adds an item of the stream.
+
+        Args:
+            item (Any): The item to be added.
+
+        Raises:
+            ValueError: If the item is None.
+        """
+        if item is None:
+            raise ValueError("ValueError: Invalid value.")
+
+        if len(self._heap) < self.k:
+            self._heap.insert(item)
+            return
+
+        # Replace the worst item kept if the new one is better
+        worst = self._heap.peek_max()
+        if worst < item if self.largest else item < worst:
+            self._heap.del_max()
+            self._heap.insert(item)
+
+    def extend(self: 'TopK', items: Iterable[Any]) -> None:
+        """
+        Adds all the items of an iterable.
+
+        Args:
+            items (Iterable[Any]): The items to be added.
+        """
+        for item in items:
+            self.push(item)
+
+    def merge(self: 'TopK', other: 'TopK') -> None:
+        """
+        Adds the items kept by another TopK, the result is the top k of both streams.
+
+        Args:
+            other (TopK): The TopK to merge into this one.
+
+        Raises:
+            ValueError: If the other TopK has a different k or order.
+        """
+        if other.k != self.k or other.largest != self.largest:
+            raise ValueError("ValueError: Only TopK with the same k and order can be merged.")
+
+        self.extend(other.result())
+
+    def result(self: 'TopK') -> List[Any]:
+        """
+        Returns the items kept, best first.
+
+        Returns:
+            List[Any]: The k largest items in descending order, or the k smallest in ascending order.
+        """
+        return sorted(self._heap, reverse=self.largest)
+
+    def __len__(self: 'TopK') -> int:
+        """
+        Returns the number of items kept.
+
+        Returns:
+            int: The number of items kept, at most k.
+        """
+        return len(self._heap)
+
+    def __repr__(self: 'TopK') -> str:
+        """
+        Returns a string representation of the items kept.
+
+        Returns:
+            str: The items kept, best first.
+        """
+        return f"{self.result()}"
+
+
+class KLLSketch:
+    """
+    Approximate quantiles of a stream with the KLL sketch (Karnin, Lang and Liberty).
+
+    The items are kept in a stack of compactors. Compactor h holds items of weight 2^h.
+    When the sketch is full, a compactor is sorted and every other item is promoted
+    to the next one, with a random offset, so the rank of any value is preserved in
+    expectation. Lower compactors get geometrically smaller capacities (ratio 2/3).
+
+    Performance:
+        update(): O(1) amortized
+        Space complexity: O(k), independent of the length of the stream
+        Rank error: about the configured error (normalized), with high probability
+
+    Methods:
+        update(item): Adds an item of the stream.
+        extend(items): Adds all the items of an iterable.
+        merge(other): Adds the items summarized by another sketch.
+        rank(value): Returns the approximate fraction of items less than or equal to value.
+        quantile(q): Returns an approximate q-quantile.
+        quantiles(qs): Returns several approximate quantiles.
+
+    Special Methods:
+        __len__(): Returns the number of items of the stream.
+
+    Note:
+        A sketch can be pickled, so the sketches of several processes can be merged.
+        The smallest and largest items are tracked exactly.
+    """
+
+    def __init__(self: 'KLLSketch', error: float = DEFAULT_ERROR, seed: Optional[int] = None) -> None:
+        """
+        Initializes an empty sketch.
+
+        Args:
+            error (float): The normalized rank error, between 0 and 1.
+            seed (Optional[int]): Seed of the random offsets of the compactions.
+
+        Raises:
+            ValueError: If the error is not between 0 and 1.
+        """
+        if not 0 < error < 1:
+            raise ValueError("ValueError: Error must be between 0 and 1.")
+
+        # Empirical error of KLL for a single quantile: 2.296 / k^0.9723
+        self.k: int = max(8, math.ceil((2.296 / error) ** (1 / 0.9723)))
+        self.error: float = error
+        self._random = random.Random(seed)
+        self._compactors: List[list] = []
+        self._size: int = 0       # Number of items held by the compactors
+        self._max_size: int = 0   # Capacity of all the compactors
+        self._n: int = 0          # Number of items of the stream
+        self._min: Any = None
+        self._max: Any = None
+        self._grow()
+
+    def _capacity(self: 'KLLSketch', h: int) -> int:
+        """
+        Returns the capacity of compactor h, the top one has capacity k.
+
+        Args:
+            h (int): The height of the compactor.
+
+        Returns:
+            int: The number of items compactor h can hold before it is compacted.
+        """
+        depth = len(self._compactors) - h - 1
+        return math.ceil(CAPACITY_RATIO ** depth * self.k) + 1
+
+    def _grow(self: 'KLLSketch') -> None:
+        """
+        Adds a compactor on top of the others.
+        """
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compact(self: 'KLLSketch', h: int) -> None:
+        """
+        Sorts compactor h and promotes every other item, starting at a random offset, to compactor h + 1.
+        An odd item out stays in compactor h.
+
+        Args:
+            h (int): The height of the compactor.
+        """
+        if h + 1 == len(self._compactors):
+            self._grow()
+
+        items = self._compactors[h]
+        items.sort()
+        leftover = [items.pop()] if len(items) % 2 else []
+
+        self._compactors[h + 1].extend(items[self._random.randint(0, 1)::2])
+        self._compactors[h] = leftover
+        self._size = sum(len(c) for c in self._compactors)
+
+    def _compress(self: 'KLLSketch') -> None:
+        """
+        Compacts the lowest full compactors until the sketch fits its capacity.
+        """
+        while self._size >= self._max_size:
+            for h in range(len(self._compactors)):
+                if len(self._compactors[h]) >= self._capacity(h):
+                    self._compact(h)
+                    break
+
+    def update(self: 'KLLSketch', item: Any) -> None:
+        """
+        Adds an item of the stream.
+
+        Args:
+            item (Any): The item to be added.
+
+        Raises:
+            ValueError: If the item is None.
+        """
+        if item is None:
+            raise ValueError("ValueError: Invalid value.")
+
+        if self._n == 0 or item < self._min:
+            self._min = item
+        if self._n == 0 or item > self._max:
+            self._max = item
+        self._n += 1
+
+        self._compactors[0].append(item)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def extend(self: 'KLLSketch', items: Iterable[Any]) -> None:
+        """
+        Adds all the items of an iterable.
+
+        Args:
+            items (Iterable[Any]): The items to be added.
+        """
+        for item in items:
+            self.update(item)
+
+    def merge(self: 'KLLSketch', other: 'KLLSketch') -> None:
+        """
+        Adds the items summarized by another sketch. Compactors of the same
+        height hold items of the same weight, so they are concatenated.
+
+        Args:
+            other (KLLSketch): The sketch to merge into this one.
+
+        Raises:
+            ValueError: If the other sketch has a different k.
+        """
+        if other.k != self.k:
+            raise ValueError("ValueError: Only sketches with the same error can be merged.")
+
+        if other._n == 0:
+            return
+
+        if self._n == 0 or other._min < self._min:
+            self._min = other._min
+        if self._n == 0 or other._max > self._max:
+            self._max = other._max
+        self._n += other._n
+
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for h, items in enumerate(other._compactors):
+            self._compactors[h].extend(items)
+
+        self._size = sum(len(c) for c in self._compactors)
+        self._compress()
+
+    def _weighted_items(self: 'KLLSketch') -> List[tuple]:
+        """
+        Returns the items held by the compactors with their weights, sorted by item.
+
+        Returns:
+            List[tuple]: The (item, weight) pairs.
+        """
+        pairs = [(item, 2 ** h) for h, items in enumerate(self._compactors) for item in items]
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
+
+    def rank(self: 'KLLSketch', value: Any) -> float:
+        """
+        Returns the approximate fraction of items less than or equal to value.
+
+        Args:
+            value (Any): The value to be ranked.
+
+        Returns:
+            float: The normalized rank, between 0 and 1.
+
+        Raises:
+            ValueError: If the sketch is empty.
+        """
+        if self._n == 0:
+            raise ValueError("ValueError: The sketch is empty.")
+
+        weight = sum(2 ** h for h, items in enumerate(self._compactors) for item in items if not value < item)
+        return weight / self._n
+
+    def quantiles(self: 'KLLSketch', qs: Iterable[float]) -> List[Any]:
+        """
+        Returns several approximate quantiles with a single pass over the sketch.
+
+        Args:
+            qs (Iterable[float]): The quantiles to find, each one between 0 and 1.
+
+        Returns:
+            List[Any]: The approximate q-quantile for each q, in the order of qs.
+
+        Raises:
+            ValueError: If a quantile is not between 0 and 1.
+            ValueError: If the sketch is empty.
+        """
+        qs = list(qs)
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("ValueError: Quantile must be between 0 and 1.")
+
+        if self._n == 0:
+            raise ValueError("ValueError: The sketch is empty.")
+
+        pairs = self._weighted_items()
+        total = sum(weight for _, weight in pairs)
+        result = [None] * len(qs)
+
+        # Walk the cumulative weights once, answering the quantiles in ascending order
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        cumulative, j = 0, 0
+        for i in order:
+            if qs[i] == 0:
+                result[i] = self._min
+                continue
+            if qs[i] == 1:
+                result[i] = self._max
+                continue
+            while j < len(pairs) - 1 and cumulative + pairs[j][1] < qs[i] * total:
+                cumulative += pairs[j][1]
+                j += 1
+            result[i] = pairs[j][0]
+
+        return result
+
+    def quantile(self: 'KLLSketch', q: float) -> Any:
+        """
+        Returns an approximate q-quantile, the item whose rank is about q * N.
+
+        Args:
+            q (float): The quantile to find, between 0 and 1.
+
+        Returns:
+            Any: The approximate q-quantile.
+
+        Raises:
+            ValueError: If the quantile is not between 0 and 1.
+            ValueError: If the sketch is empty.
+        """
+        return self.quantiles([q])[0]
+
+    def __len__(self: 'KLLSketch') -> int:
+        """
+        Returns the number of items of the stream.
+
+        Returns:
+            int: The number of items added to the sketch.
+        """
+        return self._n
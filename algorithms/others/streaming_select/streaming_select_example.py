@@ -0,0 +1,35 @@
+import random
+from algorithms import KLLSketch, TopK
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(TopK)
+    help(KLLSketch)
+
+    print("Example 1. Top 5 of a stream")
+    top = TopK(5)
+    for _ in range(100000):
+        top.push(random.randint(0, 1000000))
+    print("Largest items:", top)
+
+    print("\nExample 2. Latency percentiles")
+    sketch = KLLSketch(error=0.01)
+    for _ in range(100000):
+        sketch.update(random.expovariate(1 / 20))
+    for q, value in zip([0.5, 0.9, 0.99, 0.999], sketch.quantiles([0.5, 0.9, 0.99, 0.999])):
+        print(f"p{q * 100:g} = {value:.2f} ms")
+
+    print("\nExample 3. Merge the sketches of two streams")
+    other = KLLSketch(error=0.01)
+    for _ in range(100000):
+        other.update(random.expovariate(1 / 40))
+    sketch.merge(other)
+    print("Items:", len(sketch))
+    print(f"p50 = {sketch.quantile(0.5):.2f} ms")
+
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,101 @@
+import unittest
+import bisect
+import pickle
+import random
+from algorithms import KLLSketch, TopK
+
+
+class TestTopK(unittest.TestCase):
+    def test_largest(self):
+        numbers = [random.randint(-1000, 1000) for _ in range(1000)]
+        top = TopK(10)
+        top.extend(numbers)
+        self.assertEqual(top.result(), sorted(numbers, reverse=True)[:10])
+        self.assertEqual(len(top), 10)
+
+    def test_smallest(self):
+        numbers = [random.randint(-1000, 1000) for _ in range(1000)]
+        top = TopK(10, largest=False)
+        top.extend(numbers)
+        self.assertEqual(top.result(), sorted(numbers)[:10])
+
+    def test_short_stream(self):
+        top = TopK(5)
+        top.extend([3, 1, 2])
+        self.assertEqual(top.result(), [3, 2, 1])
+        self.assertEqual(str(top), "[3, 2, 1]")
+
+    def test_merge(self):
+        numbers = [random.random() for _ in range(1000)]
+        parts = [TopK(7) for _ in range(3)]
+        for i, part in enumerate(parts):
+            part.extend(numbers[i::3])
+
+        top = pickle.loads(pickle.dumps(parts[0]))
+        for part in parts[1:]:
+            top.merge(pickle.loads(pickle.dumps(part)))
+        self.assertEqual(top.result(), sorted(numbers, reverse=True)[:7])
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            TopK(0)
+        with self.assertRaises(ValueError):
+            TopK(3).push(None)
+        with self.assertRaises(ValueError):
+            TopK(3).merge(TopK(4))
+
+
+class TestKLLSketch(unittest.TestCase):
+    def assertRankError(self, sketch, data, qs, bound):
+        data = sorted(data)
+        for q, value in zip(qs, sketch.quantiles(qs)):
+            rank = bisect.bisect_right(data, value) / len(data)
+            self.assertLessEqual(abs(rank - q), bound)
+
+    def test_quantiles(self):
+        data = [random.random() for _ in range(50000)]
+        sketch = KLLSketch(0.01, seed=1)
+        sketch.extend(data)
+        self.assertEqual(len(sketch), 50000)
+        self.assertRankError(sketch, data, [0.01, 0.25, 0.5, 0.9, 0.99], 0.03)
+
+    def test_bounded_memory(self):
+        sketch = KLLSketch(0.05, seed=1)
+        sketch.extend(range(100000))
+        self.assertLess(sum(len(items) for items in sketch._compactors), 10 * sketch.k)
+
+    def test_exact_while_small(self):
+        sketch = KLLSketch()
+        sketch.extend([5, 1, 4, 2, 3])
+        self.assertEqual(sketch.quantiles([0, 0.5, 1]), [1, 3, 5])
+        self.assertEqual(sketch.rank(2), 0.4)
+
+    def test_merge(self):
+        data = [random.gauss(0, 1) for _ in range(40000)]
+        parts = [KLLSketch(0.01, seed=i) for i in range(4)]
+        for i, part in enumerate(parts):
+            part.extend(data[i::4])
+
+        sketch = pickle.loads(pickle.dumps(parts[0]))
+        for part in parts[1:]:
+            sketch.merge(pickle.loads(pickle.dumps(part)))
+        self.assertEqual(len(sketch), 40000)
+        self.assertEqual(sketch.quantile(0), min(data))
+        self.assertEqual(sketch.quantile(1), max(data))
+        self.assertRankError(sketch, data, [0.1, 0.5, 0.9, 0.99], 0.03)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            KLLSketch(0)
+        with self.assertRaises(ValueError):
+            KLLSketch().quantile(0.5)
+        sketch = KLLSketch()
+        sketch.update(1)
+        with self.assertRaises(ValueError):
+            sketch.quantile(1.5)
+        with self.assertRaises(ValueError):
+            sketch.merge(KLLSketch(0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
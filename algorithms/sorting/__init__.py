@@ -1,10 +1,19 @@
+from .adaptive_sort import *
+from .block_quick_sort import *
 from .dijkstra_3way_partition import *
+from .external_sort import *
 from .heap_sort import *
 from .insertion_sort import *
+from .instrumentation import *
+from .lsd_radix_sort import *
 from .merge_sort import *
 from .merge_sort_bottom_up import *
 from .merge_sort_improved import *
+from .msd_radix_sort import *
+from .parallel_merge_sort import *
+from .quick_3way_string import *
 from .quick_sort import *
 from .quick_sort_improved import *
 from .selection_sort import *
-from .shell_sort import *
\ No newline at end of file
+from .shell_sort import *
+from .sort_benchmark import *
\ No newline at end of file
@@ -0,0 +1 @@
+from .adaptive_sort import SortDecision, choose_algorithm, sort
\ No newline at end of file
@@ -0,0 +1,207 @@
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from algorithms.sorting.dijkstra_3way_partition.dijkstra_3way_partition import dijkstra_3way_partition
+from algorithms.sorting.insertion_sort.insertion_sort import insertion_sort
+from algorithms.sorting.lsd_radix_sort.lsd_radix_sort import lsd_radix_sort
+from algorithms.sorting.merge_sort_bottom_up.merge_sort_bottom_up import merge_sort_bottom_up
+from algorithms.sorting.merge_sort_improved.merge_sort_improved import merge_sort_improved
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import quick_sort_improved
+
+
+# Lists with up to ~32 items are sorted with binary insertion sort
+SMALL_N = 32
+
+# Number of items (or triples of neighbours) inspected to estimate the shape of the input
+SAMPLE_SIZE = 64
+
+# Fraction of monotone triples above which the input is considered presorted
+PRESORTED_RATIO = 0.9
+
+# Fraction of distinct sampled items below which the input has many duplicates
+DUPLICATE_RATIO = 0.5
+
+# Integers spanning more bits than this need too many radix passes
+RADIX_MAX_BITS = 32
+
+ALGORITHMS: Dict[str, Callable[[list], None]] = {
+    "insertion_sort": lambda a: insertion_sort(a, binary=True),
+    "merge_sort_bottom_up": lambda a: merge_sort_bottom_up(a, adaptive=True),
+    "lsd_radix_sort": lsd_radix_sort,
+    "merge_sort_improved": merge_sort_improved,
+    "dijkstra_3way_partition": dijkstra_3way_partition,
+    "quick_sort_improved": lambda a: quick_sort_improved(a, introsort_mode=True),
+}
+
+
+class SortDecision(NamedTuple):
+    """
+    The algorithm chosen by sort, and the features of the input it was chosen from.
+
+    Attributes:
+        algorithm (str): The name of the algorithm, a key of ALGORITHMS.
+        reason (str): Why it was chosen.
+        n (int): The number of items.
+        monotone_ratio (float): Fraction of sampled triples of neighbours in ascending or descending order.
+        distinct_ratio (float): Fraction of distinct items in the sample.
+        element_type (str): The type name of the items, 'mixed' if they have different types.
+    """
+    algorithm: str
+    reason: str
+    n: int
+    monotone_ratio: float
+    distinct_ratio: float
+    element_type: str
+
+
+def _monotone_ratio(a: list) -> float:
+    """
+    Return the fraction of evenly spaced triples a[i], a[i+1], a[i+2] that are monotone.
+    It is ~1/3 for random input and close to 1 when the input is made of long runs,
+    ascending or descending.
+
+    Args:
+        a (list): The list to inspect, with at least 3 items.
+
+    Returns:
+        float: The fraction of monotone triples.
+    """
+    n = len(a)
+    m = min(SAMPLE_SIZE, n - 2)
+    monotone = 0
+
+    for s in range(m):
+        i = s * (n - 2) // m
+        x, y, z = a[i], a[i + 1], a[i + 2]
+        if (not y < x and not z < y) or (not x < y and not y < z):
+            monotone += 1
+
+    return monotone / m
+
+def _distinct_ratio(a: list) -> float:
+    """
+    Return the fraction of distinct items among evenly spaced samples of the list.
+
+    Args:
+        a (list): The list to inspect, not empty.
+
+    Returns:
+        float: The fraction of distinct items.
+    """
+    n = len(a)
+    m = min(SAMPLE_SIZE, n)
+    sample = [a[s * n // m] for s in range(m)]
+
+    try:
+        distinct = len(set(sample))
+    except TypeError:
+        # Unhashable items, count the distinct neighbours of the sorted sample
+        sample.sort()
+        distinct = 1 + sum(1 for x, y in zip(sample, sample[1:]) if x < y)
+
+    return distinct / m
+
+def _element_type(a: list) -> str:
+    """
+    Return the name of the type of the items.
+
+    Args:
+        a (list): The list to inspect.
+
+    Returns:
+        str: The type name, 'mixed' if the items have different types, 'none' for an empty list.
+    """
+    types = {type(x) for x in a}
+    if len(types) == 1:
+        return types.pop().__name__
+    return "none" if not types else "mixed"
+
+def choose_algorithm(a: list, stable: bool = False, keyed: bool = False) -> SortDecision:
+    """
+    Choose a sorting algorithm from the size, sortedness, duplicates and type of the items.
+
+    Rules, in order:
+        Up to SMALL_N items: binary insertion sort.
+        Long ascending or descending runs: natural-run (adaptive) bottom-up merge sort.
+        Integers spanning up to RADIX_MAX_BITS bits: LSD radix sort.
+        Stable sort required: merge sort.
+        Many duplicates: Dijkstra's 3-way partitioning quicksort.
+        Otherwise: Introsort (quick sort with a Heapsort fallback).
+
+    Args:
+        a (list): The items, or their keys.
+        stable (bool): If True, only stable algorithms are chosen.
+        keyed (bool): If True, the items are sorted as (key, index) pairs, so they are
+            all distinct and are not integers, radix and 3-way partitioning do not apply.
+
+    Returns:
+        SortDecision: The algorithm and the features of the input.
+    """
+    n = len(a)
+    monotone = _monotone_ratio(a) if n >= 3 else 1.0
+    distinct = _distinct_ratio(a) if n >= 1 else 1.0
+    element_type = _element_type(a)
+
+    def decision(algorithm: str, reason: str) -> SortDecision:
+        return SortDecision(algorithm, reason, n, monotone, distinct, element_type)
+
+    if n <= SMALL_N:
+        return decision("insertion_sort", f"small input, at most {SMALL_N} items")
+
+    if monotone >= PRESORTED_RATIO:
+        return decision("merge_sort_bottom_up", "presorted input, long natural runs")
+
+    if not keyed and element_type == "int" and (max(a) - min(a)).bit_length() <= RADIX_MAX_BITS:
+        return decision("lsd_radix_sort", f"integers spanning at most {RADIX_MAX_BITS} bits")
+
+    if stable:
+        return decision("merge_sort_improved", "stable sort required")
+
+    if not keyed and distinct <= DUPLICATE_RATIO:
+        return decision("dijkstra_3way_partition", "many duplicates")
+
+    return decision("quick_sort_improved", "general input")
+
+def sort(a: list, key: Optional[Callable[[Any], Any]] = None, stable: bool = False) -> SortDecision:
+    """
+    Sort a list in ascending order with the algorithm that suits the shape of the input.
+
+    A few evenly spaced samples estimate how presorted the input is and how many
+    duplicates it has, then the list is handed to the algorithm picked by
+    choose_algorithm. The decision is returned, so that it can be logged.
+
+    Key function:
+        When key is given, each key is computed once and the list is sorted as
+        (key, index) pairs, which is stable whatever the algorithm.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        key (Optional[Callable[[Any], Any]]): Function that extracts the comparison key from each item.
+        stable (bool): If True, equal items keep their original order.
+
+    Raises:
+        ValueError: If the argument is not a list.
+
+    Returns:
+        SortDecision: The algorithm used and the features of the input.
+
+    Note:
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    if key is None:
+        decision = choose_algorithm(a, stable)
+        ALGORITHMS[decision.algorithm](a)
+        return decision
+
+    keys = [key(item) for item in a]
+    decision = choose_algorithm(keys, stable, keyed=True)
+
+    # Decorate: the index breaks ties, so items are never compared and the order stays stable
+    decorated = [(k, i) for i, k in enumerate(keys)]
+    ALGORITHMS[decision.algorithm](decorated)
+
+    # Undecorate
+    items = a[:]
+    a[:] = [items[i] for _, i in decorated]
+    return decision
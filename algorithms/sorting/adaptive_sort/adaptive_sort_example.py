@@ -0,0 +1,31 @@
+import random
+from algorithms import sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(sort)
+
+    print("Example 1.")
+    a = [random.random() for _ in range(10000)]
+    print("Random floats:     ", sort(a))
+
+    print("\nExample 2.")
+    a = list(range(10000)) + [random.randint(0, 10000) for _ in range(10)]
+    print("Almost sorted:     ", sort(a))
+
+    print("\nExample 3.")
+    a = [random.choice(["red", "green", "blue"]) for _ in range(10000)]
+    print("Few distinct keys: ", sort(a))
+
+    print("\nExample 4.")
+    a = [("carol", 35), ("alice", 30), ("bob", 30), ("dave", 25)]
+    decision = sort(a, key=lambda person: person[1], stable=True)
+    print("By age:", a)
+    print("Decision:", decision.algorithm, "-", decision.reason)
+
+
+if __name__ == "__main__":
+    demo()
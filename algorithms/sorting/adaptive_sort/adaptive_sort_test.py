@@ -0,0 +1,82 @@
+import unittest
+import random
+from copy import deepcopy
+from algorithms import sort
+from algorithms.sorting.adaptive_sort.adaptive_sort import SMALL_N, choose_algorithm
+
+
+class TestSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        sort(data)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = [5]
+        sort(data)
+        self.assertEqual(data, [5])
+
+    def test_unsorted(self):
+        data = [5, 2, 8, 1, 9]
+        sort(data)
+        self.assertEqual(data, [1, 2, 5, 8, 9])
+
+    def test_shapes(self):
+        n = 2000
+        inputs = [
+            [random.randint(-1000, 1000) for _ in range(n)],
+            [random.random() for _ in range(n)],
+            list(range(n)),
+            list(range(n, 0, -1)),
+            [random.choice([0.5, 1.5, 2.5]) for _ in range(n)],
+            [min(i, n - i) for i in range(n)],
+            [str(random.random()) for _ in range(n)],
+            [random.getrandbits(64) for _ in range(n)],
+        ]
+        for data in inputs:
+            for stable in (False, True):
+                copy = deepcopy(data)
+                sort(copy, stable=stable)
+                self.assertEqual(copy, sorted(data))
+
+    def test_decisions(self):
+        n = 5000
+        self.assertEqual(choose_algorithm(list(range(SMALL_N))).algorithm, "insertion_sort")
+        self.assertEqual(choose_algorithm(list(range(n, 0, -1))).algorithm, "merge_sort_bottom_up")
+        self.assertEqual(choose_algorithm([random.randint(0, n) for _ in range(n)]).algorithm, "lsd_radix_sort")
+        self.assertEqual(choose_algorithm([random.random() for _ in range(n)]).algorithm, "quick_sort_improved")
+        self.assertEqual(choose_algorithm([random.random() for _ in range(n)], stable=True).algorithm,
+                         "merge_sort_improved")
+        self.assertEqual(choose_algorithm([random.choice([0.5, 1.5]) for _ in range(n)]).algorithm,
+                         "dijkstra_3way_partition")
+        self.assertEqual(choose_algorithm([random.getrandbits(64) for _ in range(n)]).algorithm,
+                         "quick_sort_improved")
+
+    def test_decision_returned(self):
+        data = [random.random() for _ in range(100)]
+        decision = sort(data)
+        self.assertEqual(decision.n, 100)
+        self.assertEqual(decision.element_type, "float")
+        self.assertTrue(0 <= decision.monotone_ratio <= 1)
+        self.assertTrue(0 < decision.distinct_ratio <= 1)
+        self.assertTrue(decision.reason)
+
+    def test_key_stability(self):
+        data = [(random.randint(0, 10), i) for i in range(1000)]
+        copy = deepcopy(data)
+        sort(copy, key=lambda item: item[0])
+        self.assertEqual(copy, sorted(data, key=lambda item: item[0]))
+
+    def test_unhashable(self):
+        data = [[random.randint(0, 3)] for _ in range(200)]
+        copy = deepcopy(data)
+        sort(copy)
+        self.assertEqual(copy, sorted(data))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            sort("not a list")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+from .block_quick_sort import block_quick_sort
\ No newline at end of file
@@ -0,0 +1,252 @@
+import random
+from algorithms.sorting.insertion_sort.insertion_sort import _binary_insertion_sort
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import CUTOFF, choose_pivot
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it is only needed for the ndarray fast path
+    np = None
+
+
+# Number of items compared at once on each side, for lists and for NumPy arrays
+BLOCK_SIZE = 64
+NP_BLOCK_SIZE = 4096
+
+
+def _finish_partition(a: list, lo: int, l: int, r: int) -> int:
+    """
+    Partition the middle region a[l..r] left over by the block loop with a plain
+    Hoare scan, and place the pivot a[lo].
+
+    Args:
+        a (list): The list of elements to be partitioned.
+        lo (int): The index of the pivot, a[lo+1..l-1] <= pivot.
+        l (int): The lower index of the region, r < hi implies a[r+1..hi] >= pivot.
+        r (int): The higher index of the region.
+
+    Returns:
+        j (int): The index of the pivot element after partitioning.
+    """
+    pivot = a[lo]
+    i, j = l, r
+
+    while True:
+        while i <= j and a[i] < pivot:
+            i += 1
+        while i <= j and pivot < a[j]:
+            j -= 1
+        if i >= j:
+            break
+        a[i], a[j] = a[j], a[i]
+        i += 1
+        j -= 1
+
+    # Swap pivot element with element at j
+    a[lo], a[j] = a[j], a[lo]
+    return j
+
+def partition_block(a: list, lo: int, hi: int) -> int:
+    """
+    Partition the subarray a[lo..hi] around the pivot a[lo] like partition,
+    processing BLOCK_SIZE items at a time on each side (BlockQuicksort).
+
+    The comparisons of a block only record the offsets of the misplaced items
+    in a buffer, with no branch on their result. Then the misplaced items of
+    the left and right blocks are swapped in bulk.
+
+    Args:
+        a (list): The list of elements to be partitioned.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Returns:
+        j (int): The index of the pivot element after partitioning.
+    """
+    pivot = a[lo]
+    l, r = lo + 1, hi
+    offsets_l, offsets_r = [], []
+
+    while r - l + 1 >= 2 * BLOCK_SIZE:
+        # Offsets of the items of the left block not less than the pivot
+        if not offsets_l:
+            offsets_l = [k for k, x in enumerate(a[l:l + BLOCK_SIZE]) if not x < pivot]
+            start_l = 0
+
+        # Offsets (counted from r) of the items of the right block not greater than the pivot
+        if not offsets_r:
+            offsets_r = [k for k, x in enumerate(a[r:r - BLOCK_SIZE:-1]) if not pivot < x]
+            start_r = 0
+
+        # Swap the misplaced items in bulk
+        num = min(len(offsets_l) - start_l, len(offsets_r) - start_r)
+        for k in range(num):
+            x, y = l + offsets_l[start_l + k], r - offsets_r[start_r + k]
+            a[x], a[y] = a[y], a[x]
+        start_l += num
+        start_r += num
+
+        # A block is done when all its misplaced items have been swapped
+        if start_l == len(offsets_l):
+            offsets_l = []
+            l += BLOCK_SIZE
+        if start_r == len(offsets_r):
+            offsets_r = []
+            r -= BLOCK_SIZE
+
+    # Unswapped items of a pending block are still inside a[l..r]
+    return _finish_partition(a, lo, l, r)
+
+def partition_block_ndarray(a: 'np.ndarray', lo: int, hi: int) -> int:
+    """
+    Partition the subarray a[lo..hi] of a NumPy array around the pivot a[lo]
+    like partition_block, with vectorized comparisons and swaps.
+
+    Args:
+        a (np.ndarray): The array of elements to be partitioned.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Returns:
+        j (int): The index of the pivot element after partitioning.
+    """
+    pivot = a[lo]
+    l, r = lo + 1, hi
+    offsets_l = offsets_r = None
+
+    while r - l + 1 >= 2 * NP_BLOCK_SIZE:
+        # Offsets of the misplaced items, one vectorized comparison per block
+        if offsets_l is None:
+            offsets_l = l + np.flatnonzero(a[l:l + NP_BLOCK_SIZE] >= pivot)
+        if offsets_r is None:
+            offsets_r = r - np.flatnonzero(a[r - NP_BLOCK_SIZE + 1:r + 1][::-1] <= pivot)
+
+        # Swap the misplaced items in bulk
+        num = min(len(offsets_l), len(offsets_r))
+        x, y = offsets_l[:num], offsets_r[:num]
+        a[x], a[y] = a[y], a[x]
+        offsets_l, offsets_r = offsets_l[num:], offsets_r[num:]
+
+        if len(offsets_l) == 0:
+            offsets_l = None
+            l += NP_BLOCK_SIZE
+        if len(offsets_r) == 0:
+            offsets_r = None
+            r -= NP_BLOCK_SIZE
+
+    # Partition the middle region a[l..r]: items less than the pivot, equal, greater.
+    # Equal items are split between both sides to keep the partitions balanced.
+    # Unordered items (NaN) compare False with everything, they go with the greater ones.
+    region = a[l:r + 1]
+    is_less, is_equal = region < pivot, region == pivot
+    less, equal, greater = region[is_less], region[is_equal], region[~(is_less | is_equal)]
+    half = len(equal) // 2
+    a[l:r + 1] = np.concatenate((less, equal[:half], equal[half:], greater))
+
+    j = l + len(less) + half - 1
+    a[lo], a[j] = a[j], a[lo]
+    return j
+
+def sort(a: list, lo: int, hi: int) -> None:
+    """
+    Sort the subarray a[lo..hi] using Quicksort with block partitioning.
+    Recurses on the smaller partition and loops on the larger one.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Note:
+        This function modifies the original list.
+    """
+    while hi > lo + CUTOFF - 1:
+        m = choose_pivot(lo, hi, a)
+        a[lo], a[m] = a[m], a[lo]
+        j = partition_block(a, lo, hi)
+
+        if j - lo < hi - j:
+            sort(a, lo, j - 1)
+            lo = j + 1
+        else:
+            sort(a, j + 1, hi)
+            hi = j - 1
+
+    _binary_insertion_sort(a, lo, hi)
+
+def sort_ndarray(a: 'np.ndarray', lo: int, hi: int) -> None:
+    """
+    Sort the subarray a[lo..hi] of a NumPy array using Quicksort with vectorized
+    block partitioning. Subarrays that fit in two blocks are copied to a list of
+    Python scalars and sorted with sort, which is faster than indexing the array.
+
+    Args:
+        a (np.ndarray): The array of elements to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Note:
+        This function modifies the original array.
+    """
+    while hi - lo + 1 > 2 * NP_BLOCK_SIZE:
+        m = choose_pivot(lo, hi, a)
+        a[lo], a[m] = a[m], a[lo]
+        j = partition_block_ndarray(a, lo, hi)
+
+        if j - lo < hi - j:
+            sort_ndarray(a, lo, j - 1)
+            lo = j + 1
+        else:
+            sort_ndarray(a, j + 1, hi)
+            hi = j - 1
+
+    sub = a[lo:hi + 1].tolist()
+    sort(sub, 0, len(sub) - 1)
+    a[lo:hi + 1] = sub
+
+def block_quick_sort(a: list) -> None:
+    """
+    Sort a list of elements in ascending order using Quicksort with block partitioning (BlockQuicksort).
+
+    Improvements:
+        Partition blocks of items: compare a whole block first, storing the offsets of
+        the misplaced items, then swap them in bulk. This cuts the per-item branching
+        and interpreter overhead of the element-by-element partition.
+        A 1-D NumPy array is partitioned with vectorized comparisons and swaps,
+        NaNs are placed last as with numpy.sort.
+        Use insertion sort for small subarrays and the median of 3 or the ninther as pivot.
+
+    Performance:
+        Average case: O(N log N)
+        Worst case: O(N^2) (rare, due to random shuffling)
+
+    Args:
+        a (list): The list (or 1-D NumPy array) of elements to be sorted.
+
+    Raises:
+        ValueError: If the argument is not a list or a 1-D NumPy array.
+
+    Note:
+        Quick Sort is a not stable sorting algorithm.
+        This function modifies the original list.
+    """
+    if np is not None and isinstance(a, np.ndarray):
+        if a.ndim != 1:
+            raise ValueError("ValueError: Input array must be one-dimensional.")
+        np.random.default_rng().shuffle(a)
+
+        # NaNs cannot be ordered, move them last as numpy.sort does and sort the rest
+        n = len(a)
+        if a.dtype.kind in "fc":
+            nan = np.isnan(a)
+            if nan.any():
+                n = n - int(nan.sum())
+                a[...] = np.concatenate((a[~nan], a[nan]))
+
+        sort_ndarray(a, 0, n - 1)
+        return
+
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    random.shuffle(a)
+    sort(a, 0, len(a) - 1)
@@ -0,0 +1,122 @@
+import unittest
+import random
+from copy import deepcopy
+from algorithms import block_quick_sort
+from algorithms.sorting.block_quick_sort.block_quick_sort import partition_block, partition_block_ndarray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        block_quick_sort(data)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = [5]
+        block_quick_sort(data)
+        self.assertEqual(data, [5])
+
+    def test_already_sorted(self):
+        data = [1, 2, 3, 4, 5]
+        block_quick_sort(data)
+        self.assertEqual(data, [1, 2, 3, 4, 5])
+
+    def test_unsorted(self):
+        data = [5, 2, 8, 1, 9]
+        block_quick_sort(data)
+        self.assertEqual(data, [1, 2, 5, 8, 9])
+
+    def test_duplicates(self):
+        data = [4, 2, 2, 8, 1]
+        block_quick_sort(data)
+        self.assertEqual(data, [1, 2, 2, 4, 8])
+
+    def test_negative_numbers(self):
+        data = [5, -2, 8, -1, 9]
+        block_quick_sort(data)
+        self.assertEqual(data, [-2, -1, 5, 8, 9])
+
+    def test_floats(self):
+        data = [5.5, 2.2, 8.8, 1.1, 9.9]
+        block_quick_sort(data)
+        self.assertEqual(data, [1.1, 2.2, 5.5, 8.8, 9.9])
+
+    def test_random(self):
+        n = 200
+        data = [random.randint(-100, 100) for _ in range(n)]
+        copy = deepcopy(data)
+        block_quick_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            block_quick_sort("not a list")
+
+    def test_large_random(self):
+        # Large enough to go through several full blocks
+        n = 5000
+        data = [random.randint(-1000, 1000) for _ in range(n)]
+        copy = deepcopy(data)
+        block_quick_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_all_equal(self):
+        data = [7] * 1000
+        block_quick_sort(data)
+        self.assertEqual(data, [7] * 1000)
+
+    def test_partition_block(self):
+        data = [random.randint(-100, 100) for _ in range(1000)]
+        j = partition_block(data, 0, len(data) - 1)
+        self.assertTrue(all(x <= data[j] for x in data[:j]))
+        self.assertTrue(all(x >= data[j] for x in data[j + 1:]))
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSortNumpy(unittest.TestCase):
+    def test_random(self):
+        for n in (0, 1, 50, 20000):
+            data = np.random.randint(-1000, 1000, n)
+            expected = np.sort(data)
+            block_quick_sort(data)
+            self.assertTrue(np.array_equal(data, expected))
+
+    def test_few_unique(self):
+        data = np.random.randint(0, 3, 30000)
+        expected = np.sort(data)
+        block_quick_sort(data)
+        self.assertTrue(np.array_equal(data, expected))
+
+    def test_floats(self):
+        data = np.random.rand(20000)
+        expected = np.sort(data)
+        block_quick_sort(data)
+        self.assertTrue(np.array_equal(data, expected))
+
+    def test_nan(self):
+        data = np.random.rand(20000)
+        data[np.random.randint(0, 20000, 500)] = np.nan
+        expected = np.sort(data)
+        block_quick_sort(data)
+        self.assertTrue(np.array_equal(data, expected, equal_nan=True))
+
+    def test_partition_keeps_nan(self):
+        data = np.random.rand(5000)
+        data[np.random.randint(1, 5000, 200)] = np.nan
+        data[0] = 0.5
+        expected = np.sort(data)
+        partition_block_ndarray(data, 0, len(data) - 1)
+        self.assertTrue(np.array_equal(np.sort(data), expected, equal_nan=True))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            block_quick_sort(np.zeros((3, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
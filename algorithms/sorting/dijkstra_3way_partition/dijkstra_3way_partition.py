@@ -41,7 +41,7 @@ def sort(a: list, lo: int, hi: int) -> None:
 
     # Recursively sort the subarrays
     sort(a, lo, less_than - 1)
-    sort(a, less_than + 1, hi)
+    sort(a, greater_than + 1, hi)
 
 def dijkstra_3way_partition(a: list) -> None:
     """
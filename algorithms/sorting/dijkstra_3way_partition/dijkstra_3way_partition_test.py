@@ -47,6 +47,13 @@ class TestSort(unittest.TestCase):
         dijkstra_3way_partition(data)
         self.assertEqual(data, sorted(copy))
 
+    def test_many_duplicates(self):
+        # The keys equal to the pivot must not be partitioned again
+        data = [random.randint(0, 3) for _ in range(20000)]
+        copy = deepcopy(data)
+        dijkstra_3way_partition(data)
+        self.assertEqual(data, sorted(copy))
+
     def test_input_validation(self):
         with self.assertRaises(ValueError):
             dijkstra_3way_partition("not a list")
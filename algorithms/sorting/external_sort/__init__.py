@@ -0,0 +1 @@
+from .external_sort import external_sort
\ No newline at end of file
@@ -0,0 +1,215 @@
+import heapq
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Iterator, List, Optional
+from algorithms.sorting.merge_sort_improved.merge_sort_improved import merge_sort_improved
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import quick_sort_improved
+
+
+# Default memory budget for the runs and the merge buffers (64 MiB)
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Smallest read buffer of a run during the merge, the fan-in is limited to keep buffers above it
+MIN_BUFFER_SIZE = 64 * 1024
+
+# Size of a list slot, added to the size of every line held in memory
+_POINTER_SIZE = 8
+
+
+def _sort_run(lines: list, algorithm: str, key: Optional[Callable[[str], Any]]) -> None:
+    """
+    Sort a run in memory with the selected algorithm.
+
+    Args:
+        lines (list): The lines of the run.
+        algorithm (str): 'merge' for merge_sort_improved or 'quick' for quick_sort_improved.
+        key (Optional[Callable[[str], Any]]): Function that extracts the comparison key from each line.
+
+    Note:
+        This function modifies the original list.
+    """
+    if algorithm == 'merge':
+        merge_sort_improved(lines, key=key)
+    elif key is None:
+        quick_sort_improved(lines)
+    else:
+        decorated = [(key(line), line) for line in lines]
+        quick_sort_improved(decorated)
+        lines[:] = [line for _, line in decorated]
+
+def _read_runs(path: str, memory_limit: int, encoding: str) -> Iterator[List[str]]:
+    """
+    Read the file in runs of lines whose estimated size in memory fits in the budget.
+
+    Args:
+        path (str): The path of the file.
+        memory_limit (int): The memory budget of a run in bytes.
+        encoding (str): The encoding of the file.
+
+    Yields:
+        List[str]: The lines of the next run, each one terminated by a newline.
+    """
+    run, size = [], 0
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                line += '\n'
+            run.append(line)
+            size += sys.getsizeof(line) + _POINTER_SIZE
+            if size >= memory_limit:
+                yield run
+                run, size = [], 0
+    if run:
+        yield run
+
+def _spill(lines: list, directory: str, encoding: str) -> str:
+    """
+    Write a sorted run to a temporary file.
+
+    Args:
+        lines (list): The sorted lines.
+        directory (str): The directory of the temporary files.
+        encoding (str): The encoding of the file.
+
+    Returns:
+        str: The path of the temporary file.
+    """
+    fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with open(fd, 'w', encoding=encoding, newline='') as f:
+        f.writelines(lines)
+    return path
+
+def _buffer_size(memory_limit: int, k: int) -> int:
+    """
+    Split the memory budget between the read buffers of k runs and the output buffer.
+
+    Args:
+        memory_limit (int): The memory budget in bytes.
+        k (int): The number of runs merged at once.
+
+    Returns:
+        int: The size of every buffer in bytes.
+    """
+    return max(2, memory_limit // (k + 1))
+
+def _read_buffered(path: str, buffer_size: int, encoding: str) -> Iterator[str]:
+    """
+    Iterate over the lines of a run, holding at most ~buffer_size bytes of it in memory.
+
+    Args:
+        path (str): The path of the run.
+        buffer_size (int): The size of the read buffer in bytes.
+        encoding (str): The encoding of the file.
+
+    Yields:
+        str: The next line of the run.
+    """
+    with open(path, 'r', encoding=encoding, newline='', buffering=buffer_size) as f:
+        while True:
+            lines = f.readlines(buffer_size)
+            if not lines:
+                return
+            yield from lines
+
+def _merge_runs(paths: List[str], out, buffer_size: int, key: Optional[Callable[[str], Any]], encoding: str) -> None:
+    """
+    K-way merge of sorted runs with a min-heap that holds the current line of every run.
+
+    Ties are broken by the index of the run, and runs are in input order,
+    so the merge keeps the relative order of equal lines.
+
+    Args:
+        paths (List[str]): The paths of the sorted runs, in input order.
+        out: The text file the merged lines are written to.
+        buffer_size (int): The read buffer of every run in bytes.
+        key (Optional[Callable[[str], Any]]): Function that extracts the comparison key from each line.
+        encoding (str): The encoding of the files.
+    """
+    readers = [_read_buffered(path, buffer_size, encoding) for path in paths]
+    heap = []
+
+    for i, reader in enumerate(readers):
+        line = next(reader, None)
+        if line is not None:
+            heap.append((line if key is None else key(line), i, line))
+    heapq.heapify(heap)
+
+    while heap:
+        _, i, line = heap[0]
+        out.write(line)
+
+        line = next(readers[i], None)
+        if line is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (line if key is None else key(line), i, line))
+
+def external_sort(input_path: str, output_path: str, memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                  algorithm: str = 'merge', key: Optional[Callable[[str], Any]] = None,
+                  encoding: str = 'utf-8', tmp_dir: Optional[str] = None) -> None:
+    """
+    Sort the lines of a text file that may be larger than the available memory.
+
+    The file is cut into runs that fit in the memory budget, every run is sorted in memory
+    and spilled to a temporary file, and the runs are combined with a heap-based k-way merge
+    that reads every run through a bounded buffer. When there are too many runs for the
+    buffers to fit in the budget, they are merged in several passes.
+
+    Performance:
+        Time Complexity: O(N log N) comparisons.
+        I/O: the data is read and written 1 + ceil(log_F(R)) times, R runs and fan-in F.
+        Space Complexity: O(M) memory for a budget of M bytes, O(N) temporary disk space.
+
+    Args:
+        input_path (str): The path of the file to be sorted.
+        output_path (str): The path of the sorted file, it may be the same as input_path.
+        memory_limit (int): The memory budget in bytes.
+        algorithm (str): 'merge' to sort runs with merge_sort_improved (stable),
+            'quick' to sort them with quick_sort_improved.
+        key (Optional[Callable[[str], Any]]): Function that extracts the comparison key from each line.
+        encoding (str): The encoding of the files.
+        tmp_dir (Optional[str]): The directory of the temporary files, the system default if None.
+
+    Raises:
+        ValueError: If the memory limit is not positive.
+        ValueError: If the algorithm is not 'merge' or 'quick'.
+
+    Note:
+        Lines are compared with their newline, the last line of the output always ends with one.
+        With algorithm='merge' the sort is stable.
+    """
+    if memory_limit <= 0:
+        raise ValueError("ValueError: The memory limit must be positive.")
+
+    if algorithm not in ('merge', 'quick'):
+        raise ValueError("ValueError: Algorithm must be 'merge' or 'quick'.")
+
+    # Keep a read buffer of at least MIN_BUFFER_SIZE bytes for each run merged at once
+    fan_in = max(2, memory_limit // MIN_BUFFER_SIZE - 1)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        # Phase 1: sort memory-budgeted runs and spill them to disk
+        paths = []
+        for run in _read_runs(input_path, memory_limit, encoding):
+            _sort_run(run, algorithm, key)
+            paths.append(_spill(run, directory, encoding))
+
+        # Phase 2: merge groups of runs until a single pass can merge the rest
+        while len(paths) > fan_in:
+            merged = []
+            buffer_size = _buffer_size(memory_limit, fan_in)
+            for i in range(0, len(paths), fan_in):
+                group = paths[i:i + fan_in]
+                fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+                with open(fd, 'w', encoding=encoding, newline='', buffering=buffer_size) as out:
+                    _merge_runs(group, out, buffer_size, key, encoding)
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            paths = merged
+
+        # Final pass: write the output file
+        buffer_size = _buffer_size(memory_limit, len(paths))
+        with open(output_path, 'w', encoding=encoding, newline='', buffering=buffer_size) as out:
+            _merge_runs(paths, out, buffer_size, key, encoding)
@@ -0,0 +1,43 @@
+import os
+import random
+import tempfile
+from algorithms import external_sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(external_sort)
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.txt")
+        output_path = os.path.join(directory, "output.txt")
+
+        print("Example 1.")
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{random.randint(-20, 20)}\n" for _ in range(20))
+        print("File before ordering:")
+        with open(input_path, "r", encoding="utf-8") as f:
+            print(f.read().split())
+
+        # A small memory budget, so the file is sorted in several runs
+        external_sort(input_path, output_path, memory_limit=512, key=int)
+        print("Sorted File in Ascending Order:")
+        with open(output_path, "r", encoding="utf-8") as f:
+            print(f.read().split())
+
+        print("\nExample 2.")
+        words = ["pear", "fig", "banana", "kiwi", "apple", "plum", "cherry", "date"]
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{random.choice(words)}\n" for _ in range(20))
+        print("File before ordering:")
+        with open(input_path, "r", encoding="utf-8") as f:
+            print(f.read().split())
+
+        external_sort(input_path, output_path, algorithm="quick")
+        print("Sorted File in Ascending Order:")
+        with open(output_path, "r", encoding="utf-8") as f:
+            print(f.read().split())
+
+if __name__ == "__main__":
+    demo()
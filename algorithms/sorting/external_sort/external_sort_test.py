@@ -0,0 +1,76 @@
+import os
+import random
+import tempfile
+import unittest
+from algorithms import external_sort
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.directory.name, "input.txt")
+        self.output_path = os.path.join(self.directory.name, "output.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, text):
+        with open(self.input_path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def read(self):
+        with open(self.output_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_empty_file(self):
+        self.write("")
+        external_sort(self.input_path, self.output_path)
+        self.assertEqual(self.read(), "")
+
+    def test_single_line_without_newline(self):
+        self.write("hello")
+        external_sort(self.input_path, self.output_path)
+        self.assertEqual(self.read(), "hello\n")
+
+    def test_in_memory(self):
+        self.write("pear\napple\nfig\n")
+        external_sort(self.input_path, self.output_path)
+        self.assertEqual(self.read(), "apple\nfig\npear\n")
+
+    def test_many_runs(self):
+        lines = [f"{random.randint(0, 10**6)}\n" for _ in range(2000)]
+        self.write("".join(lines))
+        # A tiny budget forces many runs and several merge passes
+        external_sort(self.input_path, self.output_path, memory_limit=2000)
+        self.assertEqual(self.read(), "".join(sorted(lines)))
+
+    def test_quick_sort_runs(self):
+        lines = [f"{random.randint(0, 10**6)}\n" for _ in range(2000)]
+        self.write("".join(lines))
+        external_sort(self.input_path, self.output_path, memory_limit=5000, algorithm="quick")
+        self.assertEqual(self.read(), "".join(sorted(lines)))
+
+    def test_key_stability(self):
+        lines = [f"{random.randint(0, 5)},{i}\n" for i in range(1000)]
+        self.write("".join(lines))
+        key = lambda line: int(line.split(",")[0])
+        external_sort(self.input_path, self.output_path, memory_limit=3000, key=key)
+        self.assertEqual(self.read(), "".join(sorted(lines, key=key)))
+
+    def test_in_place(self):
+        lines = [f"{random.randint(0, 10**6)}\n" for _ in range(500)]
+        self.write("".join(lines))
+        external_sort(self.input_path, self.input_path, memory_limit=2000)
+        with open(self.input_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "".join(sorted(lines)))
+
+    def test_input_validation(self):
+        self.write("a\n")
+        with self.assertRaises(ValueError):
+            external_sort(self.input_path, self.output_path, memory_limit=0)
+        with self.assertRaises(ValueError):
+            external_sort(self.input_path, self.output_path, algorithm="bogo")
+
+
+if __name__ == '__main__':
+    unittest.main()
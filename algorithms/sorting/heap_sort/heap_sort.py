@@ -1,8 +1,18 @@
 class Heapsort:
     """
-    A binary heap implementation (max-heap) using an array.
+    A d-ary heap implementation (max-heap) using an array, binary by default.
     This class performs heapsort on an array.
 
+    Improvements:
+        The heap is 0-based, the children of k are d*k + 1 ... d*k + d,
+        so the list is never shifted.
+        Extraction sinks the hole left by the root down to a leaf, following the
+        larger child, and then sifts the last item up from there (Floyd). The
+        item taken from the end of the heap almost always belongs near the
+        bottom, so this roughly halves the comparisons.
+        A 4-ary heap is shallower and its children are contiguous in memory,
+        which suits big arrays.
+
     Performance:
         Time complexity: O(N log N)
         Space complexity: O(1)
@@ -11,54 +21,61 @@ class Heapsort:
         This class modifies the original list.
     """
 
-    def __init__(self: 'Heapsort', a: list) -> None:
+    def __init__(self: 'Heapsort', a: list, arity: int = 2) -> None:
         """
         Initializes the heapsort process and sorts the array.
 
         Args:
             a (list): The list of elements to be sorted.
+            arity (int): The number of children of every node of the heap.
 
         Raises:
             ValueError: If the argument is not a list.
+            ValueError: If the arity is less than 2.
         """
 
         if not isinstance(a, list):
             raise ValueError("ValueError: Input must be a list.")
 
-        n = len(a)
+        if not isinstance(arity, int) or arity < 2:
+            raise ValueError("ValueError: Arity must be an integer greater than 1.")
 
-        # Insert a dummy value None at index 0
-        a.insert(0, None)
+        n = len(a)
 
         # Build the heap in array a so that largest value is at the root
-        for k in range(n // 2, 0, -1):
-            self._sink(a, k, n)
+        for k in range((n - 2) // arity, -1, -1):
+            self._sink(a, k, n, arity)
 
         # Extract elements from the heap one by one
         while n > 1:
             # Move current root to end
-            a[1], a[n] = a[n], a[1]
             n -= 1
-            # Call sink on the reduced heap
-            self._sink(a, 1, n)
+            a[0], a[n] = a[n], a[0]
+            # Restore the reduced heap
+            self._sink_to_bottom(a, 0, n, arity)
 
-        # Remove the placeholder None
-        a.pop(0)
-            
     @staticmethod
-    def _sink(a: list, k: int, n: int) -> None:
+    def _sink(a: list, k: int, n: int, arity: int = 2) -> None:
         """
         Restores the heap order property by sinking down the element at index k.
 
         Args:
+            a (list): The array containing the heap.
             k (int): The index of the element to sink down.
+            n (int): The size of the heap.
+            arity (int): The number of children of every node.
         """
-        while 2 * k <= n:
-            j = 2 * k
+        while arity * k + 1 < n:
+            j = arity * k + 1
 
-            # Find the larger child
-            if j < n and a[j] < a[j + 1]:
-                j += 1
+            # Find the largest child
+            if arity == 2:
+                if j + 1 < n and a[j] < a[j + 1]:
+                    j += 1
+            else:
+                for c in range(j + 1, min(j + arity, n)):
+                    if a[j] < a[c]:
+                        j = c
 
             # If the parent is larger than the largest child, stop sinking
             if a[k] > a[j]:
@@ -67,3 +84,47 @@ class Heapsort:
             # Swap the parent with the largest child
             a[k], a[j] = a[j], a[k]
             k = j
+
+    @staticmethod
+    def _sink_to_bottom(a: list, k: int, n: int, arity: int = 2) -> None:
+        """
+        Restores the heap order property for the element at index k with Floyd's method:
+        move the largest child up into the hole down to a leaf, with no comparison against
+        the element itself, then sift the element up from that leaf.
+
+        Args:
+            a (list): The array containing the heap.
+            k (int): The index of the element to place.
+            n (int): The size of the heap.
+            arity (int): The number of children of every node.
+        """
+        item = a[k]
+        start = k
+
+        # Sink the hole to the bottom, following the largest child
+        if arity == 2:
+            j = 2 * k + 1
+            while j < n:
+                if j + 1 < n and a[j] < a[j + 1]:
+                    j += 1
+                a[k] = a[j]
+                k = j
+                j = 2 * k + 1
+        else:
+            while arity * k + 1 < n:
+                j = arity * k + 1
+                for c in range(j + 1, min(j + arity, n)):
+                    if a[j] < a[c]:
+                        j = c
+                a[k] = a[j]
+                k = j
+
+        # Sift the element up from the leaf
+        while k > start:
+            parent = (k - 1) // arity
+            if not a[parent] < item:
+                break
+            a[k] = a[parent]
+            k = parent
+
+        a[k] = item
@@ -50,6 +50,23 @@ class TestSort(unittest.TestCase):
     def test_input_validation(self):
         with self.assertRaises(ValueError):
             Heapsort("not a list")
+        with self.assertRaises(ValueError):
+            Heapsort([1, 2, 3], arity=1)
+
+    def test_arity(self):
+        n = 500
+        for arity in (3, 4, 8):
+            data = [random.randint(-100, 100) for _ in range(n)]
+            copy = deepcopy(data)
+            Heapsort(data, arity=arity)
+            self.assertEqual(data, sorted(copy))
+
+    def test_sink_to_bottom(self):
+        # A valid heap whose root was replaced by its last item
+        heap = [1, 8, 9, 7, 6, 5, 4]
+        Heapsort._sink_to_bottom(heap, 0, len(heap))
+        self.assertEqual(heap[0], 9)
+        self.assertTrue(all(heap[(k - 1) // 2] >= heap[k] for k in range(1, len(heap))))
 
 
 if __name__ == '__main__':
@@ -1,3 +1,6 @@
+from bisect import bisect_right
+
+
 def _insertion_sort(data: list, lo: int, hi: int) -> None:
     """
     Sort a sublist of elements in ascending order using the insertion sort algorithm.
@@ -17,7 +20,30 @@ def _insertion_sort(data: list, lo: int, hi: int) -> None:
             else:
                 break
 
-def insertion_sort(data: list) -> None:
+def _binary_insertion_sort(data: list, lo: int, hi: int) -> None:
+    """
+    Sort a sublist of elements in ascending order using binary insertion sort.
+    The position of each item is found with a binary search over the sorted prefix,
+    and the larger items are moved one slot right with a single slice assignment.
+
+    Args:
+        data (list): The list of elements to be sorted.
+        lo (int): The starting index of the sublist to be sorted.
+        hi (int): The ending index of the sublist to be sorted.
+
+    Note:
+        The item goes after the equal ones (bisect_right), so the sort is stable.
+        This function modifies the original list.
+    """
+    for i in range(lo + 1, hi + 1):
+        item = data[i]
+        pos = bisect_right(data, item, lo, i)
+
+        if pos < i:
+            data[pos + 1:i + 1] = data[pos:i]
+            data[pos] = item
+
+def insertion_sort(data: list, binary: bool = False) -> None:
     """
     Sort a list of elements in ascending order using the insertion sort algorithm.
 
@@ -25,8 +51,13 @@ def insertion_sort(data: list) -> None:
         Comparisons: ~N^2/4 in the worst case.
         Exchanges: ~N^2/4 in the worst case.
 
+    Binary mode:
+        Comparisons: ~N log N.
+        The items still move ~N^2/4 times, but in slice assignments instead of swaps.
+
     Args:
         data (list): The list of elements to be sorted.
+        binary (bool): If True, use binary insertion sort.
 
     Raises:
         ValueError: If the argument is not a list.
@@ -37,4 +68,7 @@ def insertion_sort(data: list) -> None:
     if not isinstance(data, list):
         raise ValueError("ValueError: Input must be a list.")
 
-    _insertion_sort(data, 0, len(data) - 1)
+    if binary:
+        _binary_insertion_sort(data, 0, len(data) - 1)
+    else:
+        _insertion_sort(data, 0, len(data) - 1)
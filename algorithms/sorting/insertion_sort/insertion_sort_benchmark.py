@@ -0,0 +1,21 @@
+import random
+import timeit
+from algorithms import insertion_sort
+
+
+def benchmark() -> None:
+    """
+    Compare the swapping insertion sort with binary insertion sort on the sizes used as cutoffs
+    """
+    repeat = 5
+    number = 1000
+
+    print(f"{'n':>5} {'swaps (s)':>10} {'binary (s)':>11} {'speed-up':>9}")
+    for n in (7, 10, 16, 32, 64, 128):
+        data = [random.random() for _ in range(n)]
+        linear = min(timeit.repeat(lambda: insertion_sort(data[:]), number=number, repeat=repeat))
+        binary = min(timeit.repeat(lambda: insertion_sort(data[:], binary=True), number=number, repeat=repeat))
+        print(f"{n:>5} {linear:>10.4f} {binary:>11.4f} {linear / binary:>8.1f}x")
+
+if __name__ == "__main__":
+    benchmark()
@@ -47,6 +47,25 @@ class TestSort(unittest.TestCase):
         insertion_sort(data)
         self.assertEqual(data, sorted(copy))
 
+    def test_binary(self):
+        n = 200
+        data = [random.randint(-100, 100) for _ in range(n)]
+        copy = deepcopy(data)
+        insertion_sort(data, binary=True)
+        self.assertEqual(data, sorted(copy))
+
+    def test_binary_stability(self):
+        class Item:
+            def __init__(self, key, index):
+                self.key, self.index = key, index
+
+            def __lt__(self, other):
+                return self.key < other.key
+
+        data = [Item(random.randint(0, 10), i) for i in range(200)]
+        insertion_sort(data, binary=True)
+        self.assertEqual([(x.key, x.index) for x in data], sorted((x.key, x.index) for x in data))
+
     def test_input_validation(self):
         with self.assertRaises(ValueError):
             insertion_sort("not a list")
@@ -0,0 +1 @@
+from .instrumentation import Counters, instrument, profile, unwrap
\ No newline at end of file
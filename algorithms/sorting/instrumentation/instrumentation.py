@@ -0,0 +1,235 @@
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Counters:
+    """
+    Counts of the operations made by one sort.
+
+    Attributes:
+        comparisons (int): Comparisons between two items (<, <=, >, >=).
+        reads (int): Items read from the list, by index, slice or iteration.
+        writes (int): Items written to the list, by index or slice.
+        swaps (int): Pairs of writes that exchange two items.
+        depth (int): The deepest recursion of a function of the sort.
+    """
+
+    def __init__(self: 'Counters') -> None:
+        """
+        Initializes all the counts to zero.
+        """
+        self.reset()
+
+    def reset(self: 'Counters') -> None:
+        """
+        Sets all the counts to zero.
+        """
+        self.comparisons: int = 0
+        self.reads: int = 0
+        self.writes: int = 0
+        self.swaps: int = 0
+        self.depth: int = 0
+
+    def as_dict(self: 'Counters') -> Dict[str, int]:
+        """
+        Returns the counts.
+
+        Returns:
+            Dict[str, int]: The counts by name.
+        """
+        return {
+            "comparisons": self.comparisons,
+            "reads": self.reads,
+            "writes": self.writes,
+            "swaps": self.swaps,
+            "depth": self.depth,
+        }
+
+    def __repr__(self: 'Counters') -> str:
+        """
+        Returns a string representation of the counts.
+
+        Returns:
+            str: The counts by name.
+        """
+        return f"Counters({', '.join(f'{k}={v}' for k, v in self.as_dict().items())})"
+
+
+class InstrumentedItem:
+    """
+    Wraps an item and counts the comparisons made on it.
+    """
+    __slots__ = ('value', 'counters')
+
+    def __init__(self: 'InstrumentedItem', value: Any, counters: Counters) -> None:
+        self.value = value
+        self.counters = counters
+
+    def __lt__(self: 'InstrumentedItem', other: 'InstrumentedItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self: 'InstrumentedItem', other: 'InstrumentedItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self: 'InstrumentedItem', other: 'InstrumentedItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self: 'InstrumentedItem', other: 'InstrumentedItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value >= other.value
+
+    def __repr__(self: 'InstrumentedItem') -> str:
+        return repr(self.value)
+
+
+class InstrumentedList(list):
+    """
+    A list that counts the items read and written, and the pairs of writes that exchange two items.
+
+    A swap a[i], a[j] = a[j], a[i] reads a[j] and a[i], then writes the old a[j] at i
+    and the old a[i] at j. A write of an item just read from another index starts a
+    possible swap, the next write completes it if it puts the overwritten item there.
+    Items are matched by identity, so swaps are exact for InstrumentedItem, which are
+    unique objects.
+    """
+
+    def __init__(self: 'InstrumentedList', items: Iterable[Any], counters: Counters) -> None:
+        super().__init__(items)
+        self.counters = counters
+        self._reads = [(None, None), (None, None)]  # The last two (index, item) read
+        self._pending = None                        # (index, item) that would complete a swap
+
+    def __getitem__(self: 'InstrumentedList', index: Any) -> Any:
+        value = list.__getitem__(self, index)
+
+        if isinstance(index, slice):
+            self.counters.reads += len(value)
+        else:
+            self.counters.reads += 1
+            self._reads = [self._reads[1], (index, value)]
+
+        return value
+
+    def __iter__(self: 'InstrumentedList') -> Iterator[Any]:
+        self.counters.reads += len(self)
+        return list.__iter__(self)
+
+    def __setitem__(self: 'InstrumentedList', index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            self.counters.writes += len(value)
+            self._pending = None
+            list.__setitem__(self, index, value)
+            return
+
+        self.counters.writes += 1
+        pending = self._pending
+        self._pending = None
+
+        if pending is not None and pending[0] == index and pending[1] is value:
+            self.counters.swaps += 1
+        else:
+            for j, item in self._reads:
+                if item is value and j is not None and j != index:
+                    self._pending = (j, list.__getitem__(self, index))
+
+        list.__setitem__(self, index, value)
+
+
+def instrument(data: Iterable[Any], counters: Counters, wrap_items: bool = True) -> InstrumentedList:
+    """
+    Returns an instrumented copy of data that records the operations of a sort in counters.
+
+    Args:
+        data (Iterable[Any]): The items.
+        counters (Counters): Where the operations are counted.
+        wrap_items (bool): If True, wrap the items to count comparisons. Radix sorts
+            need the raw items, their digits are read instead of compared.
+
+    Returns:
+        InstrumentedList: The instrumented list.
+    """
+    items = [InstrumentedItem(x, counters) for x in data] if wrap_items else data
+    return InstrumentedList(items, counters)
+
+def unwrap(a: Iterable[Any]) -> List[Any]:
+    """
+    Returns the raw items of an instrumented list, without counting reads.
+
+    Args:
+        a (Iterable[Any]): The instrumented list.
+
+    Returns:
+        List[Any]: The items, unwrapped.
+    """
+    items = list.__iter__(a) if isinstance(a, InstrumentedList) else iter(a)
+    return [x.value if isinstance(x, InstrumentedItem) else x for x in items]
+
+def _depth_tracker(counters: Counters) -> Callable[[Any, str, Any], None]:
+    """
+    Returns a profile function that records in counters the deepest nesting of any
+    single function of the algorithms package, which is the recursion depth.
+
+    Args:
+        counters (Counters): Where the depth is recorded.
+
+    Returns:
+        Callable[[Any, str, Any], None]: The function for sys.setprofile.
+    """
+    active: Dict[Any, int] = {}
+
+    def tracker(frame: Any, event: str, arg: Any) -> None:
+        if event not in ("call", "return"):
+            return
+
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith("algorithms.") or module == __name__:
+            return
+
+        code = frame.f_code
+        if event == "call":
+            active[code] = active.get(code, 0) + 1
+            if active[code] > counters.depth:
+                counters.depth = active[code]
+        else:
+            active[code] = active.get(code, 1) - 1
+
+    return tracker
+
+def profile(sort: Callable[..., Any], data: Iterable[Any], *args: Any, wrap_items: bool = True,
+            counters: Optional[Counters] = None, **kwargs: Any) -> Tuple[List[Any], Counters]:
+    """
+    Sorts an instrumented copy of data and counts the comparisons, reads, writes,
+    swaps and recursion depth of the sort.
+
+    Nothing is added to the sorts themselves: the items count their comparisons,
+    the list counts its reads and writes, and a profile function (sys.setprofile)
+    follows the calls only while the sort runs. An uninstrumented call has no overhead.
+
+    Args:
+        sort (Callable[..., Any]): The sort, called as sort(a, *args, **kwargs).
+        data (Iterable[Any]): The items to be sorted, they are not modified.
+        wrap_items (bool): If True, wrap the items to count comparisons.
+        counters (Optional[Counters]): The counters to use, new ones by default.
+
+    Returns:
+        Tuple[List[Any], Counters]: The sorted items, unwrapped, and the counts.
+
+    Note:
+        Reads and writes of auxiliary lists created by the sort are not counted,
+        only those of the list passed to it.
+    """
+    counters = Counters() if counters is None else counters
+    a = instrument(data, counters, wrap_items)
+
+    previous = sys.getprofile()
+    sys.setprofile(_depth_tracker(counters))
+    try:
+        sort(a, *args, **kwargs)
+    finally:
+        sys.setprofile(previous)
+
+    return unwrap(a), counters
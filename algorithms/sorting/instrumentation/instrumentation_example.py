@@ -0,0 +1,24 @@
+import random
+from algorithms import merge_sort, profile, quick_sort, selection_sort, shell_sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(profile)
+
+    print("Example 1.")
+    data = [random.randrange(1000) for _ in range(1000)]
+    for sort in (selection_sort, shell_sort, merge_sort, quick_sort):
+        _, counters = profile(sort, data)
+        print(f"{sort.__name__:<15}", counters)
+
+    print("\nExample 2.")
+    data = list(range(1000))
+    _, counters = profile(shell_sort, data)
+    print("shell_sort on sorted input:", counters)
+
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,66 @@
+import unittest
+import random
+import sys
+from algorithms import Counters, insertion_sort, instrument, lsd_radix_sort, merge_sort, profile, \
+    quick_sort_improved, selection_sort, unwrap
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_selection_sort(self):
+        n = 50
+        data = random.sample(range(n), n)
+        result, counters = profile(selection_sort, data)
+        self.assertEqual(result, sorted(data))
+        self.assertEqual(counters.comparisons, n * (n - 1) // 2)
+        self.assertLessEqual(counters.swaps, n)
+        self.assertEqual(counters.writes, 2 * n)
+
+    def test_insertion_sort(self):
+        n = 50
+        _, counters = profile(insertion_sort, list(range(n)))
+        self.assertEqual(counters.comparisons, n - 1)
+        self.assertEqual(counters.writes, 0)
+
+        _, counters = profile(insertion_sort, list(range(n, 0, -1)))
+        self.assertEqual(counters.swaps, n * (n - 1) // 2)
+
+    def test_depth(self):
+        data = [random.random() for _ in range(1024)]
+        _, counters = profile(merge_sort, data)
+        self.assertEqual(counters.depth, 11)
+
+        _, counters = profile(quick_sort_improved, data, introsort_mode=True)
+        self.assertLessEqual(counters.depth, 12)
+
+    def test_data_not_modified(self):
+        data = [3, 1, 2]
+        result, _ = profile(selection_sort, data)
+        self.assertEqual(data, [3, 1, 2])
+        self.assertEqual(result, [1, 2, 3])
+
+    def test_raw_items(self):
+        data = [random.randrange(1000) for _ in range(100)]
+        result, counters = profile(lsd_radix_sort, data, wrap_items=False)
+        self.assertEqual(result, sorted(data))
+        self.assertEqual(counters.comparisons, 0)
+        self.assertGreater(counters.writes, 0)
+
+    def test_instrument(self):
+        counters = Counters()
+        a = instrument([2, 1], counters)
+        a[0], a[1] = a[1], a[0]
+        self.assertTrue(a[0] < a[1])
+        self.assertEqual(unwrap(a), [1, 2])
+        self.assertEqual(counters.as_dict(), {"comparisons": 1, "reads": 4, "writes": 2, "swaps": 1, "depth": 0})
+
+        counters.reset()
+        self.assertEqual(counters.swaps, 0)
+
+    def test_profiler_restored(self):
+        previous = sys.getprofile()
+        profile(selection_sort, [2, 1])
+        self.assertIs(sys.getprofile(), previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
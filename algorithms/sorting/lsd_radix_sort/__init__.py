@@ -0,0 +1 @@
+from .lsd_radix_sort import lsd_radix_sort
\ No newline at end of file
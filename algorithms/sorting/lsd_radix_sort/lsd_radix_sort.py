@@ -0,0 +1,127 @@
+from typing import Optional
+
+
+# Size of the alphabet of the strings (extended ASCII) and number of bits per integer digit
+R = 256
+BITS_PER_DIGIT = 8
+
+
+def _sort_strings(a: list, w: int, radix: int) -> None:
+    """
+    Sort strings of length w with key-indexed counting on each character, from right to left.
+
+    Args:
+        a (list): The list of strings to be sorted.
+        w (int): The length of the strings.
+        radix (int): The size of the alphabet.
+
+    Note:
+        This function modifies the original list.
+    """
+    n = len(a)
+    aux = [None for i in range(n)]
+
+    for d in range(w - 1, -1, -1):
+        # Compute frequency counts
+        count = [0 for i in range(radix + 1)]
+        for s in a:
+            count[ord(s[d]) + 1] += 1
+
+        # Transform counts to indices
+        for r in range(radix):
+            count[r + 1] += count[r]
+
+        # Distribute
+        for s in a:
+            c = ord(s[d])
+            aux[count[c]] = s
+            count[c] += 1
+
+        # Copy back
+        a[:] = aux
+
+def _sort_integers(a: list) -> None:
+    """
+    Sort integers with key-indexed counting on each BITS_PER_DIGIT-bit digit,
+    from the least significant one. Negative integers are handled by sorting
+    their offset from the minimum.
+
+    Args:
+        a (list): The list of integers to be sorted.
+
+    Note:
+        This function modifies the original list.
+    """
+    n = len(a)
+    if n < 2:
+        return
+
+    low = min(a)
+    bits = (max(a) - low).bit_length()
+    radix = 1 << BITS_PER_DIGIT
+    mask = radix - 1
+    aux = [None for i in range(n)]
+
+    for shift in range(0, bits, BITS_PER_DIGIT):
+        # Compute frequency counts
+        count = [0 for i in range(radix + 1)]
+        for x in a:
+            count[((x - low) >> shift & mask) + 1] += 1
+
+        # Transform counts to indices
+        for r in range(radix):
+            count[r + 1] += count[r]
+
+        # Distribute
+        for x in a:
+            c = (x - low) >> shift & mask
+            aux[count[c]] = x
+            count[c] += 1
+
+        # Copy back
+        a[:] = aux
+
+def lsd_radix_sort(a: list, radix: Optional[int] = None) -> None:
+    """
+    Sort a list of fixed-width strings or of integers in ascending order using
+    least-significant-digit-first radix sort.
+
+    Strings must all have the same length, and their characters codes must be
+    smaller than the radix. Integers may be negative and of any size.
+
+    Performance:
+        Time complexity: O(W (N + R)) for W digits (characters) and radix R.
+        Space complexity: O(N + R)
+
+    Args:
+        a (list): The list of strings or integers to be sorted.
+        radix (Optional[int]): The size of the alphabet of the strings, R = 256 by default.
+
+    Raises:
+        ValueError: If the argument is not a list.
+        ValueError: If the elements are not all strings of equal length or all integers.
+        ValueError: If a character is outside the alphabet.
+
+    Note:
+        LSD radix sort is a stable sorting algorithm.
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    if all(type(x) is int for x in a):
+        _sort_integers(a)
+        return
+
+    if not all(isinstance(x, str) for x in a):
+        raise ValueError("ValueError: All the elements must be strings or all integers.")
+
+    w = len(a[0])
+    if any(len(s) != w for s in a):
+        raise ValueError("ValueError: All the strings must have the same length.")
+
+    radix = R if radix is None else radix
+    if any(ord(c) >= radix for s in a for c in s):
+        raise ValueError("ValueError: Character outside the alphabet.")
+
+    _sort_strings(a, w, radix)
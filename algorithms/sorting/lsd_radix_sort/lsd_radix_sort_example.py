@@ -0,0 +1,27 @@
+import random
+from algorithms import lsd_radix_sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(lsd_radix_sort)
+    print("Example 1.")
+    print("Array before ordering:")
+    data = ["4PGC938", "2IYE230", "3CIO720", "1ICK750", "1OHV845", "4JZY524", "1ICK750", "3CIO720"]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    lsd_radix_sort(data)
+    print(data)
+
+    print("\nExample 2.")
+    print("Array before ordering:")
+    data = [random.randint(-1000, 1000) for _ in range(20)]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    lsd_radix_sort(data)
+    print(data)
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,60 @@
+import unittest
+import random
+from copy import deepcopy
+from algorithms import lsd_radix_sort
+
+
+class TestSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        lsd_radix_sort(data)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = [5]
+        lsd_radix_sort(data)
+        self.assertEqual(data, [5])
+
+    def test_fixed_width_strings(self):
+        data = ["4PGC938", "2IYE230", "3CIO720", "1ICK750", "1OHV845", "4JZY524", "1ICK750", "3CIO720"]
+        copy = deepcopy(data)
+        lsd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_negative_numbers(self):
+        data = [5, -2, 8, -1, 9]
+        lsd_radix_sort(data)
+        self.assertEqual(data, [-2, -1, 5, 8, 9])
+
+    def test_random_integers(self):
+        n = 500
+        data = [random.randint(-10**12, 10**12) for _ in range(n)]
+        copy = deepcopy(data)
+        lsd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_random_strings(self):
+        n = 500
+        data = ["".join(random.choice("abcdef") for _ in range(6)) for _ in range(n)]
+        copy = deepcopy(data)
+        lsd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_radix(self):
+        data = ["āb", "Āc", "ab"]
+        with self.assertRaises(ValueError):
+            lsd_radix_sort(data)
+        lsd_radix_sort(data, radix=0x0102)
+        self.assertEqual(data, ["ab", "Āc", "āb"])
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            lsd_radix_sort("not a list")
+        with self.assertRaises(ValueError):
+            lsd_radix_sort(["abc", "ab"])
+        with self.assertRaises(ValueError):
+            lsd_radix_sort([1.5, 2.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,13 @@
+from algorithms.sorting.insertion_sort.insertion_sort import _insertion_sort
+
+
+# Runs shorter than the minimum run length are extended with insertion sort
+MIN_MERGE = 32
+
+# Number of consecutive wins of one run before the merge switches to galloping
+MIN_GALLOP = 7
+
+
 def merge(a: list, aux: list, lo: int, mid: int, hi: int) -> None:
     """
     Merge two sorted subarrays into a single sorted subarray.
@@ -31,16 +41,275 @@ def merge(a: list, aux: list, lo: int, mid: int, hi: int) -> None:
             a[k] = aux[i]
             i += 1
 
-def merge_sort_bottom_up(a: list) -> None:
+def _min_run_length(n: int) -> int:
+    """
+    Compute the minimum run length, so that n / min_run is equal to or slightly
+    less than a power of two, which keeps the final merges balanced.
+
+    Args:
+        n (int): The number of items to be sorted.
+
+    Returns:
+        int: The minimum run length, between MIN_MERGE / 2 and MIN_MERGE.
+    """
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _count_run(a: list, lo: int, n: int) -> int:
+    """
+    Find the length of the natural run starting at lo. A strictly descending run
+    is reversed in place, strictness keeps the sort stable.
+
+    Args:
+        a (list): The array containing the run.
+        lo (int): The starting index of the run.
+        n (int): The length of the array.
+
+    Returns:
+        int: The length of the run.
+
+    Note:
+        This function modifies the original list.
+    """
+    hi = lo + 1
+    if hi == n:
+        return 1
+
+    if a[hi] < a[lo]:
+        # Strictly descending run
+        while hi + 1 < n and a[hi + 1] < a[hi]:
+            hi += 1
+        a[lo:hi + 1] = a[lo:hi + 1][::-1]
+    else:
+        # Ascending run
+        while hi + 1 < n and not a[hi + 1] < a[hi]:
+            hi += 1
+
+    return hi - lo + 1
+
+def _gallop_left(key, a: list, lo: int, hi: int) -> int:
+    """
+    Find the first index in the sorted slice a[lo:hi] whose item is not less than key.
+    An exponential search from lo brackets the position, then a binary search finds it.
+
+    Args:
+        key: The item to be located.
+        a (list): The list that contains the sorted slice.
+        lo (int): The starting index of the slice.
+        hi (int): The ending index (exclusive) of the slice.
+
+    Returns:
+        int: The index where key would be inserted before any equal items.
+    """
+    # Exponential search: a[lo + last] < key <= a[lo + offset]
+    last, offset = -1, 1
+    while lo + offset - 1 < hi and a[lo + offset - 1] < key:
+        last, offset = offset - 1, offset * 2
+    left, right = lo + last + 1, min(lo + offset - 1, hi)
+
+    # Binary search inside the bracket
+    while left < right:
+        mid = (left + right) // 2
+        if a[mid] < key:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+def _gallop_right(key, a: list, lo: int, hi: int) -> int:
+    """
+    Find the first index in the sorted slice a[lo:hi] whose item is greater than key.
+    An exponential search from lo brackets the position, then a binary search finds it.
+
+    Args:
+        key: The item to be located.
+        a (list): The list that contains the sorted slice.
+        lo (int): The starting index of the slice.
+        hi (int): The ending index (exclusive) of the slice.
+
+    Returns:
+        int: The index where key would be inserted after any equal items.
+    """
+    # Exponential search: a[lo + last] <= key < a[lo + offset]
+    last, offset = -1, 1
+    while lo + offset - 1 < hi and not key < a[lo + offset - 1]:
+        last, offset = offset - 1, offset * 2
+    left, right = lo + last + 1, min(lo + offset - 1, hi)
+
+    # Binary search inside the bracket
+    while left < right:
+        mid = (left + right) // 2
+        if key < a[mid]:
+            right = mid
+        else:
+            left = mid + 1
+    return left
+
+def merge_runs(a: list, lo: int, mid: int, hi: int) -> None:
+    """
+    Merge the adjacent sorted runs a[lo:mid] and a[mid:hi] with galloping.
+
+    Items of the left run already in place and items of the right run already in
+    place are skipped with a gallop before merging. During the merge, when one run
+    wins MIN_GALLOP times in a row, the length of the whole winning stretch is found
+    with a gallop and moved with a single slice assignment.
+
+    Args:
+        a (list): The array containing the runs to be merged.
+        lo (int): The starting index of the first run.
+        mid (int): The starting index of the second run.
+        hi (int): The ending index (exclusive) of the second run.
+
+    Note:
+        This function modifies the original list.
+    """
+    # Items of the left run not greater than a[mid] are already in place
+    lo = _gallop_right(a[mid], a, lo, mid)
+    if lo == mid:
+        return
+
+    # Items of the right run not less than a[mid - 1] are already in place
+    hi = _gallop_left(a[mid - 1], a, mid, hi)
+
+    tmp = a[lo:mid]  # Auxiliar copy of the left run
+    n_left = mid - lo
+    i, j, k = 0, mid, lo
+    wins_left = wins_right = 0
+
+    while i < n_left and j < hi:
+        if a[j] < tmp[i]:
+            a[k] = a[j]
+            j += 1
+            k += 1
+            wins_right += 1
+            wins_left = 0
+
+            if wins_right >= MIN_GALLOP:
+                # Move every item of the right run less than tmp[i] at once
+                end = _gallop_left(tmp[i], a, j, hi)
+                a[k:k + end - j] = a[j:end]
+                k += end - j
+                j = end
+                wins_right = 0
+        else:
+            a[k] = tmp[i]
+            i += 1
+            k += 1
+            wins_left += 1
+            wins_right = 0
+
+            if wins_left >= MIN_GALLOP and j < hi:
+                # Move every item of the left run not greater than a[j] at once
+                end = _gallop_right(a[j], tmp, i, n_left)
+                a[k:k + end - i] = tmp[i:end]
+                k += end - i
+                i = end
+                wins_left = 0
+
+    # The rest of the right run is already in place
+    a[k:k + n_left - i] = tmp[i:]
+
+def _natural_merge_sort(a: list) -> None:
+    """
+    Sort the array by merging its natural runs (TimSort-style).
+
+    The array is scanned left to right for ascending or strictly descending runs.
+    Descending runs are reversed and short runs are extended to the minimum run
+    length with insertion sort. Runs are pushed onto a stack and merged while the
+    stack breaks the invariants |Z| > |Y| + |X| and |Y| > |X| (X on top), which keeps
+    the merges balanced.
+
+    Args:
+        a (list): The array to be sorted.
+
+    Note:
+        This function modifies the original list.
+    """
+    n = len(a)
+    if n < 2:
+        return
+
+    min_run = _min_run_length(n)
+    runs = []  # Stack of (start, length)
+    lo = 0
+
+    while lo < n:
+        length = _count_run(a, lo, n)
+
+        # Extend short runs to min_run items
+        if length < min_run:
+            force = min(min_run, n - lo)
+            _insertion_sort(a, lo, lo + force - 1)
+            length = force
+
+        runs.append((lo, length))
+        _merge_collapse(a, runs)
+        lo += length
+
+    # Merge all the remaining runs
+    while len(runs) > 1:
+        _merge_at(a, runs, len(runs) - 2)
+
+def _merge_at(a: list, runs: list, i: int) -> None:
+    """
+    Merge the runs at positions i and i + 1 of the run stack.
+
+    Args:
+        a (list): The array containing the runs.
+        runs (list): The stack of (start, length) runs.
+        i (int): The position of the first run in the stack.
+
+    Note:
+        This function modifies the original lists a and runs.
+    """
+    start_1, length_1 = runs[i]
+    start_2, length_2 = runs[i + 1]
+    runs[i] = (start_1, length_1 + length_2)
+    del runs[i + 1]
+    merge_runs(a, start_1, start_2, start_2 + length_2)
+
+def _merge_collapse(a: list, runs: list) -> None:
+    """
+    Merge runs on top of the stack until the stack invariants hold again.
+
+    Args:
+        a (list): The array containing the runs.
+        runs (list): The stack of (start, length) runs.
+
+    Note:
+        This function modifies the original lists a and runs.
+    """
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+            # Merge the middle run with the smaller of its neighbours
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _merge_at(a, runs, i)
+
+def merge_sort_bottom_up(a: list, adaptive: bool = False) -> None:
     """
     Sort an array in ascending order using the bottom-up merge sort algorithm.
 
+    Adaptive mode:
+        Instead of merging fixed widths 1, 2, 4, ..., natural ascending and descending
+        runs are detected and merged with a run-stack policy and galloping (TimSort-style).
+        Partially sorted input then needs far fewer comparisons and passes.
+
     Performance:
         Time Complexity: O(N log N) in the best, average, and worst case.
+        Adaptive mode: O(N) for presorted input, O(N log N) in the worst case.
         Space Complexity: O(N) due to the auxiliary array.
 
     Args:
         a (list): The array to be sorted.
+        adaptive (bool): If True, merge natural runs instead of fixed widths.
 
     Raises:
         ValueError: If the argument is not a list.
@@ -52,6 +321,10 @@ def merge_sort_bottom_up(a: list) -> None:
     if not isinstance(a, list):
         raise ValueError("ValueError: Input must be a list.")
 
+    if adaptive:
+        _natural_merge_sort(a)
+        return
+
     n = len(a)
     aux = [0 for i in range(n)]
     sz = 1
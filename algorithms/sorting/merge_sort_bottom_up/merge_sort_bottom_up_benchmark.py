@@ -0,0 +1,38 @@
+import random
+import timeit
+from algorithms import merge_sort_bottom_up
+
+
+def partially_sorted(n: int, swaps: int) -> list:
+    """
+    Build a sorted list of n items and disorder it with a few random swaps.
+    """
+    data = list(range(n))
+    for _ in range(swaps):
+        i, j = random.randrange(n), random.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+def benchmark() -> None:
+    """
+    Compare the fixed-width passes with the adaptive natural-run mode on partially sorted input
+    """
+    repeat = 3
+    inputs = [
+        ("sorted", lambda n: list(range(n))),
+        ("reversed", lambda n: list(range(n, 0, -1))),
+        ("1% swaps", lambda n: partially_sorted(n, n // 100)),
+        ("2 runs", lambda n: sorted(random.sample(range(n), n // 2)) + sorted(random.sample(range(n), n // 2))),
+        ("random", lambda n: random.sample(range(n), n)),
+    ]
+
+    print(f"{'input':<10} {'n':>8} {'fixed (s)':>10} {'adaptive (s)':>13} {'speed-up':>9}")
+    for n in (10_000, 100_000):
+        for name, make in inputs:
+            data = make(n)
+            fixed = min(timeit.repeat(lambda: merge_sort_bottom_up(data[:]), number=1, repeat=repeat))
+            adaptive = min(timeit.repeat(lambda: merge_sort_bottom_up(data[:], adaptive=True), number=1, repeat=repeat))
+            print(f"{name:<10} {n:>8} {fixed:>10.4f} {adaptive:>13.4f} {fixed / adaptive:>8.1f}x")
+
+if __name__ == "__main__":
+    benchmark()
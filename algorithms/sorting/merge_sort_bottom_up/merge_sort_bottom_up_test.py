@@ -4,6 +4,15 @@ from copy import deepcopy
 from algorithms import merge_sort_bottom_up
 
 
+class Key:
+    # Compares by the first field only, to detect reordering of equal keys
+    def __init__(self, item):
+        self.item = item
+
+    def __lt__(self, other):
+        return self.item[0] < other.item[0]
+
+
 class TestSort(unittest.TestCase):
     def test_empty_list(self):
         data = []
@@ -52,5 +61,46 @@ class TestSort(unittest.TestCase):
             merge_sort_bottom_up("not a list")
 
 
+class TestSortAdaptive(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        merge_sort_bottom_up(data, adaptive=True)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = [5]
+        merge_sort_bottom_up(data, adaptive=True)
+        self.assertEqual(data, [5])
+
+    def test_random(self):
+        n = 1000
+        data = [random.randint(-100, 100) for _ in range(n)]
+        copy = deepcopy(data)
+        merge_sort_bottom_up(data, adaptive=True)
+        self.assertEqual(data, sorted(copy))
+
+    def test_reversed(self):
+        data = list(range(500, 0, -1))
+        merge_sort_bottom_up(data, adaptive=True)
+        self.assertEqual(data, list(range(1, 501)))
+
+    def test_natural_runs(self):
+        data = []
+        for _ in range(20):
+            run = sorted(random.randint(-1000, 1000) for _ in range(random.randint(1, 200)))
+            data += run[::-1] if random.random() < 0.5 else run
+        copy = deepcopy(data)
+        merge_sort_bottom_up(data, adaptive=True)
+        self.assertEqual(data, sorted(copy))
+
+    def test_stability(self):
+        data = [(random.randint(0, 3), i) for i in range(500)]
+        data.sort(key=lambda item: -item[0])
+        keys = [Key(item) for item in data]
+        merge_sort_bottom_up(keys, adaptive=True)
+        self.assertEqual([key.item for key in keys], sorted(data, key=lambda item: item[0]))
+
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
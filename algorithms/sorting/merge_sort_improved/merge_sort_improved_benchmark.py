@@ -0,0 +1,26 @@
+import random
+import timeit
+from algorithms import merge_sort_improved
+
+
+def benchmark() -> None:
+    """
+    Compare the cutoff sizes below which subarrays are sorted with binary insertion sort
+    """
+    repeat = 3
+    cutoffs = (4, 7, 10, 16, 24, 32, 48, 64)
+    inputs = [
+        ("random", lambda n: [random.random() for _ in range(n)]),
+        ("few unique", lambda n: [random.randint(0, 10) for _ in range(n)]),
+    ]
+
+    print(f"{'input':<11} {'n':>8} {'cutoff':>7} {'time (s)':>9}")
+    for n in (10_000, 100_000):
+        for name, make in inputs:
+            data = make(n)
+            for cutoff in cutoffs:
+                elapsed = min(timeit.repeat(lambda: merge_sort_improved(data[:], cutoff=cutoff), number=1, repeat=repeat))
+                print(f"{name:<11} {n:>8} {cutoff:>7} {elapsed:>9.4f}")
+
+if __name__ == "__main__":
+    benchmark()
@@ -23,5 +23,13 @@ def demo() -> None:
     merge_sort_improved(data)
     print(data)
 
+    print("\nExample 3.")
+    print("Array before ordering:")
+    data = ["pear", "fig", "banana", "kiwi", "apple", "plum"]
+    print(data)
+    print("Sorted Array by length (stable):")
+    merge_sort_improved(data, key=len)
+    print(data)
+
 if __name__ == "__main__":
     demo()
\ No newline at end of file
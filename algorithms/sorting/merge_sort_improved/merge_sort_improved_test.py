@@ -3,6 +3,11 @@ import random
 from copy import deepcopy
 from algorithms import merge_sort_improved
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestSort(unittest.TestCase):
     def test_empty_list(self):
@@ -51,6 +56,118 @@ class TestSort(unittest.TestCase):
         with self.assertRaises(ValueError):
             merge_sort_improved("not a list")
 
+    def test_key(self):
+        data = ["pear", "fig", "banana", "kiwi"]
+        merge_sort_improved(data, key=len)
+        self.assertEqual(data, ["fig", "pear", "kiwi", "banana"])
+
+    def test_key_stability(self):
+        n = 200
+        data = [(random.randint(0, 10), i) for i in range(n)]
+        copy = deepcopy(data)
+        merge_sort_improved(data, key=lambda item: item[0])
+        self.assertEqual(data, sorted(copy, key=lambda item: item[0]))
+
+    def test_key_computed_once(self):
+        calls = []
+        data = [random.randint(-100, 100) for _ in range(50)]
+        merge_sort_improved(data, key=lambda item: calls.append(item) or -item)
+        self.assertEqual(len(calls), 50)
+        self.assertEqual(data, sorted(data, reverse=True))
+
+    def test_cutoff(self):
+        data = [random.randint(-100, 100) for _ in range(300)]
+        for cutoff in (1, 2, 16, 64, 500):
+            copy = deepcopy(data)
+            merge_sort_improved(copy, cutoff=cutoff)
+            self.assertEqual(copy, sorted(data))
+
+    def test_cutoff_stability(self):
+        data = [(random.randint(0, 10), i) for i in range(300)]
+        copy = deepcopy(data)
+        merge_sort_improved(copy, key=lambda item: item[0], cutoff=64)
+        self.assertEqual(copy, sorted(data, key=lambda item: item[0]))
+
+    def test_cutoff_validation(self):
+        with self.assertRaises(ValueError):
+            merge_sort_improved([1, 2], cutoff=0)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSortNumpy(unittest.TestCase):
+    def test_empty_array(self):
+        data = np.array([], dtype=int)
+        merge_sort_improved(data)
+        self.assertEqual(data.tolist(), [])
+
+    def test_random(self):
+        for n in (1, 7, 8, 50, 1000):
+            data = np.random.randint(-100, 100, n)
+            expected = np.sort(data)
+            merge_sort_improved(data)
+            self.assertTrue(np.array_equal(data, expected))
+
+    def test_floats(self):
+        data = np.array([5.5, 2.2, 8.8, 1.1, 9.9])
+        merge_sort_improved(data)
+        self.assertEqual(data.tolist(), [1.1, 2.2, 5.5, 8.8, 9.9])
+
+    def test_non_contiguous_view(self):
+        base = np.random.randint(-100, 100, 200)
+        data = base[::2]
+        expected = np.sort(data)
+        merge_sort_improved(data)
+        self.assertTrue(np.array_equal(base[::2], expected))
+
+    def test_key_stability(self):
+        data = np.random.randint(0, 1000, 500)
+        expected = data[np.argsort(data % 7, kind='stable')]
+        merge_sort_improved(data, key=lambda item: item % 7)
+        self.assertTrue(np.array_equal(data, expected))
+
+    def test_vectorized_passes(self):
+        for n in (111, 112, 113, 1000, 4567):
+            data = np.random.randint(0, 50, n)
+            expected = data[np.argsort(data // 3, kind='stable')]
+            merge_sort_improved(data, key=lambda item: item // 3)
+            self.assertTrue(np.array_equal(data, expected))
+
+    def test_nan(self):
+        for n in (15, 300, 5000):
+            data = np.random.random(n)
+            data[np.random.randint(0, n, n // 5)] = np.nan
+            expected = np.sort(data)
+            merge_sort_improved(data)
+            self.assertTrue(np.array_equal(data, expected, equal_nan=True))
+
+        data = np.array([3.0, np.nan, 1.0] * 5)
+        merge_sort_improved(data)
+        self.assertEqual(data[:10].tolist(), [1.0] * 5 + [3.0] * 5)
+        self.assertTrue(np.isnan(data[10:]).all())
+
+    def test_nan_key(self):
+        data = np.arange(200)
+        keys = np.where(data % 3 == 0, np.nan, (data * 7) % 11)
+        merge_sort_improved(data, key=lambda item: keys[item])
+        expected = np.argsort(keys, kind='stable')
+        self.assertTrue(np.array_equal(data, expected))
+
+    def test_tuple_key(self):
+        data = np.array([3, 1, 2] * 20)
+        expected = sorted(data.tolist(), key=lambda v: (v % 2, v))
+        merge_sort_improved(data, key=lambda v: (v % 2, v))
+        self.assertEqual(data.tolist(), expected)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            merge_sort_improved(np.zeros((3, 3)))
+
+    def test_cutoff(self):
+        data = np.random.randint(-1000, 1000, 500)
+        expected = np.sort(data)
+        merge_sort_improved(data, cutoff=16)
+        self.assertTrue(np.array_equal(data, expected))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1 @@
+from .msd_radix_sort import msd_radix_sort
\ No newline at end of file
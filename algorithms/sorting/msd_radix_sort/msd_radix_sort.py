@@ -0,0 +1,168 @@
+from typing import Optional
+from algorithms.sorting.insertion_sort.insertion_sort import _insertion_sort
+from algorithms.sorting.quick_3way_string.quick_3way_string import _insertion_sort_from, char_at
+
+
+# Size of the alphabet of the strings (extended ASCII) and number of bits per integer digit
+R = 256
+BITS_PER_DIGIT = 8
+
+# Use insertion sort for subarrays with up to ~15 items
+CUTOFF = 15
+
+
+def sort_strings(a: list, aux: list, lo: int, hi: int, d: int, radix: int) -> None:
+    """
+    Sort the subarray a[lo..hi] of strings sharing their first d characters
+    with key-indexed counting on the d-th character, then sort every group
+    of strings with the same d-th character on the next one.
+
+    The largest group is sorted by the loop instead of a recursive call, so the
+    recursion depth stays O(log N) even when the strings share a long prefix,
+    and a group holding all the strings moves on to the next character without
+    being distributed.
+
+    Args:
+        a (list): The list of strings to be sorted.
+        aux (list): An auxiliary array used for distributing.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        d (int): The position of the character.
+        radix (int): The size of the alphabet.
+
+    Note:
+        This function modifies the original lists a and aux.
+    """
+    while hi > lo + CUTOFF - 1:
+        n = hi - lo + 1
+
+        # Compute frequency counts, slot 0 is for strings that end before d
+        count = [0 for i in range(radix + 2)]
+        for i in range(lo, hi + 1):
+            count[char_at(a[i], d) + 2] += 1
+
+        # Common character: nothing to distribute, go on with the next one
+        if max(count) == n:
+            if count[1] == n:
+                return  # All the strings ended, they are equal
+            d += 1
+            continue
+
+        # Transform counts to indices
+        for r in range(radix + 1):
+            count[r + 1] += count[r]
+
+        # Distribute
+        for i in range(lo, hi + 1):
+            c = char_at(a[i], d) + 1
+            aux[count[c]] = a[i]
+            count[c] += 1
+
+        # Copy back
+        a[lo:hi + 1] = aux[:n]
+
+        # Recursively sort for each character (strings that ended are already sorted),
+        # except for the largest group, which is sorted by the next iteration
+        largest = max(range(radix), key=lambda r: count[r + 1] - count[r])
+        for r in range(radix):
+            if r != largest:
+                sort_strings(a, aux, lo + count[r], lo + count[r + 1] - 1, d + 1, radix)
+
+        lo, hi, d = lo + count[largest], lo + count[largest + 1] - 1, d + 1
+
+    _insertion_sort_from(a, lo, hi, d)
+
+def sort_integers(a: list, aux: list, lo: int, hi: int, shift: int, low: int) -> None:
+    """
+    Sort the subarray a[lo..hi] of integers sharing their digits above `shift`
+    with key-indexed counting on the next BITS_PER_DIGIT-bit digit, then sort
+    every group of integers with the same digit on the next one.
+
+    Args:
+        a (list): The list of integers to be sorted.
+        aux (list): An auxiliary array used for distributing.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        shift (int): The position of the lowest bit of the digit.
+        low (int): The minimum of the list, integers are sorted by their offset from it.
+
+    Note:
+        This function modifies the original lists a and aux.
+    """
+    if hi <= lo + CUTOFF - 1 or shift < 0:
+        _insertion_sort(a, lo, hi)
+        return
+
+    radix = 1 << BITS_PER_DIGIT
+    mask = radix - 1
+
+    # Compute frequency counts
+    count = [0 for i in range(radix + 2)]
+    for i in range(lo, hi + 1):
+        count[((a[i] - low) >> shift & mask) + 2] += 1
+
+    # Transform counts to indices
+    for r in range(radix + 1):
+        count[r + 1] += count[r]
+
+    # Distribute
+    for i in range(lo, hi + 1):
+        c = ((a[i] - low) >> shift & mask) + 1
+        aux[count[c]] = a[i]
+        count[c] += 1
+
+    # Copy back
+    a[lo:hi + 1] = aux[:hi - lo + 1]
+
+    # Recursively sort for each digit
+    for r in range(radix):
+        sort_integers(a, aux, lo + count[r], lo + count[r + 1] - 1, shift - BITS_PER_DIGIT, low)
+
+def msd_radix_sort(a: list, radix: Optional[int] = None) -> None:
+    """
+    Sort a list of strings or of integers in ascending order using
+    most-significant-digit-first radix sort.
+
+    Strings may have different lengths, their characters codes must be smaller
+    than the radix. Integers may be negative and of any size.
+
+    Performance:
+        Time complexity: between O(N log_R N) and O(total length of the keys) character accesses.
+        Space complexity: O(N + D R) for a recursion depth D and radix R.
+
+    Args:
+        a (list): The list of strings or integers to be sorted.
+        radix (Optional[int]): The size of the alphabet of the strings, R = 256 by default.
+
+    Raises:
+        ValueError: If the argument is not a list.
+        ValueError: If the elements are not all strings or all integers.
+        ValueError: If a character is outside the alphabet.
+
+    Note:
+        MSD radix sort is a stable sorting algorithm.
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    n = len(a)
+    aux = [None for i in range(n)]
+
+    if all(type(x) is int for x in a):
+        if n > 1:
+            low = min(a)
+            bits = (max(a) - low).bit_length()
+            # Start with the most significant digit
+            top = (bits - 1) // BITS_PER_DIGIT * BITS_PER_DIGIT
+            sort_integers(a, aux, 0, n - 1, top, low)
+        return
+
+    if not all(isinstance(x, str) for x in a):
+        raise ValueError("ValueError: All the elements must be strings or all integers.")
+
+    radix = R if radix is None else radix
+    if any(ord(c) >= radix for s in a for c in s):
+        raise ValueError("ValueError: Character outside the alphabet.")
+
+    sort_strings(a, aux, 0, n - 1, 0, radix)
@@ -0,0 +1,27 @@
+import random
+from algorithms import msd_radix_sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(msd_radix_sort)
+    print("Example 1.")
+    print("Array before ordering:")
+    data = ["she", "sells", "seashells", "by", "the", "sea", "shore", "the", "shells", "she"]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    msd_radix_sort(data)
+    print(data)
+
+    print("\nExample 2.")
+    print("Array before ordering:")
+    data = [random.randint(-1000, 1000) for _ in range(20)]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    msd_radix_sort(data)
+    print(data)
+
+if __name__ == "__main__":
+    demo()
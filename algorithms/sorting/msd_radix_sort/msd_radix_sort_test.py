@@ -0,0 +1,73 @@
+import unittest
+import random
+from copy import deepcopy
+from algorithms import msd_radix_sort
+
+
+class TestSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        msd_radix_sort(data)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = [5]
+        msd_radix_sort(data)
+        self.assertEqual(data, [5])
+
+    def test_strings(self):
+        data = ["she", "sells", "seashells", "by", "the", "sea", "shore", "the", "shells", "she"]
+        copy = deepcopy(data)
+        msd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_prefixes(self):
+        data = ["abc", "ab", "", "a", "abcd", "ab"]
+        msd_radix_sort(data)
+        self.assertEqual(data, ["", "a", "ab", "ab", "abc", "abcd"])
+
+    def test_negative_numbers(self):
+        data = [5, -2, 8, -1, 9]
+        msd_radix_sort(data)
+        self.assertEqual(data, [-2, -1, 5, 8, 9])
+
+    def test_random_integers(self):
+        n = 1000
+        data = [random.randint(-10**12, 10**12) for _ in range(n)]
+        copy = deepcopy(data)
+        msd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_random_strings(self):
+        n = 1000
+        data = ["".join(random.choice("abcdef") for _ in range(random.randint(0, 8))) for _ in range(n)]
+        copy = deepcopy(data)
+        msd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_long_common_prefix(self):
+        prefix = "/" * 3000
+        data = [prefix + "".join(random.choice("ab/") for _ in range(random.randint(0, 20))) for _ in range(40)]
+        data += [prefix, prefix, prefix + "a" * 2000]
+        copy = deepcopy(data)
+        msd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_skewed_groups(self):
+        data = ["a" * k + "b" for k in range(300)] + ["a" * k for k in range(300)]
+        random.shuffle(data)
+        copy = deepcopy(data)
+        msd_radix_sort(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            msd_radix_sort("not a list")
+        with self.assertRaises(ValueError):
+            msd_radix_sort(["Ā"])
+        with self.assertRaises(ValueError):
+            msd_radix_sort([1, "a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
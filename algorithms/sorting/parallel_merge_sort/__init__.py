@@ -0,0 +1 @@
+from .parallel_merge_sort import parallel_merge_sort
\ No newline at end of file
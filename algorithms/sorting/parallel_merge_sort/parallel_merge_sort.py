@@ -0,0 +1,248 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+from algorithms.sorting.merge_sort_improved.merge_sort_improved import merge, merge_sort_improved
+
+
+# Below this size the process start-up costs more than it saves, sort serially
+PARALLEL_THRESHOLD = 100_000
+
+# Range of the signed 64-bit integers that fit in an array of typecode 'q'
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _shared_typecode(a: list) -> Optional[str]:
+    """
+    Return the array typecode that stores the list without loss, or None if the list
+    is not made only of ints that fit in 64 bits or only of floats.
+
+    Args:
+        a (list): The list of elements.
+
+    Returns:
+        Optional[str]: 'q' for 64-bit integers, 'd' for floats, None otherwise.
+    """
+    if all(type(x) is int for x in a):
+        if _INT64_MIN <= min(a) and max(a) <= _INT64_MAX:
+            return 'q'
+        return None
+
+    if all(type(x) is float for x in a):
+        return 'd'
+
+    return None
+
+def _sort_shared_chunk(name: str, typecode: str, lo: int, hi: int) -> None:
+    """
+    Sort the items [lo, hi) of the shared memory block with merge_sort_improved.
+    Runs in a worker process.
+
+    Args:
+        name (str): The name of the shared memory block.
+        typecode (str): The array typecode of the items.
+        lo (int): The starting index of the chunk.
+        hi (int): The ending index (exclusive) of the chunk.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(typecode)
+    try:
+        chunk = view[lo:hi].tolist()
+        merge_sort_improved(chunk)
+        view[lo:hi] = array(typecode, chunk)
+    finally:
+        view.release()
+        shm.close()
+
+def _merge_shared_runs(name: str, typecode: str, lo: int, mid: int, hi: int) -> None:
+    """
+    Merge the sorted runs [lo, mid] and [mid + 1, hi] of the shared memory block.
+    Runs in a worker process.
+
+    Args:
+        name (str): The name of the shared memory block.
+        typecode (str): The array typecode of the items.
+        lo (int): The starting index of the first run.
+        mid (int): The ending index of the first run.
+        hi (int): The ending index of the second run.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(typecode)
+    try:
+        chunk = view[lo:hi + 1].tolist()
+        aux = [0 for i in range(len(chunk))]
+        merge(chunk, aux, 0, mid - lo, hi - lo)
+        view[lo:hi + 1] = array(typecode, chunk)
+    finally:
+        view.release()
+        shm.close()
+
+def _sort_chunk(chunk: list) -> list:
+    """
+    Sort a pickled chunk with merge_sort_improved and send it back. Runs in a worker process.
+
+    Args:
+        chunk (list): The chunk to be sorted.
+
+    Returns:
+        list: The sorted chunk.
+    """
+    merge_sort_improved(chunk)
+    return chunk
+
+def _chunk_bounds(n: int, k: int) -> List[Tuple[int, int]]:
+    """
+    Split [0, n) into k contiguous chunks whose sizes differ by at most one.
+
+    Args:
+        n (int): The number of items.
+        k (int): The number of chunks.
+
+    Returns:
+        List[Tuple[int, int]]: The (lo, hi) bounds of the chunks, hi exclusive.
+    """
+    size, extra = divmod(n, k)
+    bounds, lo = [], 0
+    for i in range(k):
+        hi = lo + size + (1 if i < extra else 0)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+def _merge_rounds(runs: List[Tuple[int, int]]) -> List[List[Tuple[int, int, int]]]:
+    """
+    Plan the k-way merge as rounds of independent pairwise merges of adjacent runs.
+
+    Args:
+        runs (List[Tuple[int, int]]): The (lo, hi) bounds of the sorted runs, hi exclusive.
+
+    Returns:
+        List[List[Tuple[int, int, int]]]: For every round, the (lo, mid, hi) arguments
+        of merge, all of them inclusive indices.
+    """
+    rounds = []
+    while len(runs) > 1:
+        merges, next_runs = [], []
+        for i in range(0, len(runs) - 1, 2):
+            (lo, mid), (_, hi) = runs[i], runs[i + 1]
+            merges.append((lo, mid - 1, hi - 1))
+            next_runs.append((lo, hi))
+        if len(runs) % 2 == 1:
+            next_runs.append(runs[-1])
+        rounds.append(merges)
+        runs = next_runs
+    return rounds
+
+def _parallel_sort_shared(a: list, typecode: str, bounds: List[Tuple[int, int]], pool: ProcessPoolExecutor) -> None:
+    """
+    Sort numeric data through a shared memory block, so no item is pickled.
+
+    Args:
+        a (list): The list to be sorted.
+        typecode (str): The array typecode of the items.
+        bounds (List[Tuple[int, int]]): The chunks sorted by the workers.
+        pool (ProcessPoolExecutor): The pool of worker processes.
+
+    Note:
+        This function modifies the original list.
+    """
+    data = array(typecode, a)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+    try:
+        view = shm.buf.cast(typecode)
+        view[:len(data)] = data
+        del data
+
+        # Sort every chunk in parallel
+        futures = [pool.submit(_sort_shared_chunk, shm.name, typecode, lo, hi) for lo, hi in bounds]
+        for future in futures:
+            future.result()
+
+        # Merge the sorted chunks, the merges of a round are independent
+        for merges in _merge_rounds(bounds):
+            futures = [pool.submit(_merge_shared_runs, shm.name, typecode, lo, mid, hi)
+                       for lo, mid, hi in merges]
+            for future in futures:
+                future.result()
+
+        a[:] = view[:len(a)].tolist()
+        view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+
+def _parallel_sort_pickled(a: list, bounds: List[Tuple[int, int]], pool: ProcessPoolExecutor) -> None:
+    """
+    Sort arbitrary items by sending the chunks to the workers and merging them in this process.
+
+    Args:
+        a (list): The list to be sorted.
+        bounds (List[Tuple[int, int]]): The chunks sorted by the workers.
+        pool (ProcessPoolExecutor): The pool of worker processes.
+
+    Note:
+        This function modifies the original list.
+    """
+    chunks = pool.map(_sort_chunk, [a[lo:hi] for lo, hi in bounds])
+    for (lo, hi), chunk in zip(bounds, chunks):
+        a[lo:hi] = chunk
+
+    aux = [0 for i in range(len(a))]
+    for merges in _merge_rounds(bounds):
+        for lo, mid, hi in merges:
+            merge(a, aux, lo, mid, hi)
+
+def parallel_merge_sort(a: list, workers: Optional[int] = None, threshold: int = PARALLEL_THRESHOLD) -> None:
+    """
+    Sort an array in ascending order using merge sort on several processes.
+
+    The array is cut into one chunk per worker, the chunks are sorted in parallel with
+    merge_sort_improved, and the sorted chunks are combined with a k-way merge made of
+    rounds of pairwise merges. Lists of 64-bit ints or of floats are passed through
+    shared memory, so the workers read and write them without pickling, and the merge
+    rounds run in the workers as well. Other lists are pickled to the workers and merged
+    in the calling process.
+
+    Performance:
+        Time Complexity: O(N log N / P + N log P) with P workers.
+        Space Complexity: O(N) due to the shared buffer and the auxiliary arrays.
+
+    Args:
+        a (list): The array to be sorted.
+        workers (Optional[int]): The number of worker processes, os.cpu_count() by default.
+        threshold (int): Arrays shorter than this are sorted serially with merge_sort_improved.
+
+    Raises:
+        ValueError: If the argument is not a list.
+        ValueError: If the number of workers is not positive.
+
+    Note:
+        Merge Sort is a stable sorting algorithm.
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("ValueError: The number of workers must be positive.")
+
+    n = len(a)
+    workers = min(workers, n)
+
+    # Fall back to the serial path for small inputs
+    if n < threshold or workers <= 1:
+        merge_sort_improved(a)
+        return
+
+    bounds = _chunk_bounds(n, workers)
+    typecode = _shared_typecode(a)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if typecode is not None:
+            _parallel_sort_shared(a, typecode, bounds, pool)
+        else:
+            _parallel_sort_pickled(a, bounds, pool)
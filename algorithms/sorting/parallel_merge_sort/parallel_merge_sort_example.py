@@ -0,0 +1,34 @@
+import random
+import time
+from algorithms import merge_sort_improved, parallel_merge_sort
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(parallel_merge_sort)
+    print("Example 1.")
+    print("Array before ordering:")
+    data = [random.randint(-20, 20) for _ in range(20)]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    parallel_merge_sort(data, workers=2, threshold=0)
+    print(data)
+
+    print("\nExample 2.")
+    n = 1_000_000
+    data = [random.random() for _ in range(n)]
+    copy = data[:]
+
+    start = time.perf_counter()
+    merge_sort_improved(copy)
+    print(f"merge_sort_improved, {n} floats: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    parallel_merge_sort(data)
+    print(f"parallel_merge_sort, {n} floats: {time.perf_counter() - start:.2f} s")
+    print("Same result:", data == copy)
+
+if __name__ == "__main__":
+    demo()
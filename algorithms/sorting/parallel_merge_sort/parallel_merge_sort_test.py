@@ -0,0 +1,60 @@
+import unittest
+import random
+from copy import deepcopy
+from algorithms import parallel_merge_sort
+
+
+class TestSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        parallel_merge_sort(data, workers=2, threshold=0)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = [5]
+        parallel_merge_sort(data, workers=2, threshold=0)
+        self.assertEqual(data, [5])
+
+    def test_serial_fallback(self):
+        data = [5, 2, 8, 1, 9]
+        parallel_merge_sort(data, workers=4)
+        self.assertEqual(data, [1, 2, 5, 8, 9])
+
+    def test_integers(self):
+        n = 1000
+        data = [random.randint(-10**12, 10**12) for _ in range(n)]
+        copy = deepcopy(data)
+        parallel_merge_sort(data, workers=3, threshold=0)
+        self.assertEqual(data, sorted(copy))
+
+    def test_floats(self):
+        n = 1000
+        data = [random.uniform(-100, 100) for _ in range(n)]
+        copy = deepcopy(data)
+        parallel_merge_sort(data, workers=4, threshold=0)
+        self.assertEqual(data, sorted(copy))
+
+    def test_big_integers(self):
+        # Integers wider than 64 bits cannot use shared memory
+        n = 200
+        data = [random.randint(0, 2**80) for _ in range(n)]
+        copy = deepcopy(data)
+        parallel_merge_sort(data, workers=2, threshold=0)
+        self.assertEqual(data, sorted(copy))
+
+    def test_strings(self):
+        n = 200
+        data = [str(random.randint(0, 1000)) for _ in range(n)]
+        copy = deepcopy(data)
+        parallel_merge_sort(data, workers=3, threshold=0)
+        self.assertEqual(data, sorted(copy))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            parallel_merge_sort("not a list")
+        with self.assertRaises(ValueError):
+            parallel_merge_sort([1, 2, 3], workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
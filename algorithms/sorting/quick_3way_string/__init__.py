@@ -0,0 +1 @@
+from .quick_3way_string import quick_3way_string
\ No newline at end of file
@@ -0,0 +1,125 @@
+import random
+
+
+# Use insertion sort for subarrays with up to ~15 strings
+CUTOFF = 15
+
+
+def char_at(s: str, d: int) -> int:
+    """
+    Return the code of the d-th character of the string, or -1 past its end,
+    so that a string sorts before all its extensions.
+
+    Args:
+        s (str): The string.
+        d (int): The position of the character.
+
+    Returns:
+        int: The code of the character, -1 if d is out of range.
+    """
+    return ord(s[d]) if d < len(s) else -1
+
+def _insertion_sort_from(a: list, lo: int, hi: int, d: int) -> None:
+    """
+    Sort the subarray a[lo..hi] with insertion sort, knowing that its
+    strings share their first d characters.
+
+    Args:
+        a (list): The list of strings to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        d (int): The length of the common prefix.
+
+    Note:
+        This function modifies the original list.
+    """
+    for i in range(lo, hi + 1):
+        for j in range(i, lo, -1):
+            if a[j][d:] < a[j - 1][d:]:
+                a[j], a[j - 1] = a[j - 1], a[j]
+            else:
+                break
+
+def sort(a: list, lo: int, hi: int, d: int) -> None:
+    """
+    Sort the subarray a[lo..hi] of strings sharing their first d characters,
+    using 3-way partitioning on the d-th character.
+
+    The partitioning loop is the one of dijkstra_3way_partition, applied to one
+    character instead of the whole key: strings whose d-th character is equal to
+    the pivot's go on with the next character, so common prefixes are scanned once.
+
+    Args:
+        a (list): The list of strings to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        d (int): The position of the character used for partitioning.
+
+    Note:
+        This function modifies the original list.
+    """
+    while True:
+        if hi <= lo + CUTOFF - 1:
+            _insertion_sort_from(a, lo, hi, d)
+            return
+
+        # Initialize pointers for less than and greater than partitions
+        less_than, greater_than = lo, hi
+
+        # Choose the partitioning character (pivot)
+        pivot = char_at(a[lo], d)
+
+        # Initialize the current element pointer
+        i = lo + 1
+
+        while i <= greater_than:
+            s = a[i]
+            c = ord(s[d]) if d < len(s) else -1  # char_at, inlined in the hot loop
+            if c < pivot:
+                a[less_than], a[i] = a[i], a[less_than]
+                i += 1
+                less_than += 1
+            elif c > pivot:
+                a[i], a[greater_than] = a[greater_than], a[i]
+                greater_than -= 1
+            else:
+                i += 1
+
+        # Recursively sort the subarrays with a different d-th character
+        sort(a, lo, less_than - 1, d)
+        sort(a, greater_than + 1, hi, d)
+
+        # Strings equal up to their end are sorted, the others continue with the next character
+        if pivot < 0:
+            return
+        lo, hi, d = less_than, greater_than, d + 1
+
+def quick_3way_string(a: list) -> None:
+    """
+    Sort a list of strings in ascending order using 3-way string quicksort
+    (multi-key quicksort), which partitions on one character at a time.
+
+    Performance:
+        Average case: ~2 N ln N character compares, which helps with long keys
+        that share prefixes, such as URLs or paths.
+        Worst case: O(N^2 + total length) (rare, due to random shuffling).
+
+    Args:
+        a (list): The list of strings to be sorted.
+
+    Raises:
+        ValueError: If the argument is not a list of strings.
+
+    Note:
+        3-way string quicksort is not a stable sorting algorithm.
+        This function modifies the original list.
+    """
+    if not isinstance(a, list):
+        raise ValueError("ValueError: Input must be a list.")
+
+    if not all(isinstance(s, str) for s in a):
+        raise ValueError("ValueError: All the elements must be strings.")
+
+    # Shuffle the array to ensure average-case performance
+    random.shuffle(a)
+    sort(a, 0, len(a) - 1, 0)
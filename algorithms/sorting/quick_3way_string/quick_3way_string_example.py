@@ -0,0 +1,27 @@
+import random
+from algorithms import quick_3way_string
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(quick_3way_string)
+    print("Example 1.")
+    print("Array before ordering:")
+    data = ["she", "sells", "seashells", "by", "the", "sea", "shore", "the", "shells", "she"]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    quick_3way_string(data)
+    print(data)
+
+    print("\nExample 2.")
+    print("Array before ordering:")
+    data = [f"/home/user/{random.choice(['docs', 'src'])}/{random.randint(0, 20)}.txt" for _ in range(10)]
+    print(data)
+    print("Sorted Array in Ascending Order:")
+    quick_3way_string(data)
+    print(data)
+
+if __name__ == "__main__":
+    demo()
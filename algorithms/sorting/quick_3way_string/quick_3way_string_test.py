@@ -0,0 +1,57 @@
+import unittest
+import random
+from copy import deepcopy
+from algorithms import quick_3way_string
+
+
+class TestSort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        quick_3way_string(data)
+        self.assertEqual(data, [])
+
+    def test_single_element(self):
+        data = ["she"]
+        quick_3way_string(data)
+        self.assertEqual(data, ["she"])
+
+    def test_unsorted(self):
+        data = ["she", "sells", "seashells", "by", "the", "sea", "shore"]
+        quick_3way_string(data)
+        self.assertEqual(data, ["by", "sea", "seashells", "sells", "she", "shore", "the"])
+
+    def test_prefixes(self):
+        data = ["abc", "ab", "", "a", "abcd", "ab"]
+        quick_3way_string(data)
+        self.assertEqual(data, ["", "a", "ab", "ab", "abc", "abcd"])
+
+    def test_shared_prefixes(self):
+        n = 500
+        data = [f"https://example.com/path/{random.randint(0, 1000)}" for _ in range(n)]
+        copy = deepcopy(data)
+        quick_3way_string(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_long_common_prefix(self):
+        # Deeper than the recursion limit if the middle partition recursed
+        data = ["x" * 3000 + str(i) for i in range(50)]
+        copy = deepcopy(data)
+        quick_3way_string(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_random(self):
+        n = 500
+        data = ["".join(random.choice("abcé") for _ in range(random.randint(0, 10))) for _ in range(n)]
+        copy = deepcopy(data)
+        quick_3way_string(data)
+        self.assertEqual(data, sorted(copy))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            quick_3way_string("not a list")
+        with self.assertRaises(ValueError):
+            quick_3way_string(["a", 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
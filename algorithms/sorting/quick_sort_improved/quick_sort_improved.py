@@ -1,5 +1,13 @@
 import random
-from algorithms.sorting.insertion_sort.insertion_sort import _insertion_sort
+from algorithms.sorting.heap_sort.heap_sort import Heapsort
+from algorithms.sorting.insertion_sort.insertion_sort import _binary_insertion_sort, _insertion_sort
+
+
+# Use insertion sort for subarrays with up to ~10 items
+CUTOFF = 10
+
+# Use Tukey's ninther instead of the median of 3 for subarrays with more than ~40 items
+NINTHER_CUTOFF = 40
 
 
 def median_of_3(a: int, b: int, c: int, arr: list) -> int:
@@ -17,13 +25,52 @@ def median_of_3(a: int, b: int, c: int, arr: list) -> int:
     Returns:
         index (int): The index of the median element.
     """
-    if (arr[a] - arr[b]) * (arr[c] - arr[a]) >= 0:
+    # Only comparisons are used, so any comparable items work (not only numbers)
+    if arr[b] <= arr[a] <= arr[c] or arr[c] <= arr[a] <= arr[b]:
         return a
-    elif (arr[b] - arr[a]) * (arr[c] - arr[b]) >= 0:
+    elif arr[a] <= arr[b] <= arr[c] or arr[c] <= arr[b] <= arr[a]:
         return b
     else:
         return c
 
+def ninther(lo: int, hi: int, arr: list) -> int:
+    """
+    Return the index of Tukey's ninther of the subarray arr[lo..hi]: the median of the
+    medians of three evenly spaced groups of three elements. It estimates the true
+    median much better than a single median of 3 on large subarrays.
+
+    Args:
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        arr (list): The list of elements.
+
+    Returns:
+        index (int): The index of the ninther.
+    """
+    eps = (hi - lo + 1) // 8
+    mid = lo + (hi - lo) // 2
+    m1 = median_of_3(lo, lo + eps, lo + eps + eps, arr)
+    m2 = median_of_3(mid - eps, mid, mid + eps, arr)
+    m3 = median_of_3(hi - eps - eps, hi - eps, hi, arr)
+    return median_of_3(m1, m2, m3, arr)
+
+def choose_pivot(lo: int, hi: int, arr: list) -> int:
+    """
+    Return the index of the pivot for the subarray arr[lo..hi]: Tukey's ninther
+    for large subarrays, the median of 3 otherwise.
+
+    Args:
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        arr (list): The list of elements.
+
+    Returns:
+        index (int): The index of the pivot.
+    """
+    if hi - lo + 1 > NINTHER_CUTOFF:
+        return ninther(lo, hi, arr)
+    return median_of_3(lo, lo + (hi - lo) // 2, hi, arr)
+
 def partition(a: list, lo: int, hi: int) -> int:
     """
     Partition the subarray a[lo..hi] so that a[lo..j-1] <= a[j] <= a[j+1..hi] and return the index j.
@@ -66,7 +113,7 @@ def partition(a: list, lo: int, hi: int) -> int:
 
     return j
 
-def sort(a: list, lo: int, hi: int) -> None:
+def sort(a: list, lo: int, hi: int, cutoff: int = CUTOFF) -> None:
     """
     Recursively sort the subarray a[lo..hi] using the Quicksort algorithm.
 
@@ -74,42 +121,196 @@ def sort(a: list, lo: int, hi: int) -> None:
         a (list): The list of elements to be sorted.
         lo (int): The lower index of the subarray.
         hi (int): The higher index of the subarray.
+        cutoff (int): Subarrays with up to this many items are sorted with insertion sort.
 
     Note:
         This function modifies the original list.
     """
 
     # Improvement 1: Use insertion sort for small subarrays (recommended = 10)
-    cutoff = 10
     if hi <= lo + cutoff - 1:
-        _insertion_sort(a, lo, hi)
+        _binary_insertion_sort(a, lo, hi)
         return
 
-    # Improvement 2: Estimate true median by taking median of sample (recommended = 3 items)
-    m = median_of_3(lo, lo + (hi - lo) // 2, hi, a)
+    # Improvement 2: Estimate true median by taking median of sample (3 items, 9 for large subarrays)
+    m = choose_pivot(lo, hi, a)
     a[lo], a[m] = a[m], a[lo]
 
     j = partition(a, lo, hi)
-    sort(a, lo, j - 1)
-    sort(a, j + 1, hi)
+    sort(a, lo, j - 1, cutoff)
+    sort(a, j + 1, hi, cutoff)
+
+def partition_dual_pivot(a: list, lo: int, hi: int) -> tuple:
+    """
+    Partition the subarray a[lo..hi] around two pivots p = a[lo] <= q = a[hi] (Yaroslavskiy)
+    so that a[lo..lt-1] < p = a[lt] <= a[lt+1..gt-1] <= a[gt] = q < a[gt+1..hi].
+
+    Args:
+        a (list): The list of elements to be partitioned.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Returns:
+        (lt, gt) (tuple): The indexes of the two pivots after partitioning.
+    """
+    if a[hi] < a[lo]:
+        a[lo], a[hi] = a[hi], a[lo]
+    p, q = a[lo], a[hi]
+
+    lt, gt, i = lo + 1, hi - 1, lo + 1
+
+    while i <= gt:
+        if a[i] < p:
+            # Element belongs to the left part
+            a[i], a[lt] = a[lt], a[i]
+            lt += 1
+        elif q < a[i]:
+            # Element belongs to the right part, skip the elements already greater than q
+            while q < a[gt] and i < gt:
+                gt -= 1
+            a[i], a[gt] = a[gt], a[i]
+            gt -= 1
+
+            # The element coming from the right may belong to the left part
+            if a[i] < p:
+                a[i], a[lt] = a[lt], a[i]
+                lt += 1
+        i += 1
+
+    # Move the pivots to their final positions
+    lt -= 1
+    gt += 1
+    a[lo], a[lt] = a[lt], a[lo]
+    a[hi], a[gt] = a[gt], a[hi]
+
+    return lt, gt
+
+def sort_dual_pivot(a: list, lo: int, hi: int, cutoff: int = CUTOFF) -> None:
+    """
+    Recursively sort the subarray a[lo..hi] using the dual-pivot Quicksort algorithm.
+    The pivots are the 2nd and 4th of five evenly spaced sample elements (tertiles).
+
+    Args:
+        a (list): The list of elements to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        cutoff (int): Subarrays with up to this many items are sorted with insertion sort.
+
+    Note:
+        This function modifies the original list.
+    """
+    # The five samples must be distinct items, so never partition fewer than 5
+    if hi <= lo + max(cutoff, 5) - 1:
+        _binary_insertion_sort(a, lo, hi)
+        return
+
+    # Sort 5 evenly spaced elements and use the 2nd and 4th ones as pivots
+    step = (hi - lo) // 4
+    samples = [lo, lo + step, lo + 2 * step, lo + 3 * step, hi]
+    values = [a[k] for k in samples]
+    _insertion_sort(values, 0, 4)
+    for k, value in zip(samples, values):
+        a[k] = value
+    a[lo], a[samples[1]] = a[samples[1]], a[lo]
+    a[hi], a[samples[3]] = a[samples[3]], a[hi]
+
+    lt, gt = partition_dual_pivot(a, lo, hi)
+    sort_dual_pivot(a, lo, lt - 1, cutoff)
+
+    # If both pivots are equal, the middle part contains only copies of them
+    if a[lt] < a[gt]:
+        sort_dual_pivot(a, lt + 1, gt - 1, cutoff)
+    sort_dual_pivot(a, gt + 1, hi, cutoff)
+
+def _heapsort(a: list, lo: int, hi: int) -> None:
+    """
+    Sort the subarray a[lo..hi] with Heapsort.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+
+    Note:
+        This function modifies the original list.
+    """
+    sub = a[lo:hi + 1]
+    Heapsort(sub)
+    a[lo:hi + 1] = sub
+
+def introsort(a: list, lo: int, hi: int, depth_limit: int, cutoff: int = CUTOFF) -> None:
+    """
+    Sort the subarray a[lo..hi] using Quicksort, switching to Heapsort when the
+    recursion gets deeper than depth_limit (Introsort).
+
+    The call recurses on the smaller partition and loops on the larger one,
+    so the stack depth is at most log2(N) even before the limit is reached.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        lo (int): The lower index of the subarray.
+        hi (int): The higher index of the subarray.
+        depth_limit (int): The number of partitioning levels left before switching to Heapsort.
+        cutoff (int): Subarrays with up to this many items are sorted with insertion sort.
+
+    Note:
+        This function modifies the original list.
+    """
+    while hi > lo + cutoff - 1:
+        # Too many unbalanced partitions, bound the worst case with Heapsort
+        if depth_limit == 0:
+            _heapsort(a, lo, hi)
+            return
+        depth_limit -= 1
 
-def quick_sort_improved(a: list) -> None:
+        m = choose_pivot(lo, hi, a)
+        a[lo], a[m] = a[m], a[lo]
+        j = partition(a, lo, hi)
+
+        # Recurse on the smaller partition, loop on the larger one
+        if j - lo < hi - j:
+            introsort(a, lo, j - 1, depth_limit, cutoff)
+            lo = j + 1
+        else:
+            introsort(a, j + 1, hi, depth_limit, cutoff)
+            hi = j - 1
+
+    _binary_insertion_sort(a, lo, hi)
+
+def quick_sort_improved(a: list, introsort_mode: bool = False, dual_pivot: bool = False,
+                        cutoff: int = CUTOFF) -> None:
     """
     Sort a list of elements in ascending order using the Quick Sort algorithm with improvements.
 
     Improvements:
-        Use insertion sort for small subarrays (recommended = 10).
-        Estimate true median by taking median of sample (recommended = 3 items).
+        Use binary insertion sort for small subarrays (recommended = 10).
+        Estimate true median by taking median of sample (recommended = 3 items,
+        Tukey's ninther of 9 items for subarrays larger than 40).
+
+    Introsort mode:
+        The recursion depth is tracked and the subarray is sorted with Heapsort
+        after 2 * log2(N) levels. The input is not shuffled, the depth limit
+        alone bounds the worst case, even for adversarial input.
+
+    Dual-pivot mode:
+        Subarrays are split in three parts around two pivots (Yaroslavskiy),
+        which needs fewer comparisons and element moves than a single pivot.
 
     Performance:
         Average case: O(N log N)
         Worst case: O(N^2) (rare, due to random shuffling)
+        Worst case in introsort mode: O(N log N)
 
     Args:
         a (list): The list of elements to be sorted.
+        introsort_mode (bool): If True, use Introsort instead of shuffling.
+        dual_pivot (bool): If True, partition around two pivots.
+        cutoff (int): Subarrays with up to this many items are sorted with insertion sort.
 
     Raises:
         ValueError: If the argument is not a list.
+        ValueError: If both introsort_mode and dual_pivot are set.
+        ValueError: If the cutoff is not a positive integer.
 
     Note:
         Quick Sort is a not stable sorting algorithm.
@@ -119,8 +320,22 @@ def quick_sort_improved(a: list) -> None:
     if not isinstance(a, list):
         raise ValueError("ValueError: Input must be a list.")
 
+    if introsort_mode and dual_pivot:
+        raise ValueError("ValueError: Choose either introsort or dual-pivot mode.")
+
+    if not isinstance(cutoff, int) or cutoff < 1:
+        raise ValueError("ValueError: Cutoff must be a positive integer.")
+
+    if introsort_mode:
+        introsort(a, 0, len(a) - 1, 2 * max(len(a), 1).bit_length(), cutoff)
+        return
+
     # Shuffle the array to guarantee performance
     random.shuffle(a)
     lo = 0
     hi = len(a) - 1
-    sort(a, lo, hi)
+
+    if dual_pivot:
+        sort_dual_pivot(a, lo, hi, cutoff)
+    else:
+        sort(a, lo, hi, cutoff)
@@ -0,0 +1,68 @@
+import random
+import timeit
+from algorithms import quick_sort_improved
+
+
+class Counted:
+    """
+    Wraps a value and counts the comparisons made on all the wrapped values.
+    """
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __le__(self, other):
+        Counted.comparisons += 1
+        return self.value <= other.value
+
+def count_comparisons(data: list, **options) -> int:
+    """
+    Sort a wrapped copy of data and return the number of comparisons.
+    """
+    wrapped = [Counted(x) for x in data]
+    Counted.comparisons = 0
+    quick_sort_improved(wrapped, **options)
+    return Counted.comparisons
+
+def benchmark() -> None:
+    """
+    Compare the single-pivot partition with the dual-pivot partition,
+    then the cutoff sizes below which subarrays are sorted with binary insertion sort
+    """
+    repeat = 3
+    modes = [("partition", {}), ("dual pivot", {"dual_pivot": True})]
+    inputs = [
+        ("random", lambda n: [random.random() for _ in range(n)]),
+        ("few unique", lambda n: [random.randint(0, 10) for _ in range(n)]),
+    ]
+
+    print(f"{'input':<11} {'n':>8} {'mode':<11} {'time (s)':>9} {'compares':>10}")
+    for n in (10_000, 100_000):
+        for name, make in inputs:
+            data = make(n)
+            for mode, options in modes:
+                elapsed = min(timeit.repeat(lambda: quick_sort_improved(data[:], **options), number=1, repeat=repeat))
+                compares = count_comparisons(data, **options)
+                print(f"{name:<11} {n:>8} {mode:<11} {elapsed:>9.4f} {compares:>10}")
+
+    print()
+    print(f"{'input':<11} {'n':>8} {'cutoff':>7} {'time (s)':>9} {'compares':>10}")
+    for n in (10_000, 100_000):
+        for name, make in inputs:
+            data = make(n)
+            for cutoff in (4, 7, 10, 16, 24, 32, 48, 64):
+                elapsed = min(timeit.repeat(lambda: quick_sort_improved(data[:], cutoff=cutoff), number=1, repeat=repeat))
+                compares = count_comparisons(data, cutoff=cutoff)
+                print(f"{name:<11} {n:>8} {cutoff:>7} {elapsed:>9.4f} {compares:>10}")
+
+if __name__ == "__main__":
+    benchmark()
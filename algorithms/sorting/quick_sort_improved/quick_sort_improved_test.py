@@ -2,6 +2,7 @@ import unittest
 import random
 from copy import deepcopy
 from algorithms import quick_sort_improved
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import introsort, ninther, partition_dual_pivot
 
 
 class TestSort(unittest.TestCase):
@@ -52,5 +53,90 @@ class TestSort(unittest.TestCase):
             quick_sort_improved("not a list")
 
 
+class TestIntrosort(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        quick_sort_improved(data, introsort_mode=True)
+        self.assertEqual(data, [])
+
+    def test_random(self):
+        n = 1000
+        data = [random.randint(-100, 100) for _ in range(n)]
+        copy = deepcopy(data)
+        quick_sort_improved(data, introsort_mode=True)
+        self.assertEqual(data, sorted(copy))
+
+    def test_patterns(self):
+        n = 2000
+        patterns = [
+            list(range(n)),
+            list(range(n, 0, -1)),
+            list(range(n // 2)) + list(range(n // 2, 0, -1)),
+            [i % 7 for i in range(n)],
+            [1] * n,
+        ]
+        for data in patterns:
+            copy = deepcopy(data)
+            quick_sort_improved(data, introsort_mode=True)
+            self.assertEqual(data, sorted(copy))
+
+    def test_heapsort_fallback(self):
+        # With no partitioning levels left, the subarray is sorted by Heapsort
+        data = [random.randint(-100, 100) for _ in range(100)]
+        copy = deepcopy(data)
+        introsort(data, 10, 89, 0)
+        self.assertEqual(data, copy[:10] + sorted(copy[10:90]) + copy[90:])
+
+
+class TestDualPivot(unittest.TestCase):
+    def test_empty_list(self):
+        data = []
+        quick_sort_improved(data, dual_pivot=True)
+        self.assertEqual(data, [])
+
+    def test_random(self):
+        n = 1000
+        data = [random.randint(-100, 100) for _ in range(n)]
+        copy = deepcopy(data)
+        quick_sort_improved(data, dual_pivot=True)
+        self.assertEqual(data, sorted(copy))
+
+    def test_few_unique(self):
+        n = 1000
+        data = [random.randint(0, 2) for _ in range(n)]
+        copy = deepcopy(data)
+        quick_sort_improved(data, dual_pivot=True)
+        self.assertEqual(data, sorted(copy))
+
+    def test_partition_dual_pivot(self):
+        data = [random.randint(-100, 100) for _ in range(200)]
+        lt, gt = partition_dual_pivot(data, 0, len(data) - 1)
+        self.assertTrue(all(x < data[lt] for x in data[:lt]))
+        self.assertTrue(all(data[lt] <= x <= data[gt] for x in data[lt + 1:gt]))
+        self.assertTrue(all(x > data[gt] for x in data[gt + 1:]))
+
+    def test_ninther(self):
+        data = list(range(100))
+        self.assertEqual(data[ninther(0, 99, data)], 49)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            quick_sort_improved([1, 2], introsort_mode=True, dual_pivot=True)
+
+
+class TestCutoff(unittest.TestCase):
+    def test_modes(self):
+        data = [random.randint(-100, 100) for _ in range(300)]
+        for options in ({}, {"introsort_mode": True}, {"dual_pivot": True}):
+            for cutoff in (1, 2, 16, 64, 500):
+                copy = deepcopy(data)
+                quick_sort_improved(copy, cutoff=cutoff, **options)
+                self.assertEqual(copy, sorted(data))
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            quick_sort_improved([1, 2], cutoff=0)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
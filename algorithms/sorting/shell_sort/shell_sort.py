@@ -1,4 +1,124 @@
-def shell_sort(data: list) -> None:
+import math
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it is only needed for the ndarray fast path
+    np = None
+
+
+# Gaps below this are h-sorted on a Python list, since NumPy only pays off on wide rows
+NP_MIN_GAP = 256
+
+# Ciura's experimentally determined gaps, extended by a factor of 2.25
+_CIURA = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+
+
+def gap_sequence(name: str, n: int) -> List[int]:
+    """
+    Return the gaps of the sequence smaller than n, in decreasing order.
+
+    Sequences:
+        'knuth': (3^k - 1) / 2 = 1, 4, 13, 40, ... (3x + 1), from the first gap >= n / 3.
+        'ciura': 1, 4, 10, 23, 57, 132, 301, 701, 1750, then x * 2.25.
+        'sedgewick': 4^k + 3 * 2^(k-1) + 1 = 1, 8, 23, 77, 281, ...
+        'tokuda': ceil((9^k - 4^k) / (5 * 4^(k-1))) = 1, 4, 9, 20, 46, 103, ...
+
+    Args:
+        name (str): The name of the sequence.
+        n (int): The number of items to be sorted.
+
+    Returns:
+        List[int]: The gaps, ending with 1.
+
+    Raises:
+        ValueError: If the sequence is unknown.
+    """
+    gaps = [1]
+
+    if name == 'knuth':
+        while gaps[-1] < n / 3:
+            gaps.append(gaps[-1] * 3 + 1)
+
+    elif name == 'ciura':
+        gaps = list(_CIURA)
+        while gaps[-1] < n:
+            gaps.append(int(gaps[-1] * 2.25))
+
+    elif name == 'sedgewick':
+        k = 1
+        while gaps[-1] < n:
+            gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+            k += 1
+
+    elif name == 'tokuda':
+        k = 2
+        while gaps[-1] < n:
+            gaps.append(math.ceil((9 ** k - 4 ** k) / (5 * 4 ** (k - 1))))
+            k += 1
+
+    else:
+        raise ValueError("ValueError: Unknown gap sequence.")
+
+    return [h for h in reversed(gaps) if h < n or h == 1]
+
+def _h_sort(data: list, h: int) -> None:
+    """
+    Sort every h-interleaved subsequence of the list with insertion sort,
+    shifting the larger items right and writing the new item once.
+
+    Args:
+        data (list): The list of elements to be h-sorted.
+        h (int): The gap.
+
+    Note:
+        This function modifies the original list.
+    """
+    for i in range(h, len(data)):
+        item = data[i]
+        j = i
+
+        # The limit is h-1, then when we check item < data[j - h], data[0] is the last to check
+        while j >= h and item < data[j - h]:
+            data[j] = data[j - h]
+            j -= h
+
+        data[j] = item
+
+def _h_sort_ndarray(data: 'np.ndarray', h: int) -> None:
+    """
+    Sort every h-interleaved subsequence of a 1-D contiguous NumPy array at once.
+
+    Row r of the array seen as rows of h items holds the r-th item of every subsequence.
+    Insertion sort inserts row r into the rows above it, comparing and swapping whole
+    rows of strided views, so every subsequence advances in the same vectorized step.
+
+    Args:
+        data (np.ndarray): The array to be h-sorted.
+        h (int): The gap.
+
+    Note:
+        This function modifies the original array.
+    """
+    n = len(data)
+
+    for i in range(h, n, h):
+        cols = min(h, n - i)  # The last row may be partial
+        j = i
+
+        while j >= h:
+            cur = data[j:j + cols]
+            prev = data[j - h:j - h + cols]
+            mask = cur < prev
+            if not mask.any():
+                break
+
+            tmp = cur[mask]
+            cur[mask] = prev[mask]
+            prev[mask] = tmp
+            j -= h
+
+def shell_sort(data: list, gaps: str = 'knuth') -> None:
     """
     Sort a list of elements in ascending order using the shell sort algorithm.
 
@@ -7,35 +127,46 @@ def shell_sort(data: list) -> None:
         Exchanges: Depends on the gap sequence; typically better than O(N^2).
 
     Gap sequence:
-        Hibbard's sequence (3x + 1).
+        Knuth's sequence (3x + 1) by default; 'ciura', 'sedgewick' and 'tokuda'
+        are also available, see gap_sequence.
+
+    NumPy arrays:
+        A 1-D numeric numpy.ndarray is h-sorted with vectorized operations on all
+        the h-interleaved subsequences at once for the large gaps, then as a list
+        for the gaps below NP_MIN_GAP.
 
     Args:
-        data (list): The list of elements to be sorted.
+        data (list): The list (or 1-D NumPy array) of elements to be sorted.
+        gaps (str): The name of the gap sequence.
 
     Raises:
-        ValueError: If the argument is not a list.
+        ValueError: If the argument is not a list or a 1-D NumPy array.
+        ValueError: If the gap sequence is unknown.
 
     Note:
         This function modifies the original list.
     """
-    if not isinstance(data, list):
-        raise ValueError("ValueError: Input must be a list.")
-
-    n = len(data)
-    h = 1
+    if np is not None and isinstance(data, np.ndarray):
+        if data.ndim != 1:
+            raise ValueError("ValueError: Input array must be one-dimensional.")
 
-    while h < n / 3:
+        work = np.array(data)  # Contiguous working copy
+        sequence = gap_sequence(gaps, len(work))
+        for h in sequence:
+            if h >= NP_MIN_GAP:
+                _h_sort_ndarray(work, h)
 
-        # First, we estimate the biggest h we need
-        h = h * 3 + 1
+        # Small gaps move few items over short distances, a list is faster there
+        items = work.tolist()
+        for h in sequence:
+            if h < NP_MIN_GAP:
+                _h_sort(items, h)
+        data[...] = items
+        return
 
-    while h >= 1:
-        for i in range(h, n):
-            for j in range(i, h - 1, - h):
-
-                # The limit is h-1, then when we check data[j] < data[j - h], data[h] < data[0] is the last to check
-                if data[j] < data[j - h]:
-                    data[j], data[j - h] = data[j - h], data[j]
+    if not isinstance(data, list):
+        raise ValueError("ValueError: Input must be a list.")
 
+    for h in gap_sequence(gaps, len(data)):
         # Reduce h to refine the sorting
-        h = h // 3
+        _h_sort(data, h)
@@ -0,0 +1,32 @@
+import random
+import timeit
+from algorithms import shell_sort
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def benchmark() -> None:
+    """
+    Compare the gap sequences of shell sort on lists and NumPy arrays
+    """
+    repeat = 3
+    sequences = ("knuth", "ciura", "sedgewick", "tokuda")
+
+    print(f"{'input':<8} {'n':>8} " + " ".join(f"{name:>10}" for name in sequences))
+    for n in (10_000, 100_000):
+        data = [random.random() for _ in range(n)]
+        times = [min(timeit.repeat(lambda: shell_sort(data[:], gaps=name), number=1, repeat=repeat))
+                 for name in sequences]
+        print(f"{'list':<8} {n:>8} " + " ".join(f"{t:>10.4f}" for t in times))
+
+        if np is not None:
+            array = np.array(data)
+            times = [min(timeit.repeat(lambda: shell_sort(array.copy(), gaps=name), number=1, repeat=repeat))
+                     for name in sequences]
+            print(f"{'ndarray':<8} {n:>8} " + " ".join(f"{t:>10.4f}" for t in times))
+
+if __name__ == "__main__":
+    benchmark()
@@ -2,6 +2,12 @@ import unittest
 import random
 from copy import deepcopy
 from algorithms import shell_sort
+from algorithms.sorting.shell_sort.shell_sort import gap_sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestSort(unittest.TestCase):
@@ -50,6 +56,49 @@ class TestSort(unittest.TestCase):
     def test_input_validation(self):
         with self.assertRaises(ValueError):
             shell_sort("not a list")
+        with self.assertRaises(ValueError):
+            shell_sort([2, 1], gaps="unknown")
+
+    def test_gap_sequences(self):
+        self.assertEqual(gap_sequence("knuth", 100), [40, 13, 4, 1])
+        self.assertEqual(gap_sequence("ciura", 100), [57, 23, 10, 4, 1])
+        self.assertEqual(gap_sequence("sedgewick", 100), [77, 23, 8, 1])
+        self.assertEqual(gap_sequence("tokuda", 100), [46, 20, 9, 4, 1])
+        self.assertEqual(gap_sequence("ciura", 0), [1])
+
+    def test_random_all_sequences(self):
+        n = 1000
+        for gaps in ("knuth", "ciura", "sedgewick", "tokuda"):
+            data = [random.randint(-100, 100) for _ in range(n)]
+            copy = deepcopy(data)
+            shell_sort(data, gaps=gaps)
+            self.assertEqual(data, sorted(copy))
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSortNumpy(unittest.TestCase):
+    def test_random(self):
+        for gaps in ("knuth", "ciura", "sedgewick", "tokuda"):
+            # Large enough for gaps above NP_MIN_GAP
+            data = np.random.randint(-1000, 1000, 5000)
+            expected = np.sort(data)
+            shell_sort(data, gaps=gaps)
+            self.assertTrue(np.array_equal(data, expected))
+
+    def test_floats(self):
+        data = np.random.rand(3000)
+        expected = np.sort(data)
+        shell_sort(data)
+        self.assertTrue(np.array_equal(data, expected))
+
+    def test_small(self):
+        data = np.array([5, 2, 8, 1, 9])
+        shell_sort(data)
+        self.assertEqual(data.tolist(), [1, 2, 5, 8, 9])
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            shell_sort(np.zeros((3, 3)))
 
 
 if __name__ == '__main__':
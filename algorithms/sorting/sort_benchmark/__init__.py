@@ -0,0 +1 @@
+from .sort_benchmark import run_benchmark, write_json
\ No newline at end of file
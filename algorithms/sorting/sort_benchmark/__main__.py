@@ -0,0 +1,4 @@
+from .sort_benchmark import benchmark
+
+
+benchmark()
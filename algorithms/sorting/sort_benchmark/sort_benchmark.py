@@ -0,0 +1,216 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+from algorithms.sorting.block_quick_sort.block_quick_sort import block_quick_sort
+from algorithms.sorting.dijkstra_3way_partition.dijkstra_3way_partition import dijkstra_3way_partition
+from algorithms.sorting.heap_sort.heap_sort import Heapsort
+from algorithms.sorting.insertion_sort.insertion_sort import insertion_sort
+from algorithms.sorting.instrumentation.instrumentation import profile
+from algorithms.sorting.lsd_radix_sort.lsd_radix_sort import lsd_radix_sort
+from algorithms.sorting.merge_sort.merge_sort import merge_sort
+from algorithms.sorting.merge_sort_bottom_up.merge_sort_bottom_up import merge_sort_bottom_up
+from algorithms.sorting.merge_sort_improved.merge_sort_improved import merge_sort_improved
+from algorithms.sorting.msd_radix_sort.msd_radix_sort import msd_radix_sort
+from algorithms.sorting.parallel_merge_sort.parallel_merge_sort import parallel_merge_sort
+from algorithms.sorting.quick_sort.quick_sort import quick_sort
+from algorithms.sorting.quick_sort_improved.quick_sort_improved import quick_sort_improved
+from algorithms.sorting.selection_sort.selection_sort import selection_sort
+from algorithms.sorting.shell_sort.shell_sort import shell_sort
+
+
+# Quadratic sorts are skipped above this size
+QUADRATIC_MAX_N = 2_000
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+class SortCase(NamedTuple):
+    """
+    A sort to benchmark.
+
+    Attributes:
+        sort (Callable[[list], None]): Sorts the list in place.
+        comparisons (bool): False if the comparisons cannot be counted, for radix sorts,
+            which read digits, and for sorts that compare in other processes.
+        max_n (Optional[int]): The largest size to run, None for no limit.
+    """
+    sort: Callable[[list], None]
+    comparisons: bool = True
+    max_n: Optional[int] = None
+
+
+# Sorts of lists of non-negative integers. quick_3way_string only sorts strings and
+# external_sort sorts files, they are not part of the suite.
+SORTS: Dict[str, SortCase] = {
+    "block_quick_sort": SortCase(block_quick_sort),
+    "dijkstra_3way_partition": SortCase(dijkstra_3way_partition),
+    "heap_sort": SortCase(Heapsort),
+    "insertion_sort": SortCase(insertion_sort, max_n=QUADRATIC_MAX_N),
+    "lsd_radix_sort": SortCase(lsd_radix_sort, comparisons=False),
+    "merge_sort": SortCase(merge_sort),
+    "merge_sort_bottom_up": SortCase(merge_sort_bottom_up),
+    "merge_sort_bottom_up_adaptive": SortCase(lambda a: merge_sort_bottom_up(a, adaptive=True)),
+    "merge_sort_improved": SortCase(merge_sort_improved),
+    "msd_radix_sort": SortCase(msd_radix_sort, comparisons=False),
+    "parallel_merge_sort": SortCase(parallel_merge_sort, comparisons=False),
+    "quick_sort": SortCase(quick_sort),
+    "quick_sort_improved": SortCase(quick_sort_improved),
+    "quick_sort_improved_dual_pivot": SortCase(lambda a: quick_sort_improved(a, dual_pivot=True)),
+    "quick_sort_improved_introsort": SortCase(lambda a: quick_sort_improved(a, introsort_mode=True)),
+    "selection_sort": SortCase(selection_sort, max_n=QUADRATIC_MAX_N),
+    "shell_sort": SortCase(shell_sort),
+}
+
+# Input shapes, each one builds a list of n non-negative integers
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[int]]] = {
+    "random": lambda n, rng: [rng.randrange(n) for _ in range(n)],
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n - 1, -1, -1)),
+    "few_unique": lambda n, rng: [rng.randrange(10) for _ in range(n)],
+    "organ_pipe": lambda n, rng: [min(i, n - 1 - i) for i in range(n)],
+    "sawtooth": lambda n, rng: [i % max(1, n // 10) for i in range(n)],
+}
+
+
+def count_operations(case: SortCase, data: List[int]) -> Dict[str, Optional[int]]:
+    """
+    Sort an instrumented copy of data and count the operations made on it.
+
+    Args:
+        case (SortCase): The sort to run.
+        data (List[int]): The input.
+
+    Returns:
+        Dict[str, Optional[int]]: The comparisons, reads, writes, swaps and recursion depth,
+        the comparisons are None if they cannot be counted.
+
+    Raises:
+        AssertionError: If the sort does not sort the input.
+    """
+    values, counters = profile(case.sort, data, wrap_items=case.comparisons)
+
+    if values != sorted(data):
+        raise AssertionError("AssertionError: The sort returned an unsorted list.")
+
+    counts = counters.as_dict()
+    if not case.comparisons:
+        counts["comparisons"] = None
+    return counts
+
+def run_benchmark(sorts: Optional[Iterable[str]] = None, distributions: Optional[Iterable[str]] = None,
+                  sizes: Iterable[int] = DEFAULT_SIZES, repeat: int = 3, seed: int = 0,
+                  counts: bool = True) -> List[Dict[str, Any]]:
+    """
+    Run every sort over every input distribution and size.
+
+    The wall time is the best of `repeat` runs on plain integers. The counts come from
+    one more run on an instrumented copy of the input, see instrumentation.profile.
+
+    Args:
+        sorts (Optional[Iterable[str]]): Names of SORTS to run, all of them by default.
+        distributions (Optional[Iterable[str]]): Names of DISTRIBUTIONS to use, all of them by default.
+        sizes (Iterable[int]): The input sizes.
+        repeat (int): The number of timed runs.
+        seed (int): Seed of the random inputs, so that runs can be compared.
+        counts (bool): If False, only the wall time is measured.
+
+    Raises:
+        ValueError: If a sort or a distribution is unknown.
+
+    Returns:
+        List[Dict[str, Any]]: One record per sort, distribution and size, with the keys
+        sort, distribution, n, time, comparisons, reads, writes, swaps and depth.
+    """
+    sorts = list(SORTS) if sorts is None else list(sorts)
+    distributions = list(DISTRIBUTIONS) if distributions is None else list(distributions)
+
+    for name in sorts:
+        if name not in SORTS:
+            raise ValueError(f"ValueError: Unknown sort {name}.")
+    for name in distributions:
+        if name not in DISTRIBUTIONS:
+            raise ValueError(f"ValueError: Unknown distribution {name}.")
+
+    results = []
+    for n in sizes:
+        for distribution in distributions:
+            data = DISTRIBUTIONS[distribution](n, random.Random(seed))
+
+            for name in sorts:
+                case = SORTS[name]
+                if case.max_n is not None and n > case.max_n:
+                    continue
+
+                elapsed = min(timeit.repeat(lambda: case.sort(data[:]), number=1, repeat=repeat))
+                record = {"sort": name, "distribution": distribution, "n": n, "time": elapsed}
+                if counts:
+                    record.update(count_operations(case, data))
+                results.append(record)
+
+    return results
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    """
+    Print the results as a table.
+
+    Args:
+        results (List[Dict[str, Any]]): The records returned by run_benchmark.
+    """
+    def fmt(value: Optional[int]) -> str:
+        return "-" if value is None else str(value)
+
+    print(f"{'sort':<31} {'input':<11} {'n':>8} {'time (s)':>9} {'compares':>10} {'reads':>10} "
+          f"{'writes':>10} {'swaps':>9} {'depth':>6}")
+    for r in results:
+        print(f"{r['sort']:<31} {r['distribution']:<11} {r['n']:>8} {r['time']:>9.4f} "
+              f"{fmt(r.get('comparisons')):>10} {fmt(r.get('reads')):>10} {fmt(r.get('writes')):>10} "
+              f"{fmt(r.get('swaps')):>9} {fmt(r.get('depth')):>6}")
+
+def write_json(results: List[Dict[str, Any]], path: str) -> None:
+    """
+    Write the results with the details of the environment to a JSON file.
+
+    Args:
+        results (List[Dict[str, Any]]): The records returned by run_benchmark.
+        path (str): The path of the output file.
+    """
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+def benchmark(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the benchmark suite from the command line, print the table and optionally write JSON.
+
+    Usage:
+        python -m algorithms.sorting.sort_benchmark --sizes 1000 10000 --json results.json
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms.")
+    parser.add_argument("--sorts", nargs="+", choices=sorted(SORTS), help="sorts to run, all by default")
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS), help="input shapes, all by default")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="input sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs, the best one is reported")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random inputs")
+    parser.add_argument("--no-counts", action="store_true", help="only measure the wall time")
+    parser.add_argument("--json", metavar="PATH", help="write the results to a JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.sorts, args.distributions, args.sizes, args.repeat, args.seed, not args.no_counts)
+    print_table(results)
+
+    if args.json:
+        write_json(results, args.json)
+
+if __name__ == "__main__":
+    benchmark()
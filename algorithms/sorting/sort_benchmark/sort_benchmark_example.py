@@ -0,0 +1,21 @@
+from algorithms import run_benchmark
+from algorithms.sorting.sort_benchmark.sort_benchmark import print_table
+
+
+def demo() -> None:
+    """
+    Example usage
+    """
+    help(run_benchmark)
+
+    print("Example 1.")
+    results = run_benchmark(["merge_sort_improved", "quick_sort_improved", "heap_sort"], ["random", "sorted"], [1000])
+    print_table(results)
+
+    print("\nExample 2.")
+    results = run_benchmark(["insertion_sort", "merge_sort_bottom_up_adaptive"], ["sawtooth"], [1000])
+    print_table(results)
+
+
+if __name__ == "__main__":
+    demo()
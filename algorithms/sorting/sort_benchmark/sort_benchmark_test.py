@@ -0,0 +1,64 @@
+import unittest
+import json
+import os
+import random
+import tempfile
+from algorithms import run_benchmark, write_json
+from algorithms.sorting.sort_benchmark.sort_benchmark import DISTRIBUTIONS, SORTS, count_operations
+
+
+class TestSortBenchmark(unittest.TestCase):
+    def test_distributions(self):
+        for name, make in DISTRIBUTIONS.items():
+            data = make(100, random.Random(0))
+            self.assertEqual(len(data), 100)
+            self.assertTrue(all(isinstance(x, int) and x >= 0 for x in data))
+
+    def test_all_sorts(self):
+        results = run_benchmark(sizes=[60], repeat=1)
+        self.assertEqual(len(results), len(SORTS) * len(DISTRIBUTIONS))
+        for record in results:
+            self.assertEqual(set(record), {"sort", "distribution", "n", "time", "comparisons", "reads", "writes",
+                                           "swaps", "depth"})
+            self.assertGreaterEqual(record["time"], 0)
+
+    def test_quadratic_limit(self):
+        results = run_benchmark(["insertion_sort", "shell_sort"], ["random"], sizes=[10_000], repeat=1, counts=False)
+        self.assertEqual([record["sort"] for record in results], ["shell_sort"])
+
+    def test_counts(self):
+        n = 100
+        counts = count_operations(SORTS["insertion_sort"], list(range(n)))
+        self.assertEqual(counts["comparisons"], n - 1)
+        self.assertEqual(counts["writes"], 0)
+        self.assertEqual(counts["swaps"], 0)
+
+        counts = count_operations(SORTS["insertion_sort"], list(range(n, 0, -1)))
+        self.assertEqual(counts["comparisons"], n * (n - 1) // 2)
+
+        counts = count_operations(SORTS["selection_sort"], list(range(n, 0, -1)))
+        self.assertEqual(counts["comparisons"], n * (n - 1) // 2)
+        self.assertLessEqual(counts["swaps"], n)
+
+        counts = count_operations(SORTS["lsd_radix_sort"], list(range(n)))
+        self.assertIsNone(counts["comparisons"])
+
+    def test_json(self):
+        results = run_benchmark(["heap_sort"], ["sorted", "sawtooth"], sizes=[50], repeat=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            write_json(results, path)
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+        self.assertEqual(report["results"], results)
+        self.assertIn("python", report)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            run_benchmark(["bogo_sort"], sizes=[10])
+        with self.assertRaises(ValueError):
+            run_benchmark(distributions=["zigzag"], sizes=[10])
+
+
+if __name__ == '__main__':
+    unittest.main()
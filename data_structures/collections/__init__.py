@@ -1,5 +1,7 @@
 from .binary_heap import *
 from .deque import *
+from .index_priority_queue import *
+from .pairing_heap import *
 from .queue import *
 from .randomized_queue import *
 from .stack import *
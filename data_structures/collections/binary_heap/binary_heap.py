@@ -1,14 +1,25 @@
-from typing import Any, Iterator, List, Union
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
 
 
 class BinaryHeap:
     """
-    A binary heap implementation (max-heap) using an array.
+    A binary heap implementation (max-heap or min-heap) using an array.
+
+    Order and key:
+        order='min' keeps the smallest value at the root, then del_max and peek_max
+        return the minimum. With key, values are ordered by key(value), the key of
+        every value is computed once on insertion and cached in an array parallel to
+        the values, so the values themselves are never compared and need no wrapper.
 
     Methods:
         del_max(): Removes and returns the maximum value from the heap.
+        drain(): Returns an iterator that removes the values from the heap, largest first.
+        from_iterable(items): Builds a heap from an iterable in linear time (class method).
         insert(new_value): Inserts a new value into the heap.
         peek_max(): Returns the maximum value from the heap.
+        pop_many(k): Removes and returns the k largest values from the heap.
+        push_many(items): Inserts all the values of an iterable into the heap.
 
     Special Methods:
         __getitem__(index): Allows indexing, supports both integer indices and slice objects.
@@ -26,46 +37,134 @@ class BinaryHeap:
             self.message = message
             super().__init__(self.message)
 
-    def __init__(self: 'BinaryHeap') -> None:
+    def __init__(self: 'BinaryHeap', order: str = "max", key: Optional[Callable[[Any], Any]] = None) -> None:
         """
         Initializes an empty binary heap.
+
+        Args:
+            order (str): 'max' for a max-heap, 'min' for a min-heap.
+            key (Optional[Callable[[Any], Any]]): Function that extracts the comparison key from each value.
+
+        Raises:
+            ValueError: If the order is not 'max' or 'min'.
         """
+        if order not in ("max", "min"):
+            raise ValueError("ValueError: Order must be 'max' or 'min'.")
+
         self._list: list = [None]
         self._n: int = 0
+        self._key: Optional[Callable[[Any], Any]] = key
+        self._reverse: bool = order == "min"
+
+        # Cached keys, parallel to the values. Without key, the values are their own keys
+        self._keys: list = self._list if key is None else [None]
+
+    def _place(self: 'BinaryHeap', i: int, value: Any, key: Any) -> None:
+        """
+        Writes a value and its cached key at index i. Every move made by _swim and
+        _sink_hole goes through it, subclasses override it to track where the values are.
+
+        Args:
+            i (int): The index to write to.
+            value (Any): The value.
+            key (Any): The cached key of the value, the value itself without key.
+        """
+        self._list[i] = value
+        if self._keys is not self._list:
+            self._keys[i] = key
 
     def _swim(self: 'BinaryHeap', k: int) -> None:
         """
         Restores the heap order property by swimming up the element at index k.
+        The smaller parents move down into the hole until the element fits.
 
         Args:
             k (int): The index of the element to swim up.
         """
-        while k > 1 and self._list[k // 2] < self._list[k]:
-            self._list[k // 2], self._list[k] = self._list[k], self._list[k // 2]
-            k = k // 2
+        values, keys = self._list, self._keys
+        value, key = values[k], keys[k]
 
-    def _sink(self: 'BinaryHeap', k: int) -> None:
+        if self._reverse:
+            while k > 1 and key < keys[k // 2]:
+                self._place(k, values[k // 2], keys[k // 2])
+                k = k // 2
+        else:
+            while k > 1 and keys[k // 2] < key:
+                self._place(k, values[k // 2], keys[k // 2])
+                k = k // 2
+
+        self._place(k, value, key)
+
+    def _sink_hole(self: 'BinaryHeap', k: int, value: Any, key: Any) -> None:
         """
-        Restores the heap order property by sinking down the element at index k.
+        Sinks a value down from the hole at index k: the larger child moves up into
+        the hole until the value fits, then the value is written once.
 
         Args:
-            k (int): The index of the element to sink down.
+            k (int): The index of the hole.
+            value (Any): The value to be placed.
+            key (Any): The cached key of the value.
         """
-        while 2 * k <= self._n:
+        values, keys = self._list, self._keys
+        n = self._n
+        reverse = self._reverse
+
+        while 2 * k <= n:
             j = 2 * k
 
-            # Find the larger child
-            if j < self._n and self._list[j] < self._list[j + 1]:
+            # Find the larger child (smaller for a min-heap)
+            if j < n and (keys[j + 1] < keys[j] if reverse else keys[j] < keys[j + 1]):
                 j += 1
 
-            # If the parent is larger than the largest child, stop sinking
-            if self._list[k] > self._list[j]:
+            # If the value is larger than the largest child, stop sinking
+            if key < keys[j] if reverse else keys[j] < key:
                 break
 
-            # Swap the parent with the largest child
-            self._list[k], self._list[j] = self._list[j], self._list[k]
+            # Move the largest child up into the hole
+            self._place(k, values[j], keys[j])
             k = j
 
+        self._place(k, value, key)
+
+    def _sink(self: 'BinaryHeap', k: int) -> None:
+        """
+        Restores the heap order property by sinking down the element at index k.
+
+        Args:
+            k (int): The index of the element to sink down.
+        """
+        self._sink_hole(k, self._list[k], self._keys[k])
+
+    def _pop_last(self: 'BinaryHeap') -> tuple:
+        """
+        Removes the last value of the heap and its cached key.
+
+        Returns:
+            tuple: The value and its key.
+        """
+        value = self._list.pop()
+        key = self._keys.pop() if self._keys is not self._list else value
+        self._n -= 1
+        return value, key
+
+    def _heapify(self: 'BinaryHeap', start: int) -> None:
+        """
+        Restores the heap order property after the elements at indices start + 1 to N were appended.
+
+        A batch at least as large as the heap is merged bottom-up, sinking every
+        parent from N // 2 down to the root, which is O(N). A smaller batch is
+        swum up element by element, O(M log N) for M new elements.
+
+        Args:
+            start (int): The number of elements in the heap before the batch was appended.
+        """
+        if self._n - start >= start:
+            for k in range(self._n // 2, 0, -1):
+                self._sink(k)
+        else:
+            for k in range(start + 1, self._n + 1):
+                self._swim(k)
+
     def insert(self: 'BinaryHeap', new_value: Any) -> None:
         """
         Inserts a new value into the heap.
@@ -79,6 +178,9 @@ class BinaryHeap:
         if new_value is None:
             raise ValueError("ValueError: Invalid value.")
 
+        if self._keys is not self._list:
+            self._keys.append(self._key(new_value))
+
         self._list.append(new_value)
         self._n += 1
         self._swim(self._n)
@@ -96,12 +198,100 @@ class BinaryHeap:
         if self._n == 0:
             raise self.HeapEmptyError()
 
-        self._list[1], self._list[-1] = self._list[-1], self._list[1]
-        val = self._list.pop()
-        self._n -= 1
-        self._sink(1)
+        val = self._list[1]
+
+        # Sink the last value from the root
+        last, last_key = self._pop_last()
+        if self._n > 0:
+            self._sink_hole(1, last, last_key)
         return val
 
+    @classmethod
+    def from_iterable(cls: type, items: Iterable[Any], **kwargs: Any) -> 'BinaryHeap':
+        """
+        Builds a heap from an iterable bottom-up (Floyd's heap construction).
+
+        Performance:
+            Time complexity: O(N), against O(N log N) for N calls to insert
+
+        Args:
+            items (Iterable[Any]): The values of the heap.
+            **kwargs (Any): Arguments of the constructor, such as order and key.
+
+        Returns:
+            BinaryHeap: The new heap.
+
+        Raises:
+            ValueError: If a value is None.
+        """
+        heap = cls(**kwargs)
+        heap.push_many(items)
+        return heap
+
+    def push_many(self: 'BinaryHeap', items: Iterable[Any]) -> None:
+        """
+        Inserts all the values of an iterable into the heap, see _heapify.
+
+        Args:
+            items (Iterable[Any]): The values to be inserted into the heap.
+
+        Raises:
+            ValueError: If a value is None, then no value is inserted.
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("ValueError: Invalid value.")
+
+        if self._keys is not self._list:
+            self._keys.extend([self._key(item) for item in items])
+
+        start = self._n
+        self._list.extend(items)
+        self._n += len(items)
+        self._heapify(start)
+
+    def pop_many(self: 'BinaryHeap', k: int) -> List[Any]:
+        """
+        Removes and returns the k largest values from the heap.
+
+        One loop for the whole batch, without the checks of del_max: the last value
+        sinks from the root through a hole (see _sink_hole).
+
+        Args:
+            k (int): The number of values to remove.
+
+        Returns:
+            List[Any]: The k largest values in descending order, the k smallest in ascending order for a min-heap.
+
+        Raises:
+            ValueError: If k is not between 0 and the number of items in the heap.
+        """
+        if not isinstance(k, int) or k < 0 or k > self._n:
+            raise ValueError("ValueError: k must be between 0 and the number of items in the heap.")
+
+        result = []
+        for _ in range(k):
+            result.append(self._list[1])
+            last, last_key = self._pop_last()
+            if self._n > 0:
+                self._sink_hole(1, last, last_key)
+
+        return result
+
+    def drain(self: 'BinaryHeap') -> Iterator[Any]:
+        """
+        Returns an iterator that removes the values from the heap, largest first.
+
+        The values are popped lazily, one del_max per step, so reading the first k
+        values costs O(k log N) instead of sorting the whole heap. Values that are
+        not read stay in the heap.
+
+        Returns:
+            Iterator[Any]: The values in descending order, ascending for a min-heap.
+        """
+        while self._n > 0:
+            yield self.del_max()
+
     def peek_max(self: 'BinaryHeap') -> Any:
         """
         Returns the maximum value from the heap.
@@ -126,8 +316,27 @@ class BinaryHeap:
 
         Returns:
             Union[Any, List[Any]]: The item at the specified index or a list of items for the specified slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+            TypeError: If the argument is not an integer or slice.
+
+        Note:
+            Index i of the heap is index i + 1 of the backing list, only a slice copies items.
         """
-        return self._list[1:][index]
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._n)
+            return self._list[start + 1:stop + 1:step]
+
+        if not isinstance(index, int):
+            raise TypeError("TypeError: Index must be an integer or slice.")
+
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("IndexError: Index out of range.")
+
+        return self._list[index + 1]
 
     def __iter__(self: 'BinaryHeap') -> Iterator[Any]:
         """
@@ -136,7 +345,7 @@ class BinaryHeap:
         Returns:
             Iterator[Any]: Iterator over the heap's elements.
         """
-        return iter(self._list[1::])
+        return islice(self._list, 1, None)
 
     def __len__(self: 'BinaryHeap') -> int:
         """
@@ -154,7 +363,7 @@ class BinaryHeap:
         Returns:
             str: The string representation of the heap.
         """
-        return f"{self._list[1::]}"
+        return f"[{', '.join(map(repr, self))}]"
 
     def __reversed__(self: 'BinaryHeap') -> Iterator[Any]:
         """
@@ -163,4 +372,4 @@ class BinaryHeap:
         Returns:
             Iterator[Any]: Reversed iterator over the heap's elements.
         """
-        return reversed(self._list[1::])
\ No newline at end of file
+        return islice(reversed(self._list), self._n)
\ No newline at end of file
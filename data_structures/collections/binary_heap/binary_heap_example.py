@@ -56,6 +56,19 @@ def demo():
     index = -1
     print(f"Element in the index {index}:", heap[index])
 
+    # Min-heap of tasks ordered by a field, the keys are computed once
+    tasks = [("write", 3), ("test", 2), ("deploy", 5), ("review", 1)]
+    min_heap = BinaryHeap.from_iterable(tasks, order="min", key=lambda task: task[1])
+    print("Tasks by ascending cost:", min_heap.pop_many(len(min_heap)))
+
+    # Read the largest values lazily, the rest stay in the heap
+    heap = BinaryHeap.from_iterable(range(100))
+    for value in heap.drain():
+        if value < 97:
+            break
+        print("Drained:", value)
+    print("Items left in the heap:", len(heap))  # Output: 96
+
 
 if __name__ == "__main__":
     demo()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unittest
+import random
 from data_structures import BinaryHeap
 
 
@@ -49,6 +50,121 @@ class TestBinaryHeap(unittest.TestCase):
         with self.assertRaises(ValueError):
             heap.insert(None)
 
+    def assertHeapOrdered(self, heap):
+        for k in range(2, len(heap) + 1):
+            self.assertFalse(heap[k // 2 - 1] < heap[k - 1])
+
+    def test_from_iterable(self):
+        data = [random.randint(0, 100) for _ in range(1000)]
+        heap = BinaryHeap.from_iterable(data)
+        self.assertEqual(len(heap), 1000)
+        self.assertHeapOrdered(heap)
+        self.assertEqual(heap.pop_many(1000), sorted(data, reverse=True))
+
+    def test_from_iterable_empty(self):
+        heap = BinaryHeap.from_iterable([])
+        self.assertEqual(len(heap), 0)
+        heap.insert(1)
+        self.assertEqual(heap.peek_max(), 1)
+
+    def test_push_many(self):
+        heap = BinaryHeap()
+        data = []
+        for size in (1, 5, 50, 3, 500, 10):
+            batch = [random.random() for _ in range(size)]
+            data.extend(batch)
+            heap.push_many(batch)
+            self.assertHeapOrdered(heap)
+        self.assertEqual(heap.pop_many(len(data)), sorted(data, reverse=True))
+
+    def test_pop_many(self):
+        heap = BinaryHeap.from_iterable([5, 1, 9, 3, 7])
+        self.assertEqual(heap.pop_many(0), [])
+        self.assertEqual(heap.pop_many(2), [9, 7])
+        self.assertEqual(len(heap), 3)
+        with self.assertRaises(ValueError):
+            heap.pop_many(4)
+
+    def test_pop_many_partial(self):
+        for order, key in (("max", None), ("min", None), ("max", lambda x: -x), ("min", lambda x: x % 10)):
+            data = [random.randint(0, 100) for _ in range(300)]
+            heap = BinaryHeap.from_iterable(data, order=order, key=key)
+            popped = heap.pop_many(100)
+            rest = [heap.del_max() for _ in range(200)]
+            ordered = sorted(data, key=key, reverse=order == "max")
+            sort_key = key or (lambda x: x)
+            self.assertEqual([sort_key(x) for x in popped + rest], [sort_key(x) for x in ordered])
+
+    def test_none_push_many(self):
+        heap = BinaryHeap()
+        with self.assertRaises(ValueError):
+            heap.push_many([1, None])
+        self.assertEqual(len(heap), 0)
+
+    def test_min_order(self):
+        data = [random.randint(0, 100) for _ in range(500)]
+        heap = BinaryHeap(order="min")
+        for x in data:
+            heap.insert(x)
+        self.assertEqual(heap.peek_max(), min(data))
+        self.assertEqual(heap.pop_many(500), sorted(data))
+
+    def test_key(self):
+        jobs = [{"name": f"job{i}", "priority": random.randint(0, 20)} for i in range(300)]
+        heap = BinaryHeap(key=lambda job: job["priority"])
+        for job in jobs[:100]:
+            heap.insert(job)
+        heap.push_many(jobs[100:])
+        priorities = [job["priority"] for job in heap.pop_many(300)]
+        self.assertEqual(priorities, sorted(priorities, reverse=True))
+
+    def test_key_computed_once(self):
+        calls = []
+        def key(x):
+            calls.append(x)
+            return -x
+        heap = BinaryHeap.from_iterable(range(100), order="min", key=key)
+        for x in range(100, 200):
+            heap.insert(x)
+        self.assertEqual(heap.pop_many(3), [199, 198, 197])
+        self.assertEqual(len(calls), 200)
+
+    def test_invalid_order(self):
+        with self.assertRaises(ValueError):
+            BinaryHeap(order="ascending")
+
+    def test_getitem(self):
+        heap = BinaryHeap.from_iterable(range(20))
+        items = list(heap)
+        self.assertEqual(heap[0], 19)
+        self.assertEqual(heap[-1], items[-1])
+        for index in (slice(None), slice(3, 8), slice(None, None, -1), slice(10, 2, -3), slice(-5, None),
+                      slice(None, -25), slice(50, None, -2)):
+            self.assertEqual(heap[index], items[index])
+        with self.assertRaises(IndexError):
+            heap[20]
+        with self.assertRaises(IndexError):
+            heap[-21]
+        with self.assertRaises(TypeError):
+            heap["0"]
+
+    def test_iter(self):
+        heap = BinaryHeap.from_iterable([3, 1, 4, 1, 5])
+        self.assertEqual(list(heap), heap[:])
+        self.assertEqual(list(reversed(heap)), heap[::-1])
+        self.assertIn(4, heap)
+        self.assertNotIn(2, heap)
+        self.assertEqual(list(reversed(BinaryHeap())), [])
+
+    def test_drain(self):
+        data = [random.randint(0, 100) for _ in range(200)]
+        heap = BinaryHeap.from_iterable(data)
+        drain = heap.drain()
+        self.assertEqual([next(drain) for _ in range(5)], sorted(data, reverse=True)[:5])
+        self.assertEqual(len(heap), 195)
+        self.assertEqual(list(drain), sorted(data, reverse=True)[5:])
+        self.assertEqual(len(heap), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
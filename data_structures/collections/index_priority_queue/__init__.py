@@ -0,0 +1 @@
+from .index_priority_queue import IndexMaxPQ, IndexMinPQ
\ No newline at end of file
@@ -0,0 +1,285 @@
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+from data_structures.collections.binary_heap.binary_heap import BinaryHeap
+
+
+class IndexMaxPQ(BinaryHeap):
+    """
+    An indexed priority queue (max-heap): every key has a priority that can be changed or removed.
+
+    The heap holds the keys, and their priorities in the array that BinaryHeap keeps
+    parallel to its values for the cached sort keys. A map from each key to its position
+    in the heap lets change_key and delete find the key without a search. The heap order
+    is restored with the _swim and _sink_hole of BinaryHeap, which write every key they
+    move through _place, so overriding _place keeps the positions up to date.
+
+    Performance:
+        insert(), change_key(), delete(), del_max(): O(log N)
+        contains(), priority(), peek_max(): O(1)
+        Space complexity: O(N)
+
+    Methods:
+        change_key(key, priority): Changes the priority of a key.
+        contains(key): Checks if a key is in the priority queue.
+        del_max(): Removes the key with the maximum priority and returns it.
+        delete(key): Removes a key and returns its priority.
+        insert(key, priority): Inserts a key with a priority.
+        peek_max(): Returns the key with the maximum priority.
+        pop_many(k): Removes the k keys with the largest priorities and returns them.
+        priority(key): Returns the priority of a key.
+        push_many(items): Inserts all the (key, priority) pairs of an iterable.
+
+    Special Methods:
+        __contains__(key): Checks if a key is in the priority queue.
+        __iter__(): Returns an iterator over the keys, in heap order.
+        __len__(): Returns the number of keys in the priority queue.
+    """
+
+    def __init__(self: 'IndexMaxPQ') -> None:
+        """
+        Initializes an empty indexed priority queue.
+        """
+        super().__init__()
+        self._keys = [None]                 # Priority of each key, parallel to the keys
+        self._pos: Dict[Hashable, int] = {}  # Position of each key in the heap
+
+    def _place(self: 'IndexMaxPQ', i: int, value: Hashable, key: Any) -> None:
+        """
+        Writes a key and its priority at index i, and records its position.
+
+        Args:
+            i (int): The index to write to.
+            value (Hashable): The key.
+            key (Any): The priority of the key.
+        """
+        super()._place(i, value, key)
+        self._pos[value] = i
+
+    def _check_key(self: 'IndexMaxPQ', key: Hashable) -> None:
+        """
+        Checks that a key is in the priority queue.
+
+        Args:
+            key (Hashable): The key to check.
+
+        Raises:
+            ValueError: If the key is not in the priority queue.
+        """
+        if key not in self._pos:
+            raise ValueError("ValueError: Key is not in the priority queue.")
+
+    def insert(self: 'IndexMaxPQ', key: Hashable, priority: Any) -> None:
+        """
+        Inserts a key with a priority.
+
+        Args:
+            key (Hashable): The key to be inserted.
+            priority (Any): The priority of the key.
+
+        Raises:
+            ValueError: If the key or the priority is None.
+            ValueError: If the key is already in the priority queue.
+        """
+        if key is None or priority is None:
+            raise ValueError("ValueError: Invalid value.")
+
+        if key in self._pos:
+            raise ValueError("ValueError: Key is already in the priority queue.")
+
+        self._list.append(key)
+        self._keys.append(priority)
+        self._n += 1
+        self._pos[key] = self._n
+        self._swim(self._n)
+
+    def push_many(self: 'IndexMaxPQ', items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Inserts all the (key, priority) pairs of an iterable, see BinaryHeap._heapify.
+        IndexMaxPQ.from_iterable(pairs) builds a priority queue from pairs in linear time.
+
+        Args:
+            items (Iterable[Tuple[Hashable, Any]]): The keys to be inserted, with their priorities.
+
+        Raises:
+            ValueError: If a key or a priority is None, then no key is inserted.
+            ValueError: If a key is repeated or already in the priority queue, then no key is inserted.
+        """
+        items = list(items)
+        if any(key is None or priority is None for key, priority in items):
+            raise ValueError("ValueError: Invalid value.")
+
+        keys = [key for key, _ in items]
+        if len(set(keys)) < len(keys) or any(key in self._pos for key in keys):
+            raise ValueError("ValueError: Key is already in the priority queue.")
+
+        start = self._n
+        self._list.extend(keys)
+        self._keys.extend(priority for _, priority in items)
+        self._n += len(keys)
+        self._pos.update((key, start + 1 + i) for i, key in enumerate(keys))
+        self._heapify(start)
+
+    def change_key(self: 'IndexMaxPQ', key: Hashable, priority: Any) -> None:
+        """
+        Changes the priority of a key, it moves up or down the heap as needed.
+
+        Args:
+            key (Hashable): The key to be updated.
+            priority (Any): The new priority of the key.
+
+        Raises:
+            ValueError: If the priority is None.
+            ValueError: If the key is not in the priority queue.
+        """
+        if priority is None:
+            raise ValueError("ValueError: Invalid value.")
+
+        self._check_key(key)
+
+        self._keys[self._pos[key]] = priority
+        self._swim(self._pos[key])
+        self._sink(self._pos[key])
+
+    def delete(self: 'IndexMaxPQ', key: Hashable) -> Any:
+        """
+        Removes a key and returns its priority.
+
+        Args:
+            key (Hashable): The key to be removed.
+
+        Returns:
+            Any: The priority of the removed key.
+
+        Raises:
+            ValueError: If the key is not in the priority queue.
+        """
+        self._check_key(key)
+
+        # Move the last key into the hole, then restore the heap order around it
+        k = self._pos.pop(key)
+        priority = self._keys[k]
+        last, last_priority = self._pop_last()
+
+        if k <= self._n:
+            self._place(k, last, last_priority)
+            self._swim(k)
+            self._sink(k)
+
+        return priority
+
+    def del_max(self: 'IndexMaxPQ') -> Hashable:
+        """
+        Removes the key with the maximum priority and returns it.
+
+        Returns:
+            Hashable: The key with the maximum priority.
+
+        Raises:
+            HeapEmptyError: If the priority queue is empty.
+        """
+        key = self.peek_max()
+        self.delete(key)
+        return key
+
+    def pop_many(self: 'IndexMaxPQ', k: int) -> List[Hashable]:
+        """
+        Removes the k keys with the largest priorities and returns them, see BinaryHeap.pop_many.
+
+        Args:
+            k (int): The number of keys to remove.
+
+        Returns:
+            List[Hashable]: The keys in descending order of priority, ascending for an IndexMinPQ.
+
+        Raises:
+            ValueError: If k is not between 0 and the number of keys in the priority queue.
+        """
+        # The positions of the remaining keys are kept by _place, drop the removed ones
+        keys = super().pop_many(k)
+        for key in keys:
+            del self._pos[key]
+        return keys
+
+    def contains(self: 'IndexMaxPQ', key: Hashable) -> bool:
+        """
+        Checks if a key is in the priority queue.
+
+        Args:
+            key (Hashable): The key to check.
+
+        Returns:
+            bool: True if the key is in the priority queue.
+        """
+        return key in self._pos
+
+    def priority(self: 'IndexMaxPQ', key: Hashable) -> Any:
+        """
+        Returns the priority of a key.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            Any: The priority of the key.
+
+        Raises:
+            ValueError: If the key is not in the priority queue.
+        """
+        self._check_key(key)
+        return self._keys[self._pos[key]]
+
+    def __contains__(self: 'IndexMaxPQ', key: Hashable) -> bool:
+        """
+        Checks if a key is in the priority queue.
+
+        Args:
+            key (Hashable): The key to check.
+
+        Returns:
+            bool: True if the key is in the priority queue.
+        """
+        return key in self._pos
+
+
+class IndexMinPQ(IndexMaxPQ):
+    """
+    An indexed priority queue (min-heap): every key has a priority that can be changed or removed.
+
+    Methods:
+        del_min(): Removes the key with the minimum priority and returns it.
+        peek_min(): Returns the key with the minimum priority.
+
+    Note:
+        The other methods are those of IndexMaxPQ. The inherited del_max and peek_max
+        act on the top of the heap, that is the key with the minimum priority.
+    """
+
+    def __init__(self: 'IndexMinPQ') -> None:
+        """
+        Initializes an empty indexed priority queue.
+        """
+        super().__init__()
+        self._reverse = True
+
+    def del_min(self: 'IndexMinPQ') -> Hashable:
+        """
+        Removes the key with the minimum priority and returns it.
+
+        Returns:
+            Hashable: The key with the minimum priority.
+
+        Raises:
+            HeapEmptyError: If the priority queue is empty.
+        """
+        return self.del_max()
+
+    def peek_min(self: 'IndexMinPQ') -> Hashable:
+        """
+        Returns the key with the minimum priority.
+
+        Returns:
+            Hashable: The key with the minimum priority.
+
+        Raises:
+            HeapEmptyError: If the priority queue is empty.
+        """
+        return self.peek_max()
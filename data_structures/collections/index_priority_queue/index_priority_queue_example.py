@@ -0,0 +1,32 @@
+from data_structures import IndexMinPQ
+
+
+def demo():
+    """
+    Example usage of the indexed priority queue (min-heap)
+    """
+    pq = IndexMinPQ()
+
+    # Insert jobs with their priorities
+    pq.insert("backup", 30)
+    pq.insert("email", 10)
+    pq.insert("report", 20)
+    pq.insert("cleanup", 40)
+
+    print("Next job:", pq.peek_min())  # Output: email
+
+    # Change the priority of a job instead of inserting a duplicate
+    pq.change_key("cleanup", 5)
+    print("Next job after changing the priority of cleanup:", pq.peek_min())  # Output: cleanup
+
+    # Cancel a job
+    print("Priority of the cancelled job:", pq.delete("report"))  # Output: 20
+    print("Is report still queued?", pq.contains("report"))  # Output: False
+
+    # Run the jobs in order
+    while len(pq) > 0:
+        print("Running:", pq.del_min())
+
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,145 @@
+import unittest
+import random
+from data_structures import BinaryHeap, IndexMaxPQ, IndexMinPQ
+
+
+class TestIndexMaxPQ(unittest.TestCase):
+    def assertHeapOrdered(self, pq):
+        for k in range(2, len(pq) + 1):
+            self.assertFalse(pq.priority(pq._list[k // 2]) < pq.priority(pq._list[k]))
+        for key, k in pq._pos.items():
+            self.assertEqual(pq._list[k], key)
+
+    def test_insert(self):
+        pq = IndexMaxPQ()
+        pq.insert("a", 5)
+        pq.insert("b", 10)
+        self.assertEqual(len(pq), 2)
+        self.assertEqual(pq.peek_max(), "b")
+        self.assertEqual(pq.priority("a"), 5)
+
+    def test_del_max(self):
+        pq = IndexMaxPQ()
+        for key, priority in [("a", 3), ("b", 7), ("c", 1), ("d", 5)]:
+            pq.insert(key, priority)
+        self.assertEqual([pq.del_max() for _ in range(4)], ["b", "d", "a", "c"])
+
+    def test_change_key(self):
+        pq = IndexMaxPQ()
+        for key, priority in [("a", 3), ("b", 7), ("c", 1)]:
+            pq.insert(key, priority)
+        pq.change_key("c", 10)
+        self.assertEqual(pq.peek_max(), "c")
+        pq.change_key("c", 0)
+        self.assertEqual(pq.peek_max(), "b")
+        self.assertHeapOrdered(pq)
+
+    def test_delete(self):
+        pq = IndexMaxPQ()
+        for key, priority in [("a", 3), ("b", 7), ("c", 1), ("d", 5)]:
+            pq.insert(key, priority)
+        self.assertEqual(pq.delete("b"), 7)
+        self.assertEqual(pq.delete("c"), 1)
+        self.assertFalse(pq.contains("b"))
+        self.assertNotIn("c", pq)
+        self.assertEqual([pq.del_max() for _ in range(2)], ["d", "a"])
+
+    def test_random_operations(self):
+        pq = IndexMaxPQ()
+        priorities = {}
+        for _ in range(2000):
+            key = random.randrange(100)
+            op = random.random()
+            if key not in priorities:
+                priorities[key] = random.random()
+                pq.insert(key, priorities[key])
+            elif op < 0.5:
+                priorities[key] = random.random()
+                pq.change_key(key, priorities[key])
+            else:
+                self.assertEqual(pq.delete(key), priorities.pop(key))
+        self.assertHeapOrdered(pq)
+        self.assertEqual(len(pq), len(priorities))
+        expected = sorted(priorities, key=priorities.get, reverse=True)
+        self.assertEqual([pq.del_max() for _ in range(len(pq))], expected)
+
+    def test_from_iterable(self):
+        priorities = {key: random.random() for key in range(500)}
+        pq = IndexMaxPQ.from_iterable(priorities.items())
+        self.assertHeapOrdered(pq)
+        pq.push_many([(key, random.random()) for key in range(500, 520)])
+        self.assertHeapOrdered(pq)
+        pq.change_key(7, 2.0)
+        self.assertEqual(pq.pop_many(1), [7])
+        self.assertEqual(len(pq), 519)
+
+    def test_pop_many(self):
+        priorities = {key: random.randint(0, 50) for key in range(300)}
+        pq = IndexMaxPQ.from_iterable(priorities.items())
+        popped = pq.pop_many(100)
+        self.assertHeapOrdered(pq)
+        self.assertTrue(all(key not in pq for key in popped))
+        self.assertEqual([priorities[key] for key in popped], sorted(priorities.values(), reverse=True)[:100])
+        remaining = [key for key in priorities if key not in popped]
+        pq.change_key(remaining[0], 1000)
+        self.assertEqual(pq.peek_max(), remaining[0])
+        self.assertEqual(len(pq.pop_many(200)), 200)
+        self.assertEqual(len(pq), 0)
+
+    def test_push_many_invalid(self):
+        pq = IndexMaxPQ()
+        pq.insert("a", 1)
+        with self.assertRaises(ValueError):
+            pq.push_many([("b", 2), ("a", 3)])
+        with self.assertRaises(ValueError):
+            pq.push_many([("b", 2), ("b", 3)])
+        with self.assertRaises(ValueError):
+            pq.push_many([("b", None)])
+        self.assertEqual(len(pq), 1)
+
+    def test_invalid(self):
+        pq = IndexMaxPQ()
+        pq.insert("a", 1)
+        with self.assertRaises(ValueError):
+            pq.insert("a", 2)
+        with self.assertRaises(ValueError):
+            pq.insert("b", None)
+        with self.assertRaises(ValueError):
+            pq.change_key("b", 1)
+        with self.assertRaises(ValueError):
+            pq.delete("b")
+
+    def test_empty(self):
+        pq = IndexMaxPQ()
+        with self.assertRaises(BinaryHeap.HeapEmptyError):
+            pq.del_max()
+        with self.assertRaises(BinaryHeap.HeapEmptyError):
+            pq.peek_max()
+
+
+class TestIndexMinPQ(unittest.TestCase):
+    def test_del_min(self):
+        pq = IndexMinPQ()
+        for key, priority in [("a", 3), ("b", 7), ("c", 1), ("d", 5)]:
+            pq.insert(key, priority)
+        self.assertEqual(pq.peek_min(), "c")
+        self.assertEqual([pq.del_min() for _ in range(4)], ["c", "a", "d", "b"])
+
+    def test_pop_many(self):
+        pq = IndexMinPQ.from_iterable([("a", 3), ("b", 7), ("c", 1), ("d", 5)])
+        self.assertEqual(pq.pop_many(2), ["c", "a"])
+        pq.insert("e", 4)
+        self.assertEqual(pq.pop_many(3), ["e", "d", "b"])
+
+    def test_change_key(self):
+        pq = IndexMinPQ()
+        for key, priority in [("a", 3), ("b", 7), ("c", 1)]:
+            pq.insert(key, priority)
+        pq.change_key("b", 0)
+        self.assertEqual(pq.peek_min(), "b")
+        pq.change_key("b", 9)
+        self.assertEqual([pq.del_min() for _ in range(3)], ["c", "a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
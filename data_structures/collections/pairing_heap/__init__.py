@@ -0,0 +1 @@
+from .pairing_heap import PairingHeap
\ No newline at end of file
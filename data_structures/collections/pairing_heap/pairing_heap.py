@@ -0,0 +1,236 @@
+from typing import Any, Callable, Iterator, Optional
+from data_structures.collections.binary_heap.binary_heap import BinaryHeap
+
+
+class PairingHeap:
+    """
+    A meldable heap (max-heap or min-heap), implemented as a pairing heap.
+
+    The heap is a tree in which every node comes before its children, each node keeps
+    a link to its first child and to its next sibling. Two heaps are melded by making
+    the root that comes after a child of the other one, insert is a meld with a
+    single-node heap. del_max removes the root and pairs up its children left to
+    right, then melds the pairs right to left (the two-pass method).
+
+    It has the insert, del_max and peek_max interface of BinaryHeap, with the same
+    order and key options, so it can replace it where heaps have to be merged.
+
+    Performance:
+        insert(), meld(), peek_max(): O(1)
+        del_max(): O(log N) amortized
+        Space complexity: O(N)
+
+    Methods:
+        del_max(): Removes and returns the maximum value from the heap.
+        insert(new_value): Inserts a new value into the heap.
+        meld(other): Moves all the values of another heap into this one.
+        peek_max(): Returns the maximum value from the heap.
+
+    Special Methods:
+        __iter__(): Returns an iterator over the heap's elements, in no particular order.
+        __len__(): Returns the number of items in the heap.
+        __repr__(): Returns a string representation of the heap.
+    """
+
+    # The same exception as BinaryHeap, so either heap can be caught with one except clause
+    HeapEmptyError = BinaryHeap.HeapEmptyError
+
+    class Node:
+        """
+        Represents a node of the heap.
+
+        Attributes:
+            val (Any): The value stored in the node.
+            key (Any): The comparison key of the value, computed once.
+            child (Optional[Node]): Reference to the first child.
+            sibling (Optional[Node]): Reference to the next sibling.
+        """
+        __slots__ = ('val', 'key', 'child', 'sibling')
+
+        def __init__(self: 'Node', val: Any, key: Any) -> None:
+            """
+            Initializes a Node.
+
+            Args:
+                val (Any): The value stored in the node.
+                key (Any): The comparison key of the value.
+            """
+            self.val = val
+            self.key = key
+            self.child: Optional['PairingHeap.Node'] = None
+            self.sibling: Optional['PairingHeap.Node'] = None
+
+    def __init__(self: 'PairingHeap', order: str = "max", key: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        Initializes an empty pairing heap.
+
+        Args:
+            order (str): 'max' for a max-heap, 'min' for a min-heap.
+            key (Optional[Callable[[Any], Any]]): Function that extracts the comparison key from each value.
+
+        Raises:
+            ValueError: If the order is not 'max' or 'min'.
+        """
+        if order not in ("max", "min"):
+            raise ValueError("ValueError: Order must be 'max' or 'min'.")
+
+        self._root: Optional[PairingHeap.Node] = None
+        self._n: int = 0
+        self._key: Optional[Callable[[Any], Any]] = key
+        self._reverse: bool = order == "min"
+
+    def _link(self: 'PairingHeap', a: 'Node', b: 'Node') -> 'Node':
+        """
+        Links two trees, the root that comes after becomes the first child of the other one.
+
+        Args:
+            a (Node): The root of the first tree.
+            b (Node): The root of the second tree.
+
+        Returns:
+            Node: The root of the linked tree.
+        """
+        if (b.key < a.key) if self._reverse else (a.key < b.key):
+            a, b = b, a
+
+        b.sibling = a.child
+        a.child = b
+        return a
+
+    def _merge_pairs(self: 'PairingHeap', first: Optional['Node']) -> Optional['Node']:
+        """
+        Melds a list of siblings into a single tree with the two-pass method.
+
+        Args:
+            first (Optional[Node]): The first sibling.
+
+        Returns:
+            Optional[Node]: The root of the tree, None if there are no siblings.
+        """
+        # First pass: link the siblings in pairs, left to right
+        pairs = []
+        while first is not None:
+            second = first.sibling
+            if second is None:
+                first.sibling = None
+                pairs.append(first)
+                break
+
+            rest = second.sibling
+            first.sibling = second.sibling = None
+            pairs.append(self._link(first, second))
+            first = rest
+
+        # Second pass: meld the pairs, right to left
+        root = pairs.pop() if pairs else None
+        while pairs:
+            root = self._link(pairs.pop(), root)
+
+        return root
+
+    def insert(self: 'PairingHeap', new_value: Any) -> None:
+        """
+        Inserts a new value into the heap.
+
+        Args:
+            new_value (Any): The value to be inserted into the heap.
+
+        Raises:
+            ValueError: If the value is None.
+        """
+        if new_value is None:
+            raise ValueError("ValueError: Invalid value.")
+
+        node = self.Node(new_value, new_value if self._key is None else self._key(new_value))
+        self._root = node if self._root is None else self._link(self._root, node)
+        self._n += 1
+
+    def meld(self: 'PairingHeap', other: 'PairingHeap') -> None:
+        """
+        Moves all the values of another heap into this one, in constant time.
+
+        Args:
+            other (PairingHeap): The heap to be melded into this one, it is left empty.
+
+        Raises:
+            ValueError: If the other heap has a different order or key.
+        """
+        if other._reverse != self._reverse or other._key is not self._key:
+            raise ValueError("ValueError: Only heaps with the same order and key can be melded.")
+
+        if other is self or other._root is None:
+            return
+
+        self._root = other._root if self._root is None else self._link(self._root, other._root)
+        self._n += other._n
+
+        other._root = None
+        other._n = 0
+
+    def del_max(self: 'PairingHeap') -> Any:
+        """
+        Removes and returns the maximum value from the heap.
+
+        Returns:
+            val(Any): The maximum value from the heap, the minimum for a min-heap.
+
+        Raises:
+            HeapEmptyError: If the heap is empty.
+        """
+        if self._root is None:
+            raise self.HeapEmptyError()
+
+        root = self._root
+        self._root = self._merge_pairs(root.child)
+        self._n -= 1
+        return root.val
+
+    def peek_max(self: 'PairingHeap') -> Any:
+        """
+        Returns the maximum value from the heap.
+
+        Returns:
+            val(Any): The maximum value from the heap, the minimum for a min-heap.
+
+        Raises:
+            HeapEmptyError: If the heap is empty.
+        """
+        if self._root is None:
+            raise self.HeapEmptyError()
+
+        return self._root.val
+
+    def __iter__(self: 'PairingHeap') -> Iterator[Any]:
+        """
+        Returns an iterator over the heap's elements, in no particular order.
+
+        Returns:
+            Iterator[Any]: Iterator over the heap's elements.
+        """
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.val
+
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+
+    def __len__(self: 'PairingHeap') -> int:
+        """
+        Returns the number of items in the heap.
+
+        Returns:
+            int: The number of items in the heap.
+        """
+        return self._n
+
+    def __repr__(self: 'PairingHeap') -> str:
+        """
+        Returns a string representation of the heap.
+
+        Returns:
+            str: The string representation of the heap, the root first.
+        """
+        return f"[{', '.join(map(repr, self))}]"
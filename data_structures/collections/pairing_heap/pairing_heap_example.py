@@ -0,0 +1,39 @@
+from data_structures import PairingHeap
+
+
+def demo():
+    """
+    Example usage of the pairing heap (max-heap)
+    """
+    heap = PairingHeap()
+
+    # Try to remove an element from an empty heap
+    try:
+        heap.del_max()
+
+    except Exception as e:
+        print("Try to remove an element from an empty heap:", e)
+
+    # Insert elements into the heap
+    for value in [10, 20, 5, 30, 15]:
+        heap.insert(value)
+
+    print("Heap after inserts:", heap)
+    print("Maximum element:", heap.peek_max())  # Output: 30
+
+    # Meld a second heap, for instance the queue of another worker
+    other = PairingHeap()
+    for value in [25, 40, 1]:
+        other.insert(value)
+
+    heap.meld(other)
+    print("Number of items after meld:", len(heap))  # Output: 8
+    print("Number of items left in the other heap:", len(other))  # Output: 0
+
+    # Delete the elements in order
+    while len(heap) > 0:
+        print("Deleted max element:", heap.del_max())
+
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,102 @@
+import unittest
+import random
+from data_structures import BinaryHeap, PairingHeap
+
+
+class TestPairingHeap(unittest.TestCase):
+    def test_insert(self):
+        heap = PairingHeap()
+        heap.insert(5)
+        heap.insert(10)
+        self.assertEqual(len(heap), 2)
+        self.assertEqual(str(heap), "[10, 5]")
+
+    def test_del_max(self):
+        heap = PairingHeap()
+        heap.insert(5)
+        heap.insert(10)
+        heap.insert(3)
+        self.assertEqual(heap.del_max(), 10)
+        self.assertEqual(heap.peek_max(), 5)
+        self.assertEqual(len(heap), 2)
+
+    def test_random(self):
+        data = [random.randint(0, 1000) for _ in range(2000)]
+        heap = PairingHeap()
+        for x in data:
+            heap.insert(x)
+        self.assertEqual(sorted(heap), sorted(data))
+        self.assertEqual([heap.del_max() for _ in range(2000)], sorted(data, reverse=True))
+
+    def test_interleaved(self):
+        heap = PairingHeap(order="min")
+        expected = []
+        for _ in range(3000):
+            if expected and random.random() < 0.4:
+                expected.sort()
+                self.assertEqual(heap.del_max(), expected.pop(0))
+            else:
+                x = random.random()
+                expected.append(x)
+                heap.insert(x)
+        self.assertEqual(len(heap), len(expected))
+
+    def test_meld(self):
+        a, b = PairingHeap(), PairingHeap()
+        left = [random.randint(0, 100) for _ in range(300)]
+        right = [random.randint(0, 100) for _ in range(200)]
+        for x in left:
+            a.insert(x)
+        for x in right:
+            b.insert(x)
+        a.meld(b)
+        self.assertEqual(len(a), 500)
+        self.assertEqual(len(b), 0)
+        self.assertEqual([a.del_max() for _ in range(500)], sorted(left + right, reverse=True))
+
+    def test_meld_empty(self):
+        a, b = PairingHeap(), PairingHeap()
+        a.meld(b)
+        self.assertEqual(len(a), 0)
+        b.insert(1)
+        a.meld(b)
+        self.assertEqual(a.peek_max(), 1)
+        a.meld(a)
+        self.assertEqual(len(a), 1)
+
+    def test_meld_invalid(self):
+        with self.assertRaises(ValueError):
+            PairingHeap().meld(PairingHeap(order="min"))
+
+    def test_key(self):
+        heap = PairingHeap(order="min", key=len)
+        for word in ["banana", "fig", "apple", "kiwi"]:
+            heap.insert(word)
+        self.assertEqual([heap.del_max() for _ in range(4)], ["fig", "kiwi", "apple", "banana"])
+
+    def test_empty(self):
+        heap = PairingHeap()
+        with self.assertRaises(PairingHeap.HeapEmptyError):
+            heap.del_max()
+        with self.assertRaises(PairingHeap.HeapEmptyError):
+            heap.peek_max()
+
+    def test_empty_binary_heap_error(self):
+        heap = PairingHeap(order="min")
+        with self.assertRaises(BinaryHeap.HeapEmptyError):
+            heap.del_max()
+        with self.assertRaises(BinaryHeap.HeapEmptyError):
+            heap.peek_max()
+
+    def test_none_insert(self):
+        heap = PairingHeap()
+        with self.assertRaises(ValueError):
+            heap.insert(None)
+
+    def test_invalid_order(self):
+        with self.assertRaises(ValueError):
+            PairingHeap(order="ascending")
+
+
+if __name__ == "__main__":
+    unittest.main()